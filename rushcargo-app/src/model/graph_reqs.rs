@@ -1,5 +1,4 @@
 use std::sync::{Arc, Mutex};
-use sqlx::{Row, postgres::PgPool};
 use anyhow::Result;
 use serde::Deserialize;
 use url::Url;
@@ -26,8 +25,26 @@ struct GraphResponse {
     nodes: Vec<WarehouseNode>,    
 }
 
+/// Route endpoint as accepted by the graph server. Lockers and branches are
+/// resolved to their warehouse by the server itself.
+enum RouteEndpoint {
+    Warehouse(i32),
+    Locker(i64),
+    Branch(i32),
+}
+
+impl RouteEndpoint {
+    fn query_pair(&self, endpoint: &str) -> (String, String) {
+        match self {
+            Self::Warehouse(id) => (format!("{}Id", endpoint), id.to_string()),
+            Self::Locker(id) => (format!("{}Locker", endpoint), id.to_string()),
+            Self::Branch(id) => (format!("{}Branch", endpoint), id.to_string()),
+        }
+    }
+}
+
 impl App {
-    pub async fn get_shortest_warehouse_path(&mut self, pool: &PgPool) -> Result<()> {
+    pub async fn get_shortest_warehouse_path(&mut self) -> Result<()> {
         let (warehouse_to, warehouse_from, add_dist_from, add_dist_to) =
         match &mut self.user {
             Some(User::PkgAdmin(pkgadmin_data)) => {
@@ -39,8 +56,8 @@ impl App {
                             ShippingGuideType::InpersonBranch => {
                                 let branch_to = shipping.branch.as_ref().unwrap();
                                 (
-                                    branch_to.warehouse.get_id(),
-                                    pkgadmin_data.info.branch.warehouse.get_id(),
+                                    RouteEndpoint::Warehouse(branch_to.warehouse.get_id()),
+                                    RouteEndpoint::Warehouse(pkgadmin_data.info.branch.warehouse.get_id()),
                                     pkgadmin_data.info.branch.route_distance,
                                     branch_to.route_distance,
                                 )
@@ -48,8 +65,8 @@ impl App {
                             ShippingGuideType::InpersonLocker => {
                                 let locker_to = shipping.locker.as_ref().unwrap();
                                 (
-                                    locker_to.warehouse.get_id(),
-                                    pkgadmin_data.info.branch.warehouse.get_id(),
+                                    RouteEndpoint::Warehouse(locker_to.warehouse.get_id()),
+                                    RouteEndpoint::Warehouse(pkgadmin_data.info.branch.warehouse.get_id()),
                                     pkgadmin_data.info.branch.route_distance,
                                     0,
                                 ) 
@@ -60,44 +77,19 @@ impl App {
                     Screen::PkgAdmin(SubScreen::PkgAdminGuideInfo) => {
                         let guide = pkgadmin_data.shipping_guides.as_ref().unwrap().active_guide.as_ref().unwrap();
 
-                        let warehouse_from =
-                            sqlx::query(
-                                "
-                                    SELECT * FROM shippings.lockers WHERE locker_id=$1
-                                "
-                            )
-                            .bind(guide.locker_sender.unwrap())
-                            .fetch_one(pool)
-                            .await?
-                            .try_get::<i32, _>("warehouse")?;
+                        let warehouse_from = RouteEndpoint::Locker(guide.locker_sender.unwrap());
 
                         let warehouse_to =
                             match guide.shipping_type {
                                 ShippingGuideType::LockerBranch =>
-                                    sqlx::query(
-                                        "
-                                            SELECT * FROM locations.branches WHERE branch_id=$1
-                                        "
-                                    )
-                                    .bind(guide.branch_receiver.unwrap())
-                                    .fetch_one(pool)
-                                    .await?
-                                    .try_get::<i32, _>("warehouse_id")?,
+                                    RouteEndpoint::Branch(guide.branch_receiver.unwrap()),
                                 ShippingGuideType::LockerLocker =>
-                                    sqlx::query(
-                                        "
-                                            SELECT * FROM shippings.lockers WHERE locker_id=$1
-                                        "
-                                    )
-                                    .bind(guide.locker_receiver.unwrap())
-                                    .fetch_one(pool)
-                                    .await?
-                                    .try_get::<i32, _>("warehouse")?,
+                                    RouteEndpoint::Locker(guide.locker_receiver.unwrap()),
                                 _ => unimplemented!()
                             };
-                        
+
                         (warehouse_to, warehouse_from, 0, 0)
-                   }
+                    }
                     _ => unimplemented!()
                 }
             }
@@ -107,8 +99,8 @@ impl App {
                     ShippingGuideType::LockerBranch => {
                         let branch = shipping.branch.as_ref().unwrap();
                         (
-                            branch.warehouse.get_id(),
-                            client_data.active_locker.as_ref().unwrap().warehouse.get_id(),
+                            RouteEndpoint::Warehouse(branch.warehouse.get_id()),
+                            RouteEndpoint::Warehouse(client_data.active_locker.as_ref().unwrap().warehouse.get_id()),
                             0,
                             branch.route_distance,
                         )
@@ -116,8 +108,8 @@ impl App {
                     ShippingGuideType::LockerLocker => {
                         let locker = shipping.locker.as_ref().unwrap();
                         (
-                            locker.warehouse.get_id(),
-                            client_data.active_locker.as_ref().unwrap().warehouse.get_id(),
+                            RouteEndpoint::Warehouse(locker.warehouse.get_id()),
+                            RouteEndpoint::Warehouse(client_data.active_locker.as_ref().unwrap().warehouse.get_id()),
                             0,
                             0,
                         )
@@ -174,12 +166,15 @@ impl App {
     }
 }
 
-async fn get_server_response(warehouse_from: i32, warehouse_to: i32) -> Result<reqwest::Response> {
+async fn get_server_response(warehouse_from: RouteEndpoint, warehouse_to: RouteEndpoint) -> Result<reqwest::Response> {
     let mut url = Url::parse(&GRAPH_URL.lock().unwrap()).expect("Invalid GRAPH_URL");
 
+    let (from_key, from_value) = warehouse_from.query_pair("from");
+    let (to_key, to_value) = warehouse_to.query_pair("to");
+
     url.query_pairs_mut()
-        .append_pair("fromId", &warehouse_from.to_string())
-        .append_pair("toId", &warehouse_to.to_string());
+        .append_pair(&from_key, &from_value)
+        .append_pair(&to_key, &to_value);
 
     let client = Client::new();
     Ok(client.get(url).send().await?)
@@ -107,7 +107,7 @@ pub async fn update(app: &mut Arc<Mutex<App>>, pool: &PgPool, event: Event) -> R
                 let active_screen = app_lock.active_screen.clone();
 
                 if let Screen::PkgAdmin(SubScreen::PkgAdminGuideInfo) = app_lock.active_screen {
-                    app_lock.get_shortest_warehouse_path(pool).await?
+                    app_lock.get_shortest_warehouse_path().await?
                 }
 
                 let (verification, route) =
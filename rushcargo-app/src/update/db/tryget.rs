@@ -111,7 +111,7 @@ pub async fn update(app: &mut Arc<Mutex<App>>, pool: &PgPool, event: Event) -> R
                                     }
                                 );
                             }
-                            app_lock.get_shortest_warehouse_path(pool).await?;
+                            app_lock.get_shortest_warehouse_path().await?;
 
                             let client_data = app_lock.get_client_mut();
 
@@ -194,7 +194,7 @@ pub async fn update(app: &mut Arc<Mutex<App>>, pool: &PgPool, event: Event) -> R
                                 }
                             }
 
-                            app_lock.get_shortest_warehouse_path(pool).await?;
+                            app_lock.get_shortest_warehouse_path().await?;
 
                             let package = app_lock.get_pkgadmin_mut().add_package.as_mut().unwrap();
                             package.payment = {
@@ -273,7 +273,7 @@ pub async fn update(app: &mut Arc<Mutex<App>>, pool: &PgPool, event: Event) -> R
                                 );
                             }
                             
-                            app_lock.get_shortest_warehouse_path(pool).await?;
+                            app_lock.get_shortest_warehouse_path().await?;
                             
                             let client_data = app_lock.get_client_mut();
                             let packages_weight =
@@ -322,7 +322,7 @@ pub async fn update(app: &mut Arc<Mutex<App>>, pool: &PgPool, event: Event) -> R
                                 }
                             }
 
-                            app_lock.get_shortest_warehouse_path(pool).await?;
+                            app_lock.get_shortest_warehouse_path().await?;
 
                             let package = app_lock.get_pkgadmin_mut().add_package.as_mut().unwrap();
                             package.payment = {
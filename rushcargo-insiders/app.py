@@ -2,27 +2,63 @@ import asyncio
 import time
 import threading
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
 from lib.graph.warehouses import RushWGraph, rushWGraph
 
+from lib.model.constants import APOOL_HEALTH_TIMEOUT
 from lib.model.database import initAsyncPool, AsyncPool
 
 app = Flask("RushCargo")
 
-# Initialize Database
+# Initialize Database. The Connection Pool is Opened Lazily, when the First Connection is Requested
 apool, _, port, _ = initAsyncPool()
 
-# Open Remote Database Connection Pool
-asyncio.run(apool.openPool())
+# Event Loop where the Connection Pool is Used. It Runs in its Own Thread, so the Graph Startup and Updates Share the Same Pool Workers
+loop = asyncio.new_event_loop()
+threading.Thread(target=loop.run_forever, daemon=True, name="rushwgraph-loop").start()
 
 # Initialize RushWGraph Class
-rushWGraph = asyncio.run(RushWGraph.createFromApp(apool, False))
+rushWGraph = asyncio.run_coroutine_threadsafe(
+    RushWGraph.createFromApp(apool, False), loop
+).result()
 
 # Time to Wait between Graphs Updates
 UPDATE_TIME = 60
 WAIT_BUSY_TIME = 0.05
 
+# Extra Seconds to Wait for the Health Check, in case the Event Loop is Busy
+HEALTH_EXTRA_TIME = 1.0
+
+
+def getWarehouseNodeId(endpoint: str) -> int | None:
+    """
+    Function to Get the Warehouse Node ID of a Route Endpoint from the Request Arguments. The Endpoint can be Given as a Warehouse (``<endpoint>Id``), a Locker (``<endpoint>Locker``) or a Branch (``<endpoint>Branch``) ID
+
+    :param str endpoint: Route Endpoint Arguments Prefix (``from`` or ``to``)
+    :return: Warehouse Node ID. ``None`` if the Locker or Branch wasn't Found
+    :rtype: int if the Endpoint was Found. Otherwise, NoneType
+    :raises ValueError: Raised when None of the Endpoint Arguments were Given, or its Value is not an Integer
+    """
+
+    warehouseId = request.args.get(f"{endpoint}Id")
+    lockerId = request.args.get(f"{endpoint}Locker")
+    branchId = request.args.get(f"{endpoint}Branch")
+
+    # Warehouse ID
+    if warehouseId is not None:
+        return int(warehouseId)
+
+    # Get the Warehouse ID where the Locker is Located
+    elif lockerId is not None:
+        return rushWGraph.getLockerWarehouseId(int(lockerId))
+
+    # Get the Warehouse ID that's Connected with the Branch
+    elif branchId is not None:
+        return rushWGraph.getBranchWarehouseId(int(branchId))
+
+    raise ValueError(f"Missing '{endpoint}' Route Endpoint")
+
 
 @app.route("/graph-calc/<building_type>")
 def graph_calc(building_type: str):
@@ -34,10 +70,14 @@ def graph_calc(building_type: str):
 
     # Check 'building_type' Parameter
     if building_type == "warehouses":
+        # Wait Until the Graph is Available
+        while rushWGraph.isBusy():
+            time.sleep(WAIT_BUSY_TIME)
+
         # Get Request Arguments
         try:
-            warehouseFromId = request.args.get("fromId")
-            warehouseToId = request.args.get("toId")
+            warehouseFromId = getWarehouseNodeId("from")
+            warehouseToId = getWarehouseNodeId("to")
 
         # Bad Route Request
         except:
@@ -46,22 +86,19 @@ def graph_calc(building_type: str):
                 400,
             )
 
+        # Check if the Lockers or Branches were Found
+        if warehouseFromId is None or warehouseToId is None:
+            return "Bad Warehouse Route Request. Locker or Branch not Found", 404
+
         # Check if the Nodes can be Found
         try:
-            # Wait Until the Graph is Available
-            while rushWGraph.isBusy():
-                time.sleep(WAIT_BUSY_TIME)
-
             # Check if there's a Path between the Warehouses
             if rushWGraph.hasPath(warehouseFromId, warehouseToId):
-                # Get Shortest Route
-                nodes, routeDistance = rushWGraph.getShortest(
-                    warehouseFromId, warehouseToId
-                )
+                # Get Shortest Route as a JSON Response Body
+                routeJson = rushWGraph.getShortestJson(warehouseFromId, warehouseToId)
 
                 # Return JSON with Route
-
-                return (jsonify({"nodes": nodes, "distance": routeDistance}), 200)
+                return Response(routeJson, 200, mimetype="application/json")
 
             # Route not Found
             else:
@@ -78,6 +115,41 @@ def graph_calc(building_type: str):
         )
 
 
+@app.route("/health")
+def health():
+    """
+    GET Method to Probe the Graph Service Health. Runs a Query through the Remote Database Connection Pool, and Returns the Pool Statistics
+
+    Responds with ``503`` if the Remote Database can't be Reached, or if the Connection Pool is Saturated
+    """
+
+    # Check the Remote Database at the Connection Pool Event Loop
+    future = asyncio.run_coroutine_threadsafe(apool.checkHealth(), loop)
+
+    try:
+        reachable = future.result(APOOL_HEALTH_TIMEOUT + HEALTH_EXTRA_TIME)
+
+    except Exception:
+        future.cancel()
+        reachable = False
+
+    stats = apool.getStats()
+    saturated = apool.isSaturated()
+    healthy = reachable and not saturated
+
+    return (
+        jsonify(
+            {
+                "healthy": healthy,
+                "database": reachable,
+                "graphBusy": rushWGraph.isBusy(),
+                "pool": stats,
+            }
+        ),
+        200 if healthy else 503,
+    )
+
+
 async def updateGraphs(apool: AsyncPool, updateTime: int) -> None:
     """
     Function to Update the Graphs
@@ -91,37 +163,26 @@ async def updateGraphs(apool: AsyncPool, updateTime: int) -> None:
 
         # Countdown
         while t1 > 0:
-            time.sleep(1)
+            await asyncio.sleep(1)
             t1 -= 1
 
-        # Update Graphs
-        await asyncio.gather(rushWGraph.update(apool, app.logger))
-
-
-def graphEventsHandler(apool: AsyncPool, updateTime: int) -> None:
-    """
-    Main Handler of the Warehouses Graph
-
-    :param AsyncPool apool: Asynchronous Connection Pool with the Remote Database
-    :param int updateTime: Interval of Time in Seconds between the Warehouses Graph Updates
-    """
+        # Skip the Update if the Connection Pool is Saturated, so Requests aren't Starved
+        if apool.isSaturated():
+            app.logger.warning(
+                f"Connection Pool is Saturated. Skipping Graph Update: {apool.getStats()}"
+            )
+            continue
 
-    # Graph Updater
-    asyncio.run(updateGraphs(apool, updateTime))
+        # Update Graphs
+        await rushWGraph.update(apool, app.logger)
 
 
-# Call the Update Function with Multithreading
-threadUpdate = threading.Thread(
-    target=graphEventsHandler,
-    args=(apool, UPDATE_TIME),
-    daemon=True,
-    name="update-rushwgraph",
-)
-threadUpdate.start()
+# Run the Graph Updater at the Connection Pool Event Loop
+asyncio.run_coroutine_threadsafe(updateGraphs(apool, UPDATE_TIME), loop)
 
 if __name__ == "__main__":
     # Initialize Flask Server
     app.run(port=port)
 
-    # Close Remote Database Connection Pool
-    # asyncio.run(apool.closePool())
+    # Close Remote Database Connection Pool at its Event Loop
+    asyncio.run_coroutine_threadsafe(apool.closePool(), loop).result()
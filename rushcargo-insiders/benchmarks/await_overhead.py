@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+# Number of Simulated Queries per Run
+NQUERIES = 100000
+
+# Number of Runs per Pattern
+NRUNS = 5
+
+
+class FakeCursor:
+    """
+    Fake Asynchronous Cursor that Completes its Queries Instantly, to Measure only the Event Loop Overhead
+    """
+
+    async def execute(self, query: str, params: list = None) -> None:
+        pass
+
+    async def fetchall(self) -> list:
+        return []
+
+
+async def taskPattern(acursor: FakeCursor) -> list:
+    """
+    Previous Pattern: each Query is Wrapped inside a Task and Awaited through ``asyncio.gather``
+    """
+
+    await asyncio.gather(acursor.execute("SELECT 1"))
+    fetchTask = asyncio.create_task(acursor.fetchall())
+    await asyncio.gather(fetchTask)
+    return fetchTask.result()
+
+
+async def awaitPattern(acursor: FakeCursor) -> list:
+    """
+    Current Pattern: each Query is Awaited Directly
+    """
+
+    await acursor.execute("SELECT 1")
+    return await acursor.fetchall()
+
+
+async def run(pattern) -> float:
+    """
+    Function to Measure the Time Taken by a Given Pattern
+
+    :param pattern: Coroutine Function to Benchmark
+    :return: Best Time in Seconds over ``NRUNS`` Runs
+    :rtype: float
+    """
+
+    acursor = FakeCursor()
+    best = None
+
+    for _ in range(NRUNS):
+        t0 = time.perf_counter()
+
+        for _ in range(NQUERIES):
+            await pattern(acursor)
+
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+async def main() -> None:
+    taskTime = await run(taskPattern)
+    awaitTime = await run(awaitPattern)
+
+    print(f"create_task + gather: {taskTime * 1e6 / NQUERIES:.2f} us/query")
+    print(f"direct await:         {awaitTime * 1e6 / NQUERIES:.2f} us/query")
+    print(f"speedup:              {taskTime / awaitTime:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+# Modules Imported at Startup by the CLI and the Graph Service
+MODULES = ["lib.controller.events", "lib.graph.warehouses"]
+
+# Heavy Modules that are only Loaded by the Commands that Need Them
+HEAVY_MODULES = ["matplotlib", "networkx", "scipy", "numpy", "geopy", "routingpy"]
+
+# Number of Runs per Module
+NRUNS = 5
+
+# Number of Slowest Imports to Print
+NTOP = 10
+
+# Path to 'rushcargo-insiders' Directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def importTime(module: str) -> tuple[int, list[tuple[int, str]]]:
+    """
+    Function to Import a Module in a New Interpreter with ``-X importtime``, and Parse its Report
+
+    :param str module: Module to Import
+    :return: Cumulative Import Time of the Module in Microseconds, and a List of the Cumulative Import Time and Name of Each Imported Module
+    :rtype: tuple
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        imports.append((int(cumulative), name.strip()))
+
+    # The Module Itself is the Last One Reported
+    return imports[-1][0], imports
+
+
+def run(module: str) -> None:
+    """
+    Function to Print the Best Import Time of a Given Module, its Slowest Imports, and which Heavy Modules were Loaded
+
+    :param str module: Module to Benchmark
+    """
+
+    best = bestImports = None
+
+    for _ in range(NRUNS):
+        total, imports = importTime(module)
+
+        if best is None or total < best:
+            best, bestImports = total, imports
+
+    print(f"{module}: {best / 1e3:.1f} ms")
+
+    for cumulative, name in sorted(bestImports, reverse=True)[1 : NTOP + 1]:
+        print(f"  {cumulative / 1e3:8.1f} ms  {name}")
+
+    loaded = {name for _, name in bestImports}
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    print(f"  heavy modules loaded: {', '.join(heavy) if heavy else 'none'}\n")
+
+
+if __name__ == "__main__":
+    for module in MODULES:
+        run(module)
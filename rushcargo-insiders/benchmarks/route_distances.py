@@ -0,0 +1,72 @@
+import asyncio
+import os
+import random
+import sys
+import time
+
+# Path to 'rushcargo-insiders' Directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.geocoding.constants import NOMINATIM_LATITUDE, NOMINATIM_LONGITUDE
+from lib.geocoding.distance import OfflineDistanceProvider
+
+# Number of Warehouses of Each Benchmarked Network
+SIZES = [100, 1000, 3000]
+
+# Number of Runs per Network Size
+NRUNS = 3
+
+# Bounding Box where the Warehouses are Placed, as Latitude and Longitude Ranges
+LATITUDES = (-55.0, 12.0)
+LONGITUDES = (-81.0, -34.0)
+
+# Seed Used to Place the Warehouses
+SEED = 0
+
+
+def getWarehouseCoords(n: int) -> list[dict]:
+    """
+    Function to Get the Coordinates of Some Random Warehouses
+
+    :param int n: Number of Warehouses
+    :return: List of Coordinates Dictionaries
+    :rtype: list
+    """
+
+    rng = random.Random(SEED)
+
+    return [
+        {
+            NOMINATIM_LATITUDE: rng.uniform(*LATITUDES),
+            NOMINATIM_LONGITUDE: rng.uniform(*LONGITUDES),
+        }
+        for _ in range(n)
+    ]
+
+
+def run(n: int) -> None:
+    """
+    Function to Print the Best Time to Estimate the Route Distances between All the Warehouses of a Network with the Offline Provider
+
+    :param int n: Number of Warehouses
+    """
+
+    provider = OfflineDistanceProvider()
+    coords = getWarehouseCoords(n)
+    best = None
+
+    for _ in range(NRUNS):
+        start = time.perf_counter()
+        asyncio.run(provider.getDrivingRouteDistances(coords, coords))
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    print(f"{n} warehouses ({n * n} pairs): {best * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    for n in SIZES:
+        run(n)
@@ -32,3 +32,10 @@ DICT_CITY_NAME_ID = getDictNameId("city")
 DICT_COUNTRY_ID = getDictId("country")
 DICT_REGION_ID = getDictId("region")
 DICT_CITY_ID = getDictId("city")
+
+# Number of Rows Normalized and Inserted inside a Single Transaction when Importing a File
+IMPORT_CHUNK_SIZE = 500
+
+# Supported Import File Extensions
+IMPORT_CSV_EXTENSION = ".csv"
+IMPORT_JSONL_EXTENSION = ".jsonl"
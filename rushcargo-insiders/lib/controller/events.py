@@ -5,6 +5,7 @@ from rich.prompt import Prompt
 from rich.logging import RichHandler
 
 from .constants import RICH_LOGGER_DEBUG_MODE
+from .importEvents import ImportEventHandler
 from .locationsEvents import LocationsEventHandler
 
 from ..io.arguments import getEventHandlerArguments
@@ -15,6 +16,7 @@ from ..model.database_tables import console
 
 from ..terminal.clear import clear
 from ..terminal.constants import END_MSG, PRESS_ENTER
+from ..terminal.prompt import offloadPrompt
 
 # Get Rich Logger
 if RICH_LOGGER_DEBUG_MODE:
@@ -35,6 +37,12 @@ class EventHandler:
     # Remote Database Asynchronous Connection Pool
     __apool = None
 
+    # Remote Database Role Name
+    __user = None
+
+    # Event Loop Shared by All the Commands of the Session
+    __loop = None
+
     # Event Handlers
     __locationsEventHandler = None
 
@@ -50,9 +58,80 @@ class EventHandler:
         # Store Remote Database Asynchronous Connection Pool
         self.__apool = apool
 
+        # Store Remote Database Role Name
+        self.__user = user
+
+        # Initialize the Session Event Loop. The Connection Pool is Bound to It, so Its Connections are Reused across Commands
+        self.__loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.__loop)
+
         # Initialize Location Event Handler
         self.__locationsEventHandler = LocationsEventHandler(user, ORSApiKey)
 
+    def close(self) -> None:
+        """
+        Method to Close the Remote Database Asynchronous Connection Pool and the Session Event Loop
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        try:
+            self.__loop.run_until_complete(self.__apool.closePool())
+
+        except BaseException as err:
+            console.print(err, style="warning")
+
+        finally:
+            self.__loop.close()
+
+    def __run(self, coro):
+        """
+        Method to Run a Coroutine at the Session Event Loop
+
+        :param coro: Coroutine to Run
+        :return: Value Returned by the Coroutine
+        :raises Exception: Raised when the Coroutine Raises an Exception
+        """
+
+        return self.__loop.run_until_complete(coro)
+
+    def __ask(self, func, *args, **kwargs):
+        """
+        Method to Run a Blocking Prompt Function without Blocking the Session Event Loop, so the Connection Pool can keep Growing in the Background while the User is Typing
+
+        :param func: Blocking Function that Reads from the Terminal
+        :return: Value Returned by ``func``
+        """
+
+        return self.__run(offloadPrompt(func, *args, **kwargs))
+
+    def importHandler(self, argsDict: dict) -> None:
+        """
+        Handler of ``import`` Command. It's not Interactive, so the Program Ends after the File is Imported
+
+        :param dict argsDict: Dictionary that Contains the Table and the File Path Arguments
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        try:
+            # Initialize Import Event Handler
+            importEventHandler = ImportEventHandler(self.__user)
+
+            # Call Import Event Handler
+            self.__run(
+                importEventHandler.importHandler(
+                    self.__apool, argsDict[IMPORT_TABLE], argsDict[IMPORT_FILE]
+                )
+            )
+
+        except KeyboardInterrupt:
+            console.print(END_MSG, style="warning")
+
+        except Exception as err:
+            console.print(err, style="warning")
+
     def handler(self, argsDict: dict) -> None:
         """
         Main Handler of ``add``, ``all``, ``get``, ``mod`` and ``rm`` Commands
@@ -62,6 +141,9 @@ class EventHandler:
         :rtype: NoneType
         """
 
+        # Start Opening the Connection Pool. It Grows in the Background while the Session Event Loop is Running
+        self.__run(self.__apool.openPool())
+
         while True:
             try:
                 # Clear Terminal
@@ -72,14 +154,16 @@ class EventHandler:
                     # Check if it's a Locations Scheme Table
                     if argsDict[DB_SCHEME] == DB_LOCATIONS_SCHEME_CMD:
                         # Call Location Database Event Handler
-                        self.__locationsEventHandler.dbHandler(
-                            self.__apool, argsDict[DB_ACTION], argsDict[DB_TABLE]
+                        self.__run(
+                            self.__locationsEventHandler.dbHandler(
+                                self.__apool, argsDict[DB_ACTION], argsDict[DB_TABLE]
+                            )
                         )
 
                 # Check if it's a Graph-related Command
                 elif argsDict[CMD_TYPE] == GRAPH:
                     # Call Location Graph Event Handler
-                    asyncio.run(
+                    self.__run(
                         self.__locationsEventHandler.graphHandler(
                             self.__apool, argsDict[GRAPH_TYPE], argsDict[GRAPH_LEVEL]
                         )
@@ -88,7 +172,7 @@ class EventHandler:
                 # Clear Terminal
                 clear()
 
-                argsDict = getEventHandlerArguments()
+                argsDict = self.__ask(getEventHandlerArguments)
 
                 # Check if the User wants to Exit the Program
                 if argsDict == None:
@@ -104,12 +188,12 @@ class EventHandler:
                     console.print(err, style="warning")
 
                     # Press ENTER to Continue
-                    Prompt.ask(PRESS_ENTER)
+                    self.__ask(Prompt.ask, PRESS_ENTER)
 
                     # Clear Terminal
                     clear()
 
-                    argsDict = getEventHandlerArguments()
+                    argsDict = self.__ask(getEventHandlerArguments)
 
                     # Check if the User wants to Exit the Program
                     if argsDict == None:
@@ -84,3 +84,20 @@ class MainWarehouseError(Exception):
         super().__init__(
             f"Warehouse is the Main One at the '{locationTableName}' Row ID '{locationId}'\n"
         )
+
+
+class ImportFileError(Exception):
+    """
+    Exception Raised when a File can't be Imported because of its Format
+    """
+
+    def __init__(self, filePath: str):
+        """
+        ImportFileError Exception Constructor
+
+        :param str filePath: Path of the File that's being Imported
+        """
+
+        super().__init__(
+            f"Couldn't Import '{filePath}'. Only CSV and JSONL Files are Supported\n"
+        )
@@ -0,0 +1,602 @@
+import csv
+import json
+import os
+from typing import Iterator
+
+from email_validator import EmailNotValidError
+
+from .constants import *
+from .exceptions import ImportFileError, RowNotFound
+
+from ..geocoding.exceptions import LocationNotFound, PlaceNotFound
+from ..geocoding.geopy import (
+    NominatimGeocoder,
+    NOMINATIM_LATITUDE,
+    NOMINATIM_LONGITUDE,
+)
+
+from ..io.exceptions import FieldValueError
+from ..io.validator import isAddressValid, isEmailValid
+
+from ..local_database.database import NominatimDatabase, NominatimTables
+
+from ..model.database import AsyncPool, console
+from ..model.database_building import WarehousesTable, fullBuildingName
+from ..model.database_territory import *
+
+
+def getChunks(rows: Iterator[dict], chunkSize: int) -> Iterator[list[tuple]]:
+    """
+    Generator Function to Split the Rows Read from a File into Chunks, Keeping its Row Number
+
+    :param rows: Iterator of Rows Read from the File
+    :param int chunkSize: Maximum Number of Rows per Chunk
+    :return: Iterator of Lists of Tuples that Contain the Row Number and the Row
+    :rtype: Iterator
+    """
+
+    chunk = []
+
+    for i, row in enumerate(rows, start=1):
+        chunk.append((i, row))
+
+        # Close the Current Chunk if it's Full
+        if len(chunk) == chunkSize:
+            yield chunk
+            chunk = []
+
+    if len(chunk) > 0:
+        yield chunk
+
+
+def readRows(filePath: str) -> Iterator[dict | str]:
+    """
+    Generator Function to Read the Rows from a CSV (with Header) or JSONL File, One by One. JSONL Lines are not Decoded Here, so a Malformed Line is Rejected by ``loadRow`` without Stopping the Iteration
+
+    :param str filePath: Path of the File to Import
+    :return: Iterator of Dictionaries that Map each Column Name to its Value, for CSV Files, or of JSONL Lines
+    :rtype: Iterator
+    :raises ImportFileError: Raised when the File Extension isn't Supported
+    """
+
+    extension = os.path.splitext(filePath)[1].lower()
+
+    if extension == IMPORT_CSV_EXTENSION:
+        with open(filePath, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield row
+
+    elif extension == IMPORT_JSONL_EXTENSION:
+        with open(filePath, encoding="utf-8") as f:
+            for line in f:
+                # Skip Empty Lines
+                if line.strip():
+                    yield line
+
+    else:
+        raise ImportFileError(filePath)
+
+
+def loadRow(row: dict | str) -> dict:
+    """
+    Function to Decode a Row Read from the File, if It's a JSONL Line
+
+    :param row: Row Read from the File
+    :return: Dictionary that Maps each Column Name to its Value
+    :rtype: dict
+    :raises ValueError: Raised when the JSONL Line is Malformed
+    :raises TypeError: Raised when the JSONL Line isn't an Object
+    """
+
+    if isinstance(row, str):
+        row = json.loads(row)
+
+        if not isinstance(row, dict):
+            raise TypeError("JSONL Line must be an Object")
+
+    return row
+
+
+def rejectedRow(rowNumber: int, err: Exception) -> None:
+    """
+    Function to Print a Message when a Row from the Imported File is Rejected
+
+    :param int rowNumber: Row Number at the Imported File
+    :param Exception err: Reason why the Row was Rejected
+    :return: Nothing
+    :rtype: NoneType
+    """
+
+    console.print(f"Row {rowNumber} Rejected: {err}", style="warning")
+
+
+class ImportEventHandler:
+    """
+    Class that Handles the Bulk Import of Locations and Warehouses from CSV and JSONL Files
+    """
+
+    # Table Classes
+    __countriesTable = None
+    __regionsTable = None
+    __citiesTable = None
+    __warehousesTable = None
+
+    # Nominatim GeoPy Local Database Tables
+    __localDatabase = None
+    __localTables = None
+
+    # Nominatim Geocoder
+    __nominatimGeocoder = None
+
+    # Names Normalized at the Current Process, so each Search is Geocoded Once
+    __countriesName = None
+    __regionsName = None
+    __citiesName = None
+
+    # Constructor
+    def __init__(self, user: str):
+        """
+        Import Event Handler Class Constructor
+
+        :param str user: Remote Database Role Name
+        """
+
+        # Initialize Table Classes
+        self.__countriesTable = CountriesTable()
+        self.__regionsTable = RegionsTable()
+        self.__citiesTable = CitiesTable()
+        self.__warehousesTable = WarehousesTable()
+
+        # Initialize Nominatim GeoPy Local Database and its Tables Class
+        self.__localDatabase = NominatimDatabase()
+        self.__localTables = NominatimTables(
+            self.__localDatabase.getConnection(), self.__localDatabase.getCursor()
+        )
+
+        # Initialize Nominatim GeoPy Geocoder
+        self.__nominatimGeocoder = NominatimGeocoder(user)
+
+        # Initialize Normalized Names Dictionaries
+        self.__countriesName = {}
+        self.__regionsName = {}
+        self.__citiesName = {}
+
+    def __getCountryName(self, location: dict, countrySearch: str) -> None:
+        """
+        Method to Normalize a Country Name through the Local Database or, if It's not Cached, the Nominatim API. The Country Name and its Name ID are Set at the Location Dictionary
+
+        :param dict location: Location Dictionary of the Row that's being Imported
+        :param str countrySearch: Country Name Read from the File
+        :return: Nothing
+        :rtype: NoneType
+        :raises FieldValueError: Raised if the Country Name Contain Illegal Characters
+        :raises LocationNotFound: Raised when there's no Country Coincidence for the Given Name
+        """
+
+        if countrySearch not in self.__countriesName:
+            # Check Country Name
+            isAddressValid(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countrySearch)
+
+            # Check if the Search is Stored in the Local Database
+            countryNameId = self.__localTables.getCountrySearchNameId(countrySearch)
+
+            if countryNameId != None:
+                countryName = self.__localTables.getCountryName(countryNameId)
+
+            else:
+                # Get Country Name from Nominatim GeoPy API and Store the Search
+                countryName = self.__nominatimGeocoder.getCountry(countrySearch)
+                self.__localTables.addCountry(countrySearch, countryName)
+                countryNameId = self.__localTables.getCountryNameId(countryName)
+
+            self.__countriesName[countrySearch] = (countryName, countryNameId)
+
+        (
+            location[DICT_COUNTRY_NAME],
+            location[DICT_COUNTRY_NAME_ID],
+        ) = self.__countriesName[countrySearch]
+
+    def __getRegionName(self, location: dict, regionSearch: str) -> None:
+        """
+        Method to Normalize a Region Name through the Local Database or, if It's not Cached, the Nominatim API. The Region Name and its Name ID are Set at the Location Dictionary
+
+        :param dict location: Location Dictionary of the Row that's being Imported, with its Country Name Already Normalized
+        :param str regionSearch: Region Name Read from the File
+        :return: Nothing
+        :rtype: NoneType
+        :raises FieldValueError: Raised if the Region Name Contain Illegal Characters
+        :raises LocationNotFound: Raised when there's no Region Coincidence for the Given Name
+        """
+
+        countryNameId = location[DICT_COUNTRY_NAME_ID]
+        key = (countryNameId, regionSearch)
+
+        if key not in self.__regionsName:
+            # Check Region Name
+            isAddressValid(REGIONS_TABLE_NAME, REGIONS_NAME, regionSearch)
+
+            # Check if the Search is Stored in the Local Database
+            regionNameId = self.__localTables.getRegionSearchNameId(
+                countryNameId, regionSearch
+            )
+
+            if regionNameId != None:
+                regionName = self.__localTables.getRegionName(regionNameId)
+
+            else:
+                # Get Region Name from Nominatim GeoPy API and Store the Search
+                regionName = self.__nominatimGeocoder.getRegion(location, regionSearch)
+                self.__localTables.addRegion(countryNameId, regionSearch, regionName)
+                regionNameId = self.__localTables.getRegionNameId(
+                    countryNameId, regionName
+                )
+
+            self.__regionsName[key] = (regionName, regionNameId)
+
+        (
+            location[DICT_REGION_NAME],
+            location[DICT_REGION_NAME_ID],
+        ) = self.__regionsName[key]
+
+    def __getCityName(self, location: dict, citySearch: str) -> None:
+        """
+        Method to Normalize a City Name through the Local Database or, if It's not Cached, the Nominatim API. The City Name and its Name ID are Set at the Location Dictionary
+
+        :param dict location: Location Dictionary of the Row that's being Imported, with its Country and Region Names Already Normalized
+        :param str citySearch: City Name Read from the File
+        :return: Nothing
+        :rtype: NoneType
+        :raises FieldValueError: Raised if the City Name Contain Illegal Characters
+        :raises LocationNotFound: Raised when there's no City Coincidence for the Given Name
+        """
+
+        regionNameId = location[DICT_REGION_NAME_ID]
+        key = (regionNameId, citySearch)
+
+        if key not in self.__citiesName:
+            # Check City Name
+            isAddressValid(CITIES_TABLE_NAME, CITIES_NAME, citySearch)
+
+            # Check if the Search is Stored in the Local Database
+            cityNameId = self.__localTables.getCitySearchNameId(
+                regionNameId, citySearch
+            )
+
+            if cityNameId != None:
+                cityName = self.__localTables.getCityName(cityNameId)
+
+            else:
+                # Get City Name from Nominatim GeoPy API and Store the Search
+                cityName = self.__nominatimGeocoder.getCity(location, citySearch)
+                self.__localTables.addCity(regionNameId, citySearch, cityName)
+                cityNameId = self.__localTables.getCityNameId(regionNameId, cityName)
+
+            self.__citiesName[key] = (cityName, cityNameId)
+
+        location[DICT_CITY_NAME], location[DICT_CITY_NAME_ID] = self.__citiesName[key]
+
+    def __getLocation(self, tableName: str, row: dict) -> dict:
+        """
+        Method to Validate and Normalize a Row Read from the File. Nothing is Queried to the Remote Database
+
+        :param str tableName: Location Table Name at the Remote Database
+        :param dict row: Row Read from the File
+        :return: Location Dictionary with the Normalized Names and the Other Fields of the Row
+        :rtype: dict
+        :raises KeyError: Raised when a Required Column is Missing
+        :raises Exception: Raised when a Value is Invalid or a Location couldn't be Normalized
+        """
+
+        location = {}
+
+        # Normalize the Location Names, from the Country to the Table Level
+        self.__getCountryName(location, row[COUNTRIES_NAME].strip())
+
+        if tableName == COUNTRIES_TABLE_NAME:
+            location[COUNTRIES_PHONE_PREFIX] = int(row[COUNTRIES_PHONE_PREFIX])
+            return location
+
+        self.__getRegionName(location, row[REGIONS_NAME].strip())
+
+        if tableName == REGIONS_TABLE_NAME:
+            return location
+
+        self.__getCityName(location, row[CITIES_NAME].strip())
+
+        if tableName == CITIES_TABLE_NAME:
+            return location
+
+        # Check the Warehouse Fields
+        buildingName = row[BUILDINGS_NAME].strip()
+        addressDescription = row[BUILDINGS_ADDRESS_DESCRIPTION].strip()
+
+        isAddressValid(tableName, BUILDINGS_NAME, buildingName)
+        isAddressValid(tableName, BUILDINGS_ADDRESS_DESCRIPTION, addressDescription)
+
+        location[BUILDINGS_NAME] = fullBuildingName(tableName, buildingName)
+        location[BUILDINGS_ADDRESS_DESCRIPTION] = addressDescription
+        location[BUILDINGS_EMAIL] = isEmailValid(row[BUILDINGS_EMAIL].strip())
+        location[BUILDINGS_PHONE] = int(row[BUILDINGS_PHONE])
+
+        # Get the Coordinates from the File or, if They're Missing, from the Nominatim API
+        latitude = row.get(BUILDINGS_GPS_LATITUDE)
+        longitude = row.get(BUILDINGS_GPS_LONGITUDE)
+
+        if latitude in (None, "") or longitude in (None, ""):
+            location[DICT_REGION_ID] = None
+            location[DICT_CITY_ID] = None
+
+            coords = self.__nominatimGeocoder.getPlaceCoordinates(
+                location, buildingName
+            )
+            latitude = coords[NOMINATIM_LATITUDE]
+            longitude = coords[NOMINATIM_LONGITUDE]
+
+        location[NOMINATIM_LATITUDE] = float(latitude)
+        location[NOMINATIM_LONGITUDE] = float(longitude)
+
+        return location
+
+    async def __setParentIds(
+        self, aconn, tableName: str, locations: list[tuple[int, dict]]
+    ) -> list[tuple[int, dict]]:
+        """
+        Asynchronous Method to Set the Remote Database ID of the Parent Locations of each Row, with a Single Query per Location Level. Rows whose Parent Locations are not Inserted are Rejected
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param str tableName: Location Table Name at the Remote Database
+        :param list locations: List of Tuples that Contain the Row Number and its Location Dictionary
+        :return: List of the Rows whose Parent Locations were Found
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Get Countries ID
+        countriesId = await self.__countriesTable.getIdsDict(
+            aconn, list({location[DICT_COUNTRY_NAME] for _, location in locations})
+        )
+
+        found = []
+
+        for i, location in locations:
+            countryId = countriesId.get(location[DICT_COUNTRY_NAME])
+
+            if countryId == None:
+                rejectedRow(
+                    i,
+                    RowNotFound(
+                        COUNTRIES_TABLE_NAME,
+                        COUNTRIES_NAME,
+                        location[DICT_COUNTRY_NAME],
+                    ),
+                )
+                continue
+
+            location[DICT_COUNTRY_ID] = countryId
+            found.append((i, location))
+
+        if tableName == REGIONS_TABLE_NAME or len(found) == 0:
+            return found
+
+        # Get Regions ID
+        regionsId = await self.__regionsTable.getIdsDict(
+            aconn,
+            list(
+                {
+                    (location[DICT_COUNTRY_ID], location[DICT_REGION_NAME])
+                    for _, location in found
+                }
+            ),
+        )
+
+        locations, found = found, []
+
+        for i, location in locations:
+            regionId = regionsId.get(
+                (location[DICT_COUNTRY_ID], location[DICT_REGION_NAME])
+            )
+
+            if regionId == None:
+                rejectedRow(
+                    i,
+                    RowNotFound(
+                        REGIONS_TABLE_NAME, REGIONS_NAME, location[DICT_REGION_NAME]
+                    ),
+                )
+                continue
+
+            location[DICT_REGION_ID] = regionId
+            found.append((i, location))
+
+        if tableName == CITIES_TABLE_NAME or len(found) == 0:
+            return found
+
+        # Get Cities ID
+        citiesId = await self.__citiesTable.getIdsDict(
+            aconn,
+            list(
+                {
+                    (location[DICT_REGION_ID], location[DICT_CITY_NAME])
+                    for _, location in found
+                }
+            ),
+        )
+
+        locations, found = found, []
+
+        for i, location in locations:
+            cityId = citiesId.get((location[DICT_REGION_ID], location[DICT_CITY_NAME]))
+
+            if cityId == None:
+                rejectedRow(
+                    i,
+                    RowNotFound(
+                        CITIES_TABLE_NAME, CITIES_NAME, location[DICT_CITY_NAME]
+                    ),
+                )
+                continue
+
+            location[DICT_CITY_ID] = cityId
+            found.append((i, location))
+
+        return found
+
+    async def __insertChunk(
+        self, aconn, tableName: str, locations: list[tuple[int, dict]], seen: set
+    ) -> tuple[int, list]:
+        """
+        Asynchronous Method to Insert the Normalized Rows of a Chunk that haven't been Inserted Yet, with a Single Batched Statement per Table
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param str tableName: Location Table Name at the Remote Database
+        :param list locations: List of Tuples that Contain the Row Number and its Location Dictionary
+        :param set seen: Set of the Rows Unique Keys Committed at the Current Import. It's not Modified
+        :return: Number of Inserted Rows, and List of the Unique Keys Processed at the Chunk, which must be Added to ``seen`` once the Transaction is Committed
+        :rtype: tuple
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Get the Parent Locations ID
+        if tableName != COUNTRIES_TABLE_NAME:
+            locations = await self.__setParentIds(aconn, tableName, locations)
+
+        # Get the Unique Key of each Row, and Drop the Duplicated Ones
+        rows = {}
+
+        for _, location in locations:
+            if tableName == COUNTRIES_TABLE_NAME:
+                key = location[DICT_COUNTRY_NAME]
+
+            elif tableName == REGIONS_TABLE_NAME:
+                key = (location[DICT_COUNTRY_ID], location[DICT_REGION_NAME])
+
+            elif tableName == CITIES_TABLE_NAME:
+                key = (location[DICT_REGION_ID], location[DICT_CITY_NAME])
+
+            else:
+                key = (location[DICT_CITY_ID], location[BUILDINGS_NAME])
+
+            if key not in seen and key not in rows:
+                rows[key] = location
+
+        keys = list(rows)
+
+        # Drop the Rows that are Already Inserted at the Remote Database, and Insert the Other Ones
+        if tableName == COUNTRIES_TABLE_NAME:
+            inserted = await self.__countriesTable.getIdsDict(aconn, list(rows))
+            rows = [
+                (key, location[COUNTRIES_PHONE_PREFIX])
+                for key, location in rows.items()
+                if key not in inserted
+            ]
+            await self.__countriesTable.addMany(aconn, rows)
+
+        elif tableName == REGIONS_TABLE_NAME:
+            inserted = await self.__regionsTable.getIdsDict(aconn, list(rows))
+            rows = [key for key in rows if key not in inserted]
+            await self.__regionsTable.addMany(aconn, rows)
+
+        elif tableName == CITIES_TABLE_NAME:
+            inserted = await self.__citiesTable.getIdsDict(aconn, list(rows))
+            rows = [key for key in rows if key not in inserted]
+            await self.__citiesTable.addMany(aconn, rows)
+
+        else:
+            inserted = await self.__warehousesTable._getNamesSet(aconn, list(rows))
+            rows = [
+                (
+                    location[BUILDINGS_ADDRESS_DESCRIPTION],
+                    location[DICT_CITY_ID],
+                    location[BUILDINGS_NAME],
+                    location[BUILDINGS_EMAIL],
+                    location[BUILDINGS_PHONE],
+                    location[NOMINATIM_LATITUDE],
+                    location[NOMINATIM_LONGITUDE],
+                )
+                for key, location in rows.items()
+                if key not in inserted
+            ]
+            await self.__warehousesTable.addMany(aconn, rows)
+
+        return len(rows), keys
+
+    async def importHandler(
+        self,
+        apool: AsyncPool,
+        tableName: str,
+        filePath: str,
+        chunkSize: int = IMPORT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Asynchronous Handler of ``import`` Command. The File is Read and Normalized in Chunks, and each Chunk is Inserted inside its Own Transaction
+
+        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
+        :param str tableName: Location Table Name at the Remote Database
+        :param str filePath: Path of the CSV or JSONL File to Import
+        :param int chunkSize: Maximum Number of Rows per Chunk. Default is ``IMPORT_CHUNK_SIZE``
+        :return: Nothing
+        :rtype: NoneType
+        :raises ImportFileError: Raised when the File Extension isn't Supported
+        """
+
+        # Unique Keys of the Rows Already Committed, to Drop Duplicated Rows without Querying Them
+        seen = set()
+        nInserted = 0
+        nRows = 0
+
+        # Lease a Connection from the Asynchronous Pool
+        async with apool.lease(1) as aconns:
+            aconn = aconns[0]
+
+            for chunk in getChunks(readRows(filePath), chunkSize):
+                nRows += len(chunk)
+                locations = []
+
+                # Normalize the Rows before Opening the Transaction, since It Calls the Nominatim API
+                for i, row in chunk:
+                    try:
+                        locations.append(
+                            (i, self.__getLocation(tableName, loadRow(row)))
+                        )
+
+                    except KeyError as err:
+                        rejectedRow(i, f"Missing Column {err}")
+
+                    # Wrong Types, like the Missing Values of a Short CSV Row or Non-String JSONL Values
+                    except (TypeError, AttributeError) as err:
+                        rejectedRow(i, f"Invalid Value ({err})")
+
+                    except (
+                        ValueError,
+                        FieldValueError,
+                        EmailNotValidError,
+                        LocationNotFound,
+                        PlaceNotFound,
+                    ) as err:
+                        rejectedRow(i, err)
+
+                if len(locations) == 0:
+                    continue
+
+                # Insert the Chunk inside a Single Transaction
+                try:
+                    async with aconn.transaction():
+                        chunkInserted, keys = await self.__insertChunk(
+                            aconn, tableName, locations, seen
+                        )
+
+                except Exception as err:
+                    console.print(
+                        f"Rows {chunk[0][0]}-{chunk[-1][0]} couldn't be Inserted: {err}",
+                        style="warning",
+                    )
+                    continue
+
+                # The Chunk has been Committed, so its Rows are Dropped if They're Repeated Later
+                nInserted += chunkInserted
+                seen.update(keys)
+
+        console.print(
+            f"{nInserted} Rows out of {nRows} Successfully Imported to {tableName} Table\n",
+            style="success",
+        )
@@ -1,5 +1,3 @@
-from rich.prompt import Prompt, IntPrompt, Confirm
-
 from .constants import *
 from .exceptions import (
     RowNotFound,
@@ -14,10 +12,10 @@ from ..geocoding.geopy import (
     NOMINATIM_LATITUDE,
     NOMINATIM_LONGITUDE,
 )
-from ..geocoding.routingpy import ORSGeocoder
+from ..geocoding.constants import DISTANCE_PROVIDER_ORS
+from ..geocoding.distance import getDistanceProvider
 
 from ..graph.constants import LAYOUT_CMDS
-from ..graph.warehouses import rushWGraph, RushWGraph
 
 from ..io.constants import (
     DB_ADD,
@@ -31,18 +29,24 @@ from ..io.validator import *
 
 from ..local_database.database import NominatimDatabase, NominatimTables
 
-from ..model.database import AsyncPool, cancelTasks
+from ..model.constants import ENV_DISTANCE_PROVIDER
+from ..model.database import AsyncPool, getEnvValue
 from ..model.database_building import *
+from ..model.database_cache import LocationsCache
 from ..model.database_connections import *
 from ..model.database_territory import *
 
 from ..terminal.clear import clear
 from ..terminal.constants import *
+from ..terminal.prompt import askPrompt, askIntPrompt, askConfirm
+
+# Rush Cargo Warehouse Graph. Its Module is Imported when a Graph Command is Called, as It Loads NetworkX, SciPy and Matplotlib
+rushWGraph = None
 
 
-def nothingToChange() -> None:
+async def nothingToChange() -> None:
     """
-    Function to Print a Message when a Row is Already Modified at a Given Table
+    Asynchronous Function to Print a Message when a Row is Already Modified at a Given Table
 
     :return: Nothing
     :rtype: NoneType
@@ -51,7 +55,7 @@ def nothingToChange() -> None:
     console.print("Nothing to Change...", style="warning")
 
     # Press ENTER to Continue
-    Prompt.ask(PRESS_ENTER)
+    await askPrompt(PRESS_ENTER)
 
 
 class LocationsEventHandler:
@@ -67,13 +71,16 @@ class LocationsEventHandler:
     __warehouseConnsTable = None
     __branchesTable = None
 
+    # Location Hierarchy Cache
+    __locationsCache = None
+
     # Nominatim GeoPy Local Database Tables
     __localDatabase = None
     __localTables = None
 
-    # Geocoders
+    # Geocoder and Route Distance Provider
     __nominatimGeocoder = None
-    __ORSGeocoder = None
+    __distanceProvider = None
 
     # Get Location Messages
     __GET_COUNTRY_MSG = "Enter Country Name"
@@ -97,6 +104,11 @@ class LocationsEventHandler:
         self.__warehousesTable = WarehousesTable()
         self.__branchesTable = BranchesTable()
 
+        # Initialize Location Hierarchy Cache
+        self.__locationsCache = LocationsCache(
+            self.__countriesTable, self.__regionsTable, self.__citiesTable
+        )
+
         # Initialize Nominatim GeoPy Local Database and Get Connection and Cursor
         self.__localDatabase = NominatimDatabase()
         localConnection = self.__localDatabase.getConnection()
@@ -105,9 +117,21 @@ class LocationsEventHandler:
         # Initialize Local Nominatim GeoPy Database Tables Class
         self.__localTables = NominatimTables(localConnection, localCursor)
 
-        # Initialize Nominatim GeoPy and RoutingPy Geocoders
+        # Initialize Nominatim GeoPy Geocoder
         self.__nominatimGeocoder = NominatimGeocoder(user)
-        self.__ORSGeocoder = ORSGeocoder(ORSApiKey, user)
+
+        # Initialize Route Distance Provider. RoutingPy is Used unless the Offline Provider is Set
+        providerName = getEnvValue(ENV_DISTANCE_PROVIDER, DISTANCE_PROVIDER_ORS)
+
+        try:
+            self.__distanceProvider = getDistanceProvider(providerName, user, ORSApiKey)
+
+        except ValueError as err:
+            console.print(err, style="warning")
+
+            self.__distanceProvider = getDistanceProvider(
+                DISTANCE_PROVIDER_ORS, user, ORSApiKey
+            )
 
     async def __getRouteDistance(
         self, aconn, warehouseId: int, locationCoords: dict
@@ -124,9 +148,7 @@ class LocationsEventHandler:
         """
 
         # Get Warehouse Object
-        findTask = asyncio.create_task(self.__warehousesTable.find(aconn, warehouseId))
-        await asyncio.gather(findTask)
-        warehouse = findTask.result()
+        warehouse = await self.__warehousesTable.find(aconn, warehouseId)
 
         # Initialize Warehouse Coordinates Dictionary
         warehouseCoords = {}
@@ -136,7 +158,7 @@ class LocationsEventHandler:
         warehouseCoords[NOMINATIM_LONGITUDE] = warehouse.gpsLongitude
 
         # Calculate Route Distance
-        routeDistance = self.__ORSGeocoder.getDrivingRouteDistance(
+        routeDistance = await self.__distanceProvider.getDrivingRouteDistance(
             warehouseCoords, locationCoords
         )
 
@@ -154,9 +176,7 @@ class LocationsEventHandler:
         """
 
         # Get Warehouse Object
-        findTask = asyncio.create_task(self.__warehousesTable.find(aconn, warehouseId))
-        await asyncio.gather(findTask)
-        warehouse = findTask.result()
+        warehouse = await self.__warehousesTable.find(aconn, warehouseId)
 
         # Initialize Warehouse Dictionary
         warehouseDict = {}
@@ -170,9 +190,9 @@ class LocationsEventHandler:
 
         return warehouseDict
 
-    def getCountryName(self) -> dict | None:
+    async def getCountryName(self) -> dict | None:
         """
-        Method to Search for a Country Name in the Local Database
+        Asynchronous Method to Search for a Country Name in the Local Database
 
         :return: A Dictionary that Contains the Country Name and its ID from its Local SQLite Table if there's no Error. Otherwise, if the User wants, It'll return ``None`` and Go Back to the Main Menu
         :rtype: dict if there's no Error. Otherwise, None
@@ -184,7 +204,7 @@ class LocationsEventHandler:
 
         while True:
             try:
-                countrySearch = Prompt.ask(self.__GET_COUNTRY_MSG)
+                countrySearch = await askPrompt(self.__GET_COUNTRY_MSG)
 
                 # Check Country Name
                 isAddressValid(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countrySearch)
@@ -223,7 +243,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Go Back to the While-loop
-                if Confirm.ask("Do you want to Type Another Country Name?"):
+                if await askConfirm("Do you want to Type Another Country Name?"):
                     # Clear Terminal
                     clear()
                     continue
@@ -242,33 +262,24 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the Country Name) to Search for it in its Table
-        location = self.getCountryName()
+        location = await self.getCountryName()
         countryName = location[DICT_COUNTRY_NAME]
 
-        # Get Country Object from the Remote Database
-        findTask = asyncio.create_task(
-            self.__countriesTable.find(aconn, COUNTRIES_NAME, countryName)
+        # Get Country ID from the Remote Database
+        countryId = await self.__countriesTable.findId(
+            aconn, COUNTRIES_NAME, countryName
         )
-        await asyncio.gather(findTask)
-        c = findTask.result()
 
         # Check if the Country Name is Stored at the Remote Database
-        if c == None:
+        if countryId == None:
             # Clear Terminal
             clear()
 
-            # Insert Country
-            await asyncio.gather(self.__countriesTable.add(aconn, countryName))
-
-            # Get Country Object from the Remote Database
-            findTask = asyncio.create_task(
-                self.__countriesTable.find(aconn, COUNTRIES_NAME, countryName)
-            )
-            await asyncio.gather(findTask)
-            c = findTask.result()
+            # Insert Country and Get its ID, without Checking Again if It Exists
+            countryId = await self.__countriesTable.add(aconn, countryName, False)
 
         # Set Country ID to Data Dictionary
-        location[DICT_COUNTRY_ID] = c.countryId
+        location[DICT_COUNTRY_ID] = countryId
 
         return location
 
@@ -283,13 +294,11 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the Country Name and its ID in the Local SQLite and Remote Database)
-        getTask = asyncio.create_task(self.getCountryDict(aconn))
-        await asyncio.gather(getTask)
-        location = getTask.result()
+        location = await self.getCountryDict(aconn)
 
         while True:
             try:
-                regionSearch = Prompt.ask(self.__GET_REGION_MSG)
+                regionSearch = await askPrompt(self.__GET_REGION_MSG)
 
                 # Check Region Name
                 isAddressValid(REGIONS_TABLE_NAME, REGIONS_NAME, regionSearch)
@@ -334,7 +343,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Go Back to the While-loop
-                if Confirm.ask("Do you want to Type Another Region Name?"):
+                if await askConfirm("Do you want to Type Another Region Name?"):
                     # Clear Terminal
                     clear()
                     continue
@@ -353,36 +362,23 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the Region Name) to Search for it in its Table
-        getTask = asyncio.create_task(self.getRegionName(aconn))
-        await asyncio.gather(getTask)
-        location = getTask.result()
+        location = await self.getRegionName(aconn)
         countryId = location[DICT_COUNTRY_ID]
         regionName = location[DICT_REGION_NAME]
 
-        # Get Region Object from the Remote Database
-        findMultTask = asyncio.create_task(
-            self.__regionsTable.findMult(aconn, countryId, regionName)
-        )
-        await asyncio.gather(findMultTask)
-        r = findMultTask.result()
+        # Get Region ID from the Remote Database
+        regionId = await self.__regionsTable.findMultId(aconn, countryId, regionName)
 
         # Check if the Region Name at the Given Country ID is Stored at the Remote Database
-        if r == None:
+        if regionId == None:
             # Clear Terminal
             clear()
 
-            # Insert Region
-            await asyncio.gather(self.__regionsTable.add(aconn, countryId, regionName))
-
-            # Get Region Object from the Remote Database
-            findMultTask = asyncio.create_task(
-                self.__regionsTable.findMult(aconn, countryId, regionName)
-            )
-            await asyncio.gather(findMultTask)
-            r = findMultTask.result()
+            # Insert Region and Get its ID
+            regionId = await self.__regionsTable.add(aconn, countryId, regionName)
 
         # Set Region ID to Data Dictionary
-        location[DICT_REGION_ID] = r.regionId
+        location[DICT_REGION_ID] = regionId
 
         return location
 
@@ -398,13 +394,11 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the Region Name and its ID in the Local SQLite and Remote Database)
-        getTask = asyncio.create_task(self.getRegionDict(aconn))
-        await asyncio.gather(getTask)
-        location = getTask.result()
+        location = await self.getRegionDict(aconn)
 
         while True:
             try:
-                citySearch = Prompt.ask(self.__GET_CITY_MSG)
+                citySearch = await askPrompt(self.__GET_CITY_MSG)
 
                 # Check City Name
                 isAddressValid(CITIES_TABLE_NAME, CITIES_NAME, citySearch)
@@ -447,7 +441,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Go Back to the While-loop
-                if Confirm.ask("Do you want to Type Another City Name?"):
+                if await askConfirm("Do you want to Type Another City Name?"):
                     # Clear Terminal
                     clear()
                     continue
@@ -466,36 +460,23 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the City Name) to Search for it in its Table
-        getTask = asyncio.create_task(self.getCityName(aconn))
-        await asyncio.gather(getTask)
-        location = getTask.result()
+        location = await self.getCityName(aconn)
         regionId = location[DICT_REGION_ID]
         cityName = location[DICT_CITY_NAME]
 
-        # Get City Object from the Remote Database
-        findMultTask = asyncio.create_task(
-            self.__citiesTable.findMult(aconn, regionId, cityName)
-        )
-        await asyncio.gather(findMultTask)
-        c = findMultTask.result()
+        # Get City ID from the Remote Database
+        cityId = await self.__citiesTable.findMultId(aconn, regionId, cityName)
 
         # Check if the City Name at the Given Region ID is Stored at the Remote Database
-        if c == None:
+        if cityId == None:
             # Clear Terminal
             clear()
 
-            # Insert City
-            await asyncio.gather(self.__citiesTable.add(aconn, regionId, cityName))
-
-            # Get City Object from the Remote Database
-            findMultTask = asyncio.create_task(
-                self.__citiesTable.findMult(aconn, regionId, cityName)
-            )
-            await asyncio.gather(findMultTask)
-            c = findMultTask.result()
+            # Insert City and Get its ID
+            cityId = await self.__citiesTable.add(aconn, regionId, cityName)
 
         # Set City ID to Data Dictionary
-        location[DICT_CITY_ID] = c.cityId
+        location[DICT_CITY_ID] = cityId
 
         return location
 
@@ -511,14 +492,12 @@ class LocationsEventHandler:
         """
 
         # Get Location Dictionary (that Contains the City ID)
-        getTask = asyncio.create_task(self.getCityDict(aconn))
-        await asyncio.gather(getTask)
-        location = getTask.result()
+        location = await self.getCityDict(aconn)
 
         while True:
             try:
                 # Get Place Name to Search
-                placeSearch = Prompt.ask("Enter Place Name Near to the Building")
+                placeSearch = await askPrompt("Enter Place Name Near to the Building")
 
                 isPlaceNameValid(placeSearch)
 
@@ -540,7 +519,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Go Back to the While-loop
-                if Confirm.ask("Do you want to Type Another Place Name?"):
+                if await askConfirm("Do you want to Type Another Place Name?"):
                     # Clear Terminal
                     clear()
                     continue
@@ -557,25 +536,25 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
+        # Load the Location Hierarchy Cache, if It's not Fresh
+        await self.__locationsCache.load(aconn)
+
         # Print All Countries
-        allTask = asyncio.create_task(
-            self.__countriesTable.all(aconn, COUNTRIES_NAME, False)
-        )
-        await asyncio.gather(allTask)
-        countriesList = allTask.result()
+        countriesList = self.__locationsCache.getCountries()
 
-        if countriesList == None:
+        if len(countriesList) == 0:
             raise EmptyTable(COUNTRIES_TABLE_NAME)
 
+        self.__countriesTable.printItems(countriesList)
+
         while True:
             try:
                 # Select Country ID
-                countryId = IntPrompt.ask("\nSelect Country ID")
+                countryId = await askIntPrompt("\nSelect Country ID")
 
                 # Check if Country ID Exists
-                for c in countriesList:
-                    if c.countryId == countryId:
-                        return countryId
+                if self.__locationsCache.getCountry(countryId) != None:
+                    return countryId
 
                 raise RowNotFound(COUNTRIES_TABLE_NAME, COUNTRIES_ID, countryId)
 
@@ -593,10 +572,7 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        getTask = asyncio.create_task(self.__getCountry(aconn))
-        await asyncio.gather(getTask)
-
-        return getTask.result()
+        return await self.__getCountry(aconn)
 
     async def __getRegion(self, aconn, countryId: int) -> int:
         """
@@ -609,25 +585,27 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
+        # Load the Location Hierarchy Cache, if It's not Fresh
+        await self.__locationsCache.load(aconn)
+
         # Print Regions at the Given Country ID
-        getTask = asyncio.create_task(
-            self.__regionsTable.get(aconn, REGIONS_FK_COUNTRY, countryId, True)
-        )
-        await asyncio.gather(getTask)
-        regionsList = getTask.result()
+        regionsList = self.__locationsCache.getRegions(countryId)
 
-        if regionsList == None:
+        if len(regionsList) == 0:
             raise RowNotFound(REGIONS_TABLE_NAME, REGIONS_FK_COUNTRY, countryId)
 
+        self.__regionsTable.printItems(regionsList)
+
         while True:
             try:
                 # Select Region ID
-                regionId = IntPrompt.ask("\nSelect Region ID")
+                regionId = await askIntPrompt("\nSelect Region ID")
+
+                # Check if Region ID Exists at the Given Country ID
+                region = self.__locationsCache.getRegion(regionId)
 
-                # Check if Region ID Exists
-                for r in regionsList:
-                    if r.regionId == regionId:
-                        return regionId
+                if region != None and region.countryId == countryId:
+                    return regionId
 
                 raise RowNotFound(REGIONS_TABLE_NAME, REGIONS_ID, regionId)
 
@@ -646,14 +624,9 @@ class LocationsEventHandler:
         """
 
         # Get Country ID where the Region is Located
-        getCountryTask = asyncio.create_task(self.getCountryId(aconn))
-        await asyncio.gather(getCountryTask)
-        countryId = getCountryTask.result()
+        countryId = await self.getCountryId(aconn)
 
-        getCityTask = asyncio.create_task(self.__getRegion(aconn, countryId))
-        await asyncio.gather(getCityTask)
-
-        return getCityTask.result()
+        return await self.__getRegion(aconn, countryId)
 
     async def __getCity(self, aconn, regionId: int) -> int:
         """
@@ -666,25 +639,27 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
+        # Load the Location Hierarchy Cache, if It's not Fresh
+        await self.__locationsCache.load(aconn)
+
         # Print Cities at the Given Region ID
-        getTask = asyncio.create_task(
-            self.__citiesTable.get(aconn, CITIES_FK_REGION, regionId)
-        )
-        await asyncio.gather(getTask)
-        citiesList = getTask.result()
+        citiesList = self.__locationsCache.getCities(regionId)
 
-        if citiesList == None:
+        if len(citiesList) == 0:
             raise RowNotFound(CITIES_TABLE_NAME, CITIES_FK_REGION, regionId)
 
+        self.__citiesTable.printItems(citiesList)
+
         while True:
             try:
                 # Select City ID
-                cityId = IntPrompt.ask("\nSelect City ID")
+                cityId = await askIntPrompt("\nSelect City ID")
 
-                # Check if City ID Exists
-                for c in citiesList:
-                    if c.cityId == cityId:
-                        return cityId
+                # Check if City ID Exists at the Given Region ID
+                city = self.__locationsCache.getCity(cityId)
+
+                if city != None and city.regionId == regionId:
+                    return cityId
 
                 raise RowNotFound(CITIES_TABLE_NAME, CITIES_ID, cityId)
 
@@ -703,14 +678,9 @@ class LocationsEventHandler:
         """
 
         # Get Region ID where the City is Located
-        getRegionTask = asyncio.create_task(self.getRegionId(aconn))
-        await asyncio.gather(getRegionTask)
-        regionId = getRegionTask.result()
-
-        getCityTask = asyncio.create_task(self.__getCity(aconn, regionId))
-        await asyncio.gather(getCityTask)
+        regionId = await self.getRegionId(aconn)
 
-        return getCityTask.result()
+        return await self.__getCity(aconn, regionId)
 
     async def getRegionBuildingCityId(self, aconn, regionId: int) -> int:
         """
@@ -723,10 +693,7 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        getTask = asyncio.create_task(self.__getCity(aconn, regionId))
-        await asyncio.gather(getTask)
-
-        return getTask.result()
+        return await self.__getCity(aconn, regionId)
 
     async def getWarehouseId(self, aconn, cityId: int) -> int:
         """
@@ -740,11 +707,9 @@ class LocationsEventHandler:
         """
 
         # Print Warehouses at the Given City ID
-        getTask = asyncio.create_task(
-            self.__warehousesTable.get(aconn, BUILDINGS_FK_CITY, cityId)
+        warehousesList = await self.__warehousesTable.get(
+            aconn, BUILDINGS_FK_CITY, cityId
         )
-        await asyncio.gather(getTask)
-        warehousesList = getTask.result()
 
         if warehousesList == None:
             raise WarehouseNotFound(cityId)
@@ -752,7 +717,7 @@ class LocationsEventHandler:
         while True:
             try:
                 # Select Warehouse ID
-                buildingId = IntPrompt.ask("\nSelect Warehouse ID")
+                buildingId = await askIntPrompt("\nSelect Warehouse ID")
 
                 # Check if Building ID Exists
                 for w in warehousesList:
@@ -765,7 +730,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Press ENTER to Continue
-                Prompt.ask(PRESS_ENTER)
+                await askPrompt(PRESS_ENTER)
 
                 # Clear Terminal
                 clear()
@@ -784,11 +749,7 @@ class LocationsEventHandler:
         """
 
         # Print Branches at the Given City ID
-        getTask = asyncio.create_task(
-            self.__branchesTable.get(aconn, BUILDINGS_FK_CITY, cityId)
-        )
-        await asyncio.gather(getTask)
-        branchesList = getTask.result()
+        branchesList = await self.__branchesTable.get(aconn, BUILDINGS_FK_CITY, cityId)
 
         if branchesList == None:
             raise RowNotFound(BUILDINGS_TABLE_NAME, BUILDINGS_FK_CITY, cityId)
@@ -796,7 +757,7 @@ class LocationsEventHandler:
         while True:
             try:
                 # Select Branch ID
-                buildingId = IntPrompt.ask("\nSelect Branch ID")
+                buildingId = await askIntPrompt("\nSelect Branch ID")
 
                 # Check if Building ID Exists
                 for b in branchesList:
@@ -809,7 +770,7 @@ class LocationsEventHandler:
                 console.print(err, style="warning")
 
                 # Press ENTER to Continue
-                Prompt.ask(PRESS_ENTER)
+                await askPrompt(PRESS_ENTER)
 
                 # Clear Terminal
                 clear()
@@ -827,28 +788,26 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Connection from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnection())
-        await asyncio.gather(getTask)
-        aconn = getTask.result()
+        # Lease a Connection from the Asynchronous Pool
+        async with apool.lease(1) as aconns:
+            aconn = aconns[0]
 
-        # Asks if the User wants to Print it in Descending Order
-        desc = Confirm.ask(ALL_DESC_MSG)
+            # Asks if the User wants to Print it in Descending Order
+            desc = await askConfirm(ALL_DESC_MSG)
 
-        try:
             if tableName == COUNTRIES_TABLE_NAME:
                 # Ask the Sort Order
-                sortBy = Prompt.ask(
+                sortBy = await askPrompt(
                     ALL_SORT_BY_MSG,
                     choices=[COUNTRIES_ID, COUNTRIES_NAME, COUNTRIES_PHONE_PREFIX],
                 )
 
                 # Print Table
-                await asyncio.gather(self.__countriesTable.all(aconn, sortBy, desc))
+                await self.__countriesTable.all(aconn, sortBy, desc)
 
             elif tableName == REGIONS_TABLE_NAME:
                 # Ask the Sort Order
-                sortBy = Prompt.ask(
+                sortBy = await askPrompt(
                     ALL_SORT_BY_MSG,
                     choices=[
                         REGIONS_ID,
@@ -859,11 +818,11 @@ class LocationsEventHandler:
                 )
 
                 # Print Table
-                await asyncio.gather(self.__regionsTable.all(aconn, sortBy, desc))
+                await self.__regionsTable.all(aconn, sortBy, desc)
 
             elif tableName == CITIES_TABLE_NAME:
                 # Ask the Sort Order
-                sortBy = Prompt.ask(
+                sortBy = await askPrompt(
                     ALL_SORT_BY_MSG,
                     choices=[
                         CITIES_ID,
@@ -874,21 +833,21 @@ class LocationsEventHandler:
                 )
 
                 # Print Table
-                await asyncio.gather(self.__citiesTable.all(aconn, sortBy, desc))
+                await self.__citiesTable.all(aconn, sortBy, desc)
 
             elif tableName == WAREHOUSES_TABLE_NAME:
                 # Ask the Sort Order
-                sortBy = Prompt.ask(
+                sortBy = await askPrompt(
                     ALL_SORT_BY_MSG,
                     choices=[WAREHOUSES_ID, BUILDINGS_NAME, BUILDINGS_FK_CITY],
                 )
 
                 # Print Table
-                await asyncio.gather(self.__warehousesTable.all(aconn, sortBy, desc))
+                await self.__warehousesTable.all(aconn, sortBy, desc)
 
             elif tableName == BRANCHES_TABLE_NAME:
                 # Ask the Sort Order
-                sortBy = Prompt.ask(
+                sortBy = await askPrompt(
                     ALL_SORT_BY_MSG,
                     choices=[
                         BRANCHES_ID,
@@ -900,18 +859,10 @@ class LocationsEventHandler:
                 )
 
                 # Print Table
-                await asyncio.gather(self.__branchesTable.all(aconn, sortBy, desc))
-
-            # Put the Connection Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnection(aconn))
-
-        except Exception as err:
-            # Put the Connection Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnection(aconn))
-            raise err
+                await self.__branchesTable.all(aconn, sortBy, desc)
 
         # Press ENTER to Continue
-        Prompt.ask(PRESS_ENTER)
+        await askPrompt(PRESS_ENTER)
 
     async def _getHandler(self, apool: AsyncPool, tableName: str) -> None:
         """
@@ -925,166 +876,158 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Connection from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnection())
-        await asyncio.gather(getTask)
-        aconn = getTask.result()
+        # Lease a Connection in Autocommit Mode, so No Transaction is Left Open while Waiting for the User
+        async with apool.lease(1, autocommit=True) as aconns:
+            aconn = aconns[0]
 
-        while True:
-            try:
-                if tableName == COUNTRIES_TABLE_NAME:
-                    # Asks for Field to Compare
-                    field = Prompt.ask(
-                        GET_FIELD_MSG,
-                        choices=[COUNTRIES_ID, COUNTRIES_NAME, COUNTRIES_PHONE_PREFIX],
-                    )
+            while True:
+                try:
+                    if tableName == COUNTRIES_TABLE_NAME:
+                        # Asks for Field to Compare
+                        field = await askPrompt(
+                            GET_FIELD_MSG,
+                            choices=[
+                                COUNTRIES_ID,
+                                COUNTRIES_NAME,
+                                COUNTRIES_PHONE_PREFIX,
+                            ],
+                        )
 
-                    # Prompt to Ask the Value to be Compared
-                    if field == COUNTRIES_NAME:
-                        value = Prompt.ask(GET_VALUE_MSG)
+                        # Prompt to Ask the Value to be Compared
+                        if field == COUNTRIES_NAME:
+                            value = await askPrompt(GET_VALUE_MSG)
+
+                            isAddressValid(tableName, field, value)
+
+                        else:
+                            value = str(await askIntPrompt(GET_VALUE_MSG))
+
+                        # Print Table Coincidences
+                        await self.__countriesTable.get(aconn, field, value)
+
+                    elif tableName == REGIONS_TABLE_NAME:
+                        # Asks for Field to Compare
+                        field = await askPrompt(
+                            GET_FIELD_MSG,
+                            choices=[
+                                REGIONS_ID,
+                                REGIONS_FK_COUNTRY,
+                                REGIONS_NAME,
+                                REGIONS_FK_AIR_FORWARDER,
+                                REGIONS_FK_OCEAN_FORWARDER,
+                                REGIONS_FK_WAREHOUSE,
+                            ],
+                        )
 
-                        isAddressValid(tableName, field, value)
+                        # Prompt to Ask the Value to be Compared
+                        if field == REGIONS_NAME:
+                            value = await askPrompt(GET_VALUE_MSG)
 
-                    else:
-                        value = str(IntPrompt.ask(GET_VALUE_MSG))
+                            isAddressValid(tableName, field, value)
 
-                    # Print Table Coincidences
-                    await asyncio.gather(self.__countriesTable.get(aconn, field, value))
+                        else:
+                            value = str(await askIntPrompt(GET_VALUE_MSG))
 
-                elif tableName == REGIONS_TABLE_NAME:
-                    # Asks for Field to Compare
-                    field = Prompt.ask(
-                        GET_FIELD_MSG,
-                        choices=[
-                            REGIONS_ID,
-                            REGIONS_FK_COUNTRY,
-                            REGIONS_NAME,
-                            REGIONS_FK_AIR_FORWARDER,
-                            REGIONS_FK_OCEAN_FORWARDER,
-                            REGIONS_FK_WAREHOUSE,
-                        ],
-                    )
+                        # Print Table Coincidences
+                        await self.__regionsTable.get(aconn, field, value)
 
-                    # Prompt to Ask the Value to be Compared
-                    if field == REGIONS_NAME:
-                        value = Prompt.ask(GET_VALUE_MSG)
+                    elif tableName == CITIES_TABLE_NAME:
+                        # Asks for Field to Compare
+                        field = await askPrompt(
+                            GET_FIELD_MSG,
+                            choices=[
+                                CITIES_ID,
+                                CITIES_FK_REGION,
+                                CITIES_NAME,
+                                CITIES_FK_WAREHOUSE,
+                            ],
+                        )
 
-                        isAddressValid(tableName, field, value)
+                        # Prompt to Ask the Value to be Compared
+                        if field == CITIES_NAME:
+                            value = await askPrompt(GET_VALUE_MSG)
 
-                    else:
-                        value = str(IntPrompt.ask(GET_VALUE_MSG))
+                            isAddressValid(tableName, field, value)
 
-                    # Print Table Coincidences
-                    await asyncio.gather(self.__regionsTable.get(aconn, field, value))
+                        else:
+                            value = str(await askIntPrompt(GET_VALUE_MSG))
 
-                elif tableName == CITIES_TABLE_NAME:
-                    # Asks for Field to Compare
-                    field = Prompt.ask(
-                        GET_FIELD_MSG,
-                        choices=[
-                            CITIES_ID,
-                            CITIES_FK_REGION,
-                            CITIES_NAME,
-                            CITIES_FK_WAREHOUSE,
-                        ],
-                    )
+                        # Print Table Coincidences
+                        await self.__citiesTable.get(aconn, field, value)
 
-                    # Prompt to Ask the Value to be Compared
-                    if field == CITIES_NAME:
-                        value = Prompt.ask(GET_VALUE_MSG)
+                    elif tableName == WAREHOUSES_TABLE_NAME:
+                        # Asks for Field to Compare
+                        field = await askPrompt(
+                            GET_FIELD_MSG,
+                            choices=[
+                                WAREHOUSES_ID,
+                                BUILDINGS_NAME,
+                                BUILDINGS_PHONE,
+                                BUILDINGS_FK_CITY,
+                            ],
+                        )
 
-                        isAddressValid(tableName, field, value)
+                        # Prompt to Ask the Value to be Compared
+                        if field == BUILDINGS_NAME:
+                            value = await askPrompt(GET_VALUE_MSG)
 
-                    else:
-                        value = str(IntPrompt.ask(GET_VALUE_MSG))
+                            isAddressValid(tableName, field, value)
 
-                    # Print Table Coincidences
-                    await asyncio.gather(self.__citiesTable.get(aconn, field, value))
+                        else:
+                            value = str(await askIntPrompt(GET_VALUE_MSG))
 
-                elif tableName == WAREHOUSES_TABLE_NAME:
-                    # Asks for Field to Compare
-                    field = Prompt.ask(
-                        GET_FIELD_MSG,
-                        choices=[
-                            WAREHOUSES_ID,
-                            BUILDINGS_NAME,
-                            BUILDINGS_PHONE,
-                            BUILDINGS_FK_CITY,
-                        ],
-                    )
+                        # Print Table Coincidences
+                        await self.__warehousesTable.get(aconn, field, value)
 
-                    # Prompt to Ask the Value to be Compared
-                    if field == BUILDINGS_NAME:
-                        value = Prompt.ask(GET_VALUE_MSG)
+                    elif tableName == BRANCHES_TABLE_NAME:
+                        # Asks for Field to Compare
+                        field = await askPrompt(
+                            GET_FIELD_MSG,
+                            choices=[
+                                BRANCHES_ID,
+                                BRANCHES_FK_WAREHOUSE_CONNECTION,
+                                BUILDINGS_NAME,
+                                BUILDINGS_PHONE,
+                                BUILDINGS_FK_CITY,
+                            ],
+                        )
 
-                        isAddressValid(tableName, field, value)
+                        # Prompt to Ask the Value to be Compared
+                        if field == BUILDINGS_NAME:
+                            value = await askPrompt(GET_VALUE_MSG)
 
-                    else:
-                        value = str(IntPrompt.ask(GET_VALUE_MSG))
+                            isAddressValid(tableName, field, value)
 
-                    # Print Table Coincidences
-                    await asyncio.gather(
-                        self.__warehousesTable.get(aconn, field, value)
-                    )
+                        else:
+                            value = str(await askIntPrompt(GET_VALUE_MSG))
 
-                elif tableName == BRANCHES_TABLE_NAME:
-                    # Asks for Field to Compare
-                    field = Prompt.ask(
-                        GET_FIELD_MSG,
-                        choices=[
-                            BRANCHES_ID,
-                            BRANCHES_FK_WAREHOUSE_CONNECTION,
-                            BUILDINGS_NAME,
-                            BUILDINGS_PHONE,
-                            BUILDINGS_FK_CITY,
-                        ],
-                    )
+                        # Print Table Coincidences
+                        await self.__branchesTable.get(aconn, field, value)
 
-                    # Prompt to Ask the Value to be Compared
-                    if field == BUILDINGS_NAME:
-                        value = Prompt.ask(GET_VALUE_MSG)
+                    if await askConfirm("Do you want to Continue Searching?"):
+                        # Clear Terminal
+                        clear()
+                        continue
 
-                        isAddressValid(tableName, field, value)
+                    break
+
+                # Raise GoToMenu Error
+                except GoToMenu as err:
+                    raise err
 
-                    else:
-                        value = str(IntPrompt.ask(GET_VALUE_MSG))
+                # Go Back to the While-loop
+                except (LocationNotFound, PlaceError) as err:
+                    console.print(err, style="warning")
 
-                    # Print Table Coincidences
-                    await asyncio.gather(self.__branchesTable.get(aconn, field, value))
+                    # Press ENTER to Continue
+                    await askPrompt(PRESS_ENTER)
 
-                if Confirm.ask("Do you want to Continue Searching?"):
                     # Clear Terminal
                     clear()
-                    continue
-
-                # Put the Connection Back to the Asynchronous Pool
-                await asyncio.gather(apool.putConnection(aconn))
-                break
-
-            # Raise GoToMenu Error
-            except GoToMenu as err:
-                # Put the Connection Back to the Asynchronous Pool
-                await asyncio.gather(apool.putConnection(aconn))
-                raise err
-
-            # Go Back to the While-loop
-            except (LocationNotFound, PlaceError) as err:
-                console.print(err, style="warning")
-
-                # Press ENTER to Continue
-                Prompt.ask(PRESS_ENTER)
-
-                # Clear Terminal
-                clear()
-
-            except Exception as err:
-                # Put the Connection Back to the Asynchronous Pool
-                await asyncio.gather(apool.putConnection(aconn))
-                raise err
 
     async def _modHandler(self, apool: AsyncPool, tableName: str) -> None:
         """
-        Asynchronous Handler of ``mod`` Location-related Subcommand
+        Asynchronous Handler of ``mod`` Location-related Subcommand. The New Values and Route Distances are Collected before Opening the Transaction, so It Only Wraps the Writes
 
         :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
         :param str tableName: Location Table Name at the Remote Database
@@ -1094,65 +1037,50 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Three Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(3))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
+        # Lease a Connection in Autocommit Mode, so No Transaction is Left Open while Waiting for the User
+        async with apool.lease(1, autocommit=True) as aconns:
+            aconn = aconns[0]
 
-        try:
             if tableName == COUNTRIES_TABLE_NAME:
                 # Select Country ID to Modify
-                getTask = asyncio.create_task(self.getCountryId(aconns[0]))
-                await asyncio.gather(getTask)
-                countryId = getTask.result()
+                countryId = await self.getCountryId(aconn)
 
                 # Print Fetched Results
                 if (
-                    await asyncio.gather(
-                        self.__countriesTable.get(aconns[0], COUNTRIES_ID, countryId)
-                    )
+                    await self.__countriesTable.get(aconn, COUNTRIES_ID, countryId)
                     == None
                 ):
                     noCoincidence()
                     return
 
                 # Ask for Confirmation
-                if not Confirm.ask(MOD_CONFIRM_MSG):
+                if not await askConfirm(MOD_CONFIRM_MSG):
                     return
 
                 # Ask for Field to Modify
-                field = Prompt.ask(MOD_FIELD_MSG, choices=[COUNTRIES_PHONE_PREFIX])
+                field = await askPrompt(MOD_FIELD_MSG, choices=[COUNTRIES_PHONE_PREFIX])
 
                 # Prompt to Ask the New Value
                 if field == COUNTRIES_PHONE_PREFIX:
-                    value = str(IntPrompt.ask(MOD_VALUE_MSG))
+                    value = str(await askIntPrompt(MOD_VALUE_MSG))
 
                 # Modify Country
-                await asyncio.gather(
-                    self.__countriesTable.modify(aconns[0], countryId, field, value)
-                )
+                await self.__countriesTable.modify(aconn, countryId, field, value)
 
             elif tableName == REGIONS_TABLE_NAME:
                 # Select Region ID to Modify
-                getTask = asyncio.create_task(self.getRegionId(aconns[0]))
-                await asyncio.gather(getTask)
-                regionId = getTask.result()
+                regionId = await self.getRegionId(aconn)
 
                 # Print Fetched Results
-                if (
-                    await asyncio.gather(
-                        self.__regionsTable.get(aconns[0], REGIONS_ID, regionId)
-                    )
-                    == None
-                ):
+                if await self.__regionsTable.get(aconn, REGIONS_ID, regionId) == None:
                     return
 
                 # Ask for Confirmation
-                if not Confirm.ask(MOD_CONFIRM_MSG):
+                if not await askConfirm(MOD_CONFIRM_MSG):
                     return
 
                 # Ask for Field to Modify
-                field = Prompt.ask(
+                field = await askPrompt(
                     MOD_FIELD_MSG,
                     choices=[
                         REGIONS_FK_AIR_FORWARDER,
@@ -1166,113 +1094,82 @@ class LocationsEventHandler:
                     field == REGIONS_FK_AIR_FORWARDER
                     or field == REGIONS_FK_OCEAN_FORWARDER
                 ):
-                    value = str(IntPrompt.ask(MOD_VALUE_MSG))
+                    value = str(await askIntPrompt(MOD_VALUE_MSG))
 
                     # TO DEVELOP: CHECK AND CONFIRM FORWARDERS
 
+                    # Modify Region
+                    await self.__regionsTable.modify(aconn, regionId, field, value)
+
                 elif field == REGIONS_FK_WAREHOUSE:
                     # Select Warehouse ID
-                    getTask = asyncio.create_task(
-                        self.getRegionBuildingCityId(aconns[0], regionId)
-                    )
-                    await asyncio.gather(getTask)
-                    cityId = getTask.result()
-
-                    warehouseIdTask = asyncio.create_task(
-                        self.getWarehouseId(aconns[0], cityId)
-                    )
+                    cityId = await self.getRegionBuildingCityId(aconn, regionId)
+                    warehouseId = await self.getWarehouseId(aconn, cityId)
 
                     # Get Region Object
-                    regionTask = asyncio.create_task(
-                        self.__regionsTable.find(aconns[1], regionId)
-                    )
-
-                    tasks = [warehouseIdTask, regionTask]
-                    try:
-                        await asyncio.gather(*tasks)
-
-                    except Exception as err:
-                        cancelTasks(tasks)
-                        raise err
-
-                    warehouseId = warehouseIdTask.result()
-                    region = regionTask.result()
+                    region = await self.__regionsTable.find(aconn, regionId)
 
                     # Check if there's a Main Warehouse
                     currWarehouseId = region.warehouseId
 
                     if warehouseId == currWarehouseId:
-                        nothingToChange()
+                        await nothingToChange()
                         return
 
-                    warehouseDictTask = None
-
-                    async with asyncio.TaskGroup() as tg:
-                        # Remove the Old Region Main Warehouse from the Region Table
-                        tg.create_task(
-                            self.__regionsTable.modify(
-                                aconns[0], regionId, REGIONS_FK_WAREHOUSE, None
-                            )
-                        )
-
-                        # Drop Old Warehouse Connections with all the Main Region Warehouses at the Same Country and all thMain Region Warehouses at the Given Region
-                        tg.create_task(
-                            self.__warehouseConnsTable.removeRegionMainWarehouse(
-                                apool, regionId, currWarehouseId
-                            )
-                        )
-
-                        # Get Warehouse Dictionary from Warehouse ID
-                        warehouseDictTask = asyncio.create_task(
-                            self.__getWarehouseDict(aconns[1], warehouseId)
-                        )
-                        await asyncio.gather(warehouseDictTask)
+                    # Get Warehouse Dictionary from Warehouse ID
+                    warehouseDict = await self.__getWarehouseDict(aconn, warehouseId)
 
                     # Get Region Country ID
                     countryId = region.countryId
 
-                    warehouseDict = warehouseDictTask.result()
-
-                    # Add Warehouse Connections for the Current Warehouse with All the Main Region Warehouses at theGiven Country and all the Main Region Warehouses at the Given Region
-                    await asyncio.gather(
-                        self.__warehouseConnsTable.insertRegionMainWarehouse(
-                            apool,
-                            self.__ORSGeocoder,
+                    # Get Warehouse Connections for the Current Warehouse with All the Main Region Warehouses at the Given Country, but the Old One, and all the Main City Warehouses at the Given Region
+                    warehouseConns = (
+                        await self.__warehouseConnsTable.getRegionMainWarehouseConns(
+                            aconn,
+                            self.__distanceProvider,
                             countryId,
                             regionId,
                             warehouseDict,
+                            currWarehouseId,
                         )
                     )
 
-                    # Assign Warehouse ID to value
-                    value = warehouseDict[DICT_WAREHOUSE_ID]
+                    # Replace the Region Main Warehouse as a Single Transaction
+                    async with aconn.transaction():
+                        # Remove the Old Region Main Warehouse from the Region Table
+                        await self.__regionsTable.modify(
+                            aconn, regionId, REGIONS_FK_WAREHOUSE, None
+                        )
 
-                # Modify Region
-                await asyncio.gather(
-                    self.__regionsTable.modify(aconns[0], regionId, field, value)
-                )
+                        # Drop Old Warehouse Connections with all the Main Region Warehouses at the Same Country and all the Main City Warehouses at the Given Region
+                        await self.__warehouseConnsTable.removeRegionMainWarehouse(
+                            aconn, regionId, currWarehouseId
+                        )
+
+                        # Add the New Warehouse Connections
+                        await self.__warehouseConnsTable.insertWarehouseConns(
+                            aconn, warehouseConns
+                        )
+
+                        # Modify Region
+                        await self.__regionsTable.modify(
+                            aconn, regionId, field, warehouseDict[DICT_WAREHOUSE_ID]
+                        )
 
             elif tableName == CITIES_TABLE_NAME:
                 # Select City ID to Modify
-                getTask = asyncio.create_task(self.getCityId(aconns[0]))
-                await asyncio.gather(getTask)
-                cityId = getTask.result()
+                cityId = await self.getCityId(aconn)
 
                 # Print Fetched Results
-                if (
-                    await asyncio.gather(
-                        self.__citiesTable.get(aconns[0], CITIES_ID, cityId)
-                    )
-                    == None
-                ):
+                if await self.__citiesTable.get(aconn, CITIES_ID, cityId) == None:
                     return
 
                 # Ask for Confirmation
-                if not Confirm.ask(MOD_CONFIRM_MSG):
+                if not await askConfirm(MOD_CONFIRM_MSG):
                     return
 
                 # Ask for Field to Modify
-                field = Prompt.ask(
+                field = await askPrompt(
                     MOD_FIELD_MSG,
                     choices=[CITIES_FK_WAREHOUSE],
                 )
@@ -1280,25 +1177,10 @@ class LocationsEventHandler:
                 # Prompt to Ask the New Value
                 if field == CITIES_FK_WAREHOUSE:
                     # Select Warehouse ID
-                    warehouseIdTask = asyncio.create_task(
-                        self.getWarehouseId(aconns[0], cityId)
-                    )
+                    warehouseId = await self.getWarehouseId(aconn, cityId)
 
                     # Get City Object
-                    cityTask = asyncio.create_task(
-                        self.__citiesTable.find(aconns[1], cityId)
-                    )
-
-                    tasks = [warehouseIdTask, cityTask]
-                    try:
-                        await asyncio.gather(*tasks)
-
-                    except Exception as err:
-                        cancelTasks(tasks)
-                        raise err
-
-                    warehouseId = warehouseIdTask.result()
-                    city = cityTask.result()
+                    city = await self.__citiesTable.find(aconn, cityId)
 
                     # Get City Region ID
                     regionId = city.regionId
@@ -1307,143 +1189,99 @@ class LocationsEventHandler:
                     currWarehouseId = city.warehouseId
 
                     if warehouseId == currWarehouseId:
-                        nothingToChange()
+                        await nothingToChange()
                         return
 
-                    regionTask = warehouseDictTask = None
-
-                    async with asyncio.TaskGroup() as tg:
-                        # Remove the Old City Main Warehouse from the City Table
-                        tg.create_task(
-                            self.__citiesTable.modify(
-                                aconns[0], cityId, CITIES_FK_WAREHOUSE, None
-                            )
-                        )
-
-                        # Drop Old Warehouse Connections with the Main Region Warehouse, all the Main City Warehouses at theSame Region, and all the City Warehouses at the Given City
-                        tg.create_task(
-                            self.__warehouseConnsTable.removeCityMainWarehouse(
-                                apool, regionId, cityId, currWarehouseId
-                            )
-                        )
-
-                        # Get Region Main Warehouse ID
-                        regionTask = asyncio.create_task(
-                            self.__regionsTable.find(aconns[1], regionId)
-                        )
-
-                        # Get Warehouse Dictionary Fields from Warehouse ID
-                        warehouseDictTask = asyncio.create_task(
-                            self.__getWarehouseDict(aconns[2], warehouseId)
-                        )
-
-                        tasks = [regionTask, warehouseDictTask]
-                        try:
-                            await asyncio.gather(*tasks)
-
-                        except Exception as err:
-                            cancelTasks(tasks)
-                            raise err
-
-
-                    region = regionTask.result()
+                    # Get Region Main Warehouse ID
+                    region = await self.__regionsTable.find(aconn, regionId)
                     regionWarehouseId = region.warehouseId
 
-                    # Get Region Warehouse Dictionary Fields from Region Warehouse ID
-                    regionWarehouseDictTask = asyncio.create_task(
-                        self.__getWarehouseDict(aconns[0], regionWarehouseId)
+                    # Get Warehouse Dictionary Fields from Warehouse ID and Region Warehouse ID
+                    warehouseDict = await self.__getWarehouseDict(aconn, warehouseId)
+                    regionWarehouseDict = await self.__getWarehouseDict(
+                        aconn, regionWarehouseId
                     )
-                    await asyncio.gather(regionWarehouseDictTask)
-
-                    warehouseDict = warehouseDictTask.result()
-                    regionWarehouseDict = regionWarehouseDictTask.result()
 
-                    # Add Warehouse Connections for the Current Warehouse with the Main Region Warehouse, all the MainCity Warehouses at the Given Region and all the City Warehouses at the Given City
-                    await asyncio.gather(
-                        self.__warehouseConnsTable.insertCityMainWarehouse(
-                            apool,
-                            self.__ORSGeocoder,
+                    # Get Warehouse Connections for the Current Warehouse with the Main Region Warehouse, all the Main City Warehouses at the Given Region, but the Old One, and all the City Warehouses at the Given City
+                    warehouseConns = (
+                        await self.__warehouseConnsTable.getCityMainWarehouseConns(
+                            aconn,
+                            self.__distanceProvider,
                             regionId,
                             cityId,
                             regionWarehouseDict,
                             warehouseDict,
+                            currWarehouseId,
                         )
                     )
 
-                    # Assign Warehouse ID to value
-                    value = warehouseDict[DICT_WAREHOUSE_ID]
+                    # Replace the City Main Warehouse as a Single Transaction
+                    async with aconn.transaction():
+                        # Remove the Old City Main Warehouse from the City Table
+                        await self.__citiesTable.modify(
+                            aconn, cityId, CITIES_FK_WAREHOUSE, None
+                        )
+
+                        # Drop Old Warehouse Connections with the Main Region Warehouse, all the Main City Warehouses at the Same Region, and all the City Warehouses at the Given City
+                        await self.__warehouseConnsTable.removeCityMainWarehouse(
+                            aconn, regionId, cityId, currWarehouseId
+                        )
 
-                # Modify City
-                await asyncio.gather(
-                    self.__citiesTable.modify(aconns[0], cityId, field, value)
-                )
+                        # Add the New Warehouse Connections
+                        await self.__warehouseConnsTable.insertWarehouseConns(
+                            aconn, warehouseConns
+                        )
+
+                        # Modify City
+                        await self.__citiesTable.modify(
+                            aconn, cityId, field, warehouseDict[DICT_WAREHOUSE_ID]
+                        )
 
             elif tableName == WAREHOUSES_TABLE_NAME:
                 # Select Warehouse ID
-                getCityTask = asyncio.create_task(self.getCityId(aconns[0]))
-                await asyncio.gather(getCityTask)
-                cityId = getCityTask.result()
+                cityId = await self.getCityId(aconn)
 
-                getWarehouseTask = asyncio.create_task(
-                    self.getWarehouseId(aconns[0], cityId)
-                )
-                await asyncio.gather(getWarehouseTask)
-                warehouseId = getWarehouseTask.result()
+                warehouseId = await self.getWarehouseId(aconn, cityId)
 
                 # Print Fetched Results
                 if (
-                    await asyncio.gather(
-                        self.__warehousesTable.get(
-                            aconns[0], WAREHOUSES_ID, warehouseId
-                        )
-                    )
+                    await self.__warehousesTable.get(aconn, WAREHOUSES_ID, warehouseId)
                     == None
                 ):
                     return
 
                 # Ask for Confirmation
-                if not Confirm.ask(MOD_CONFIRM_MSG):
+                if not await askConfirm(MOD_CONFIRM_MSG):
                     return
 
                 # Ask for Field to Modify
-                field = Prompt.ask(
+                field = await askPrompt(
                     MOD_FIELD_MSG,
                     choices=[BUILDINGS_NAME, BUILDINGS_PHONE, BUILDINGS_EMAIL],
                 )
 
                 # Prompt to Ask the New Value
-                value = askBuildingValue(tableName, field)
+                value = await askBuildingValue(tableName, field)
 
                 # Modify Warehouse
-                await asyncio.gather(
-                    self.__warehousesTable.modify(aconns[0], warehouseId, field, value)
-                )
+                await self.__warehousesTable.modify(aconn, warehouseId, field, value)
 
             elif tableName == BRANCHES_TABLE_NAME:
                 # Select Branch ID
-                getCityTask = asyncio.create_task(self.getCityId(aconns[0]))
-                await asyncio.gather(getCityTask)
-                cityId = getCityTask.result()
+                cityId = await self.getCityId(aconn)
 
-                getBranchTask = asyncio.create_task(self.getBranchId(aconns[0], cityId))
-                await asyncio.gather(getBranchTask)
-                branchId = getBranchTask.result()
+                branchId = await self.getBranchId(aconn, cityId)
 
                 # Print Fetched Results
-                if (
-                    await asyncio.gather(
-                        self.__branchesTable.get(aconns[0], BRANCHES_ID, branchId)
-                    )
-                    == None
-                ):
+                if await self.__branchesTable.get(aconn, BRANCHES_ID, branchId) == None:
                     return
 
                 # Ask for Confirmation
-                if not Confirm.ask(MOD_CONFIRM_MSG):
+                if not await askConfirm(MOD_CONFIRM_MSG):
                     return
 
                 # Ask for Field to Modify
-                field = Prompt.ask(
+                field = await askPrompt(
                     MOD_FIELD_MSG,
                     choices=[
                         BRANCHES_FK_WAREHOUSE_CONNECTION,
@@ -1455,28 +1293,18 @@ class LocationsEventHandler:
 
                 # Prompt to Ask the New Value
                 if field != BRANCHES_FK_WAREHOUSE_CONNECTION:
-                    value = askBuildingValue(tableName, field)
+                    value = await askBuildingValue(tableName, field)
 
                     # Modify Branch
-                    await asyncio.gather(
-                        self.__branchesTable.modify(aconns[0], branchId, field, value)
-                    )
+                    await self.__branchesTable.modify(aconn, branchId, field, value)
 
                 else:
                     # Get Branch Object
-                    findBranchTask = asyncio.create_task(
-                        self.__branchesTable.find(aconns[0], branchId)
-                    )
-                    await asyncio.gather(findBranchTask)
-                    branch = findBranchTask.result()
+                    branch = await self.__branchesTable.find(aconn, branchId)
 
                     # Get City ID where the Branch is Located, and the Warehouse at the Given City
                     cityId = branch.cityId
-                    getWarehouseTask = asyncio.create_task(
-                        self.getWarehouseId(aconns[0], cityId)
-                    )
-                    await asyncio.gather(getWarehouseTask)
-                    warehouseId = getWarehouseTask.result()
+                    warehouseId = await self.getWarehouseId(aconn, cityId)
 
                     # Get Branch Coordinates
                     coords = {
@@ -1484,52 +1312,126 @@ class LocationsEventHandler:
                         NOMINATIM_LONGITUDE: branch.gpsLongitude,
                     }
 
-                    # Modify Branch
-                    modWarehouseTask = asyncio.create_task(
-                        self.__branchesTable.modify(
-                            aconns[0],
+                    # Get Route Distance
+                    routeDistance = await self.__getRouteDistance(
+                        aconn, warehouseId, coords
+                    )
+
+                    # Modify Branch Warehouse Connection and Route Distance Together
+                    async with aconn.transaction():
+                        await self.__branchesTable.modify(
+                            aconn,
                             branchId,
                             BRANCHES_FK_WAREHOUSE_CONNECTION,
                             warehouseId,
                         )
-                    )
+                        await self.__branchesTable.modify(
+                            aconn, branchId, BRANCHES_ROUTE_DISTANCE, routeDistance
+                        )
 
-                    # Get Route Distance
-                    getRouteTask = asyncio.create_task(
-                        self.__getRouteDistance(aconns[1], warehouseId, coords)
-                    )
-                    await asyncio.gather(getRouteTask)
-                    routeDistance = getRouteTask.result()
+        # Press ENTER to Continue
+        await askPrompt(PRESS_ENTER)
 
-                    await asyncio.gather(modWarehouseTask)
-                    await asyncio.gather(
-                        self.__branchesTable.modify(
-                            aconns[0], branchId, BRANCHES_ROUTE_DISTANCE, routeDistance
-                        )
-                    )
+    async def __addWarehouse(self, aconn, location: dict, buildingName: str) -> None:
+        """
+        Asynchronous Method to Insert a New Warehouse and its Warehouse Connections. It's Set as the Main Warehouse of its Region and its City if They don't have One. The Warehouse Fields and the Route Distances are Collected before Opening the Transaction, so It Only Wraps the Writes
 
-            # Commit
-            tasks = []
-            for aconn in aconns:
-                tasks.append(asyncio.create_task(aconn.commit()))
+        :param aconn: Asynchronous Pool Connection with the Remote Database, in Autocommit Mode
+        :param dict location: Location Dictionary that Contains All the Information Related to the Warehouse Location
+        :param str buildingName: Warehouse Name to Insert
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
 
-            try:
-                await asyncio.gather(*tasks)
+        # Ask for the Other Warehouse Fields
+        buildingFields = await self.__warehousesTable.askFields(
+            aconn, location, buildingName
+        )
 
-            except Exception as err:
-                cancelTasks(tasks)
-                raise err
+        # Get Warehouse Dictionary. Its ID is Set once It's Inserted
+        warehouseDict = {
+            DICT_WAREHOUSE_ID: None,
+            DICT_WAREHOUSE_COORDS: {
+                NOMINATIM_LATITUDE: location[NOMINATIM_LATITUDE],
+                NOMINATIM_LONGITUDE: location[NOMINATIM_LONGITUDE],
+            },
+        }
+        warehouseConns = []
+
+        # Check if there's a Main Warehouse at the Region ID where It's Located
+        region = await self.__regionsTable.find(aconn, location[DICT_REGION_ID])
+        isRegionMain = region.warehouseId == None
+
+        if isRegionMain:
+            warehouseConns += (
+                await self.__warehouseConnsTable.getRegionMainWarehouseConns(
+                    aconn,
+                    self.__distanceProvider,
+                    location[DICT_COUNTRY_ID],
+                    location[DICT_REGION_ID],
+                    warehouseDict,
+                )
+            )
+            parentWarehouseDict = warehouseDict
 
-            # Put the Connections Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnections(aconns))
+        else:
+            parentWarehouseDict = await self.__getWarehouseDict(
+                aconn, region.warehouseId
+            )
 
-        except Exception as err:
-            # Put the Connections Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnections(aconns))
-            raise err
+        # Check if there's a Main Warehouse at the City ID where It's Located
+        city = await self.__citiesTable.find(aconn, location[DICT_CITY_ID])
+        isCityMain = city.warehouseId == None
+
+        if isCityMain:
+            warehouseConns += (
+                await self.__warehouseConnsTable.getCityMainWarehouseConns(
+                    aconn,
+                    self.__distanceProvider,
+                    location[DICT_REGION_ID],
+                    location[DICT_CITY_ID],
+                    parentWarehouseDict,
+                    warehouseDict,
+                )
+            )
 
-        # Press ENTER to Continue
-        Prompt.ask(PRESS_ENTER)
+        else:
+            parentWarehouseDict = await self.__getWarehouseDict(aconn, city.warehouseId)
+
+            # Get City Warehouse Connection
+            warehouseConns += await self.__warehouseConnsTable.getCityWarehouseConns(
+                self.__distanceProvider,
+                parentWarehouseDict,
+                warehouseDict,
+            )
+
+        # Insert the Warehouse and its Connections as a Single Transaction
+        async with aconn.transaction():
+            warehouseId = await self.__warehousesTable.add(
+                aconn, location, buildingName, buildingFields
+            )
+            warehouseDict[DICT_WAREHOUSE_ID] = warehouseId
+
+            await self.__warehouseConnsTable.insertWarehouseConns(aconn, warehouseConns)
+
+            # Set as Main Region Warehouse
+            if isRegionMain:
+                await self.__regionsTable.modify(
+                    aconn,
+                    location[DICT_REGION_ID],
+                    REGIONS_FK_WAREHOUSE,
+                    warehouseId,
+                )
+
+            # Set as Main City Warehouse
+            if isCityMain:
+                await self.__citiesTable.modify(
+                    aconn,
+                    location[DICT_CITY_ID],
+                    CITIES_FK_WAREHOUSE,
+                    warehouseId,
+                )
 
     async def _addHandler(self, apool: AsyncPool, tableName: str) -> None:
         """
@@ -1542,16 +1444,14 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Three Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(3))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
+        # Lease a Connection in Autocommit Mode, so No Transaction is Left Open while Waiting for the User. Single-Statement Insertions are Committed on their Own
+        async with apool.lease(1, autocommit=True) as aconns:
+            aconn = aconns[0]
 
-        try:
             while True:
                 if tableName == COUNTRIES_TABLE_NAME:
                     # Get the Country Name to Insert
-                    location = self.getCountryName()
+                    location = await self.getCountryName()
 
                     if location == None:
                         return
@@ -1559,17 +1459,13 @@ class LocationsEventHandler:
                     countryName = location[DICT_COUNTRY_NAME]
 
                     # Ask for the Other Country Fields and Insert the Country to Its Table
-                    await asyncio.gather(
-                        self.__countriesTable.add(aconns[0], countryName)
-                    )
+                    await self.__countriesTable.add(aconn, countryName)
 
                     return
 
                 elif tableName == REGIONS_TABLE_NAME:
                     # Get the Region Name to Insert and the Country ID where It's Located
-                    getTask = asyncio.create_task(self.getRegionName(aconns[0]))
-                    await asyncio.gather(getTask)
-                    location = getTask.result()
+                    location = await self.getRegionName(aconn)
 
                     if location == None:
                         return
@@ -1578,15 +1474,11 @@ class LocationsEventHandler:
                     regionName = location[DICT_REGION_NAME]
 
                     # Ask for the Other Region Fields and Insert the Region to Its Table
-                    await asyncio.gather(
-                        self.__regionsTable.add(aconns[0], provinceId, regionName)
-                    )
+                    await self.__regionsTable.add(aconn, provinceId, regionName)
 
                 elif tableName == CITIES_TABLE_NAME:
                     # Get the City Name to Insert and the Region ID where It's Located
-                    getTask = asyncio.create_task(self.getCityName(aconns[0]))
-                    await asyncio.gather(getTask)
-                    location = getTask.result()
+                    location = await self.getCityName(aconn)
 
                     if location == None:
                         return
@@ -1595,196 +1487,55 @@ class LocationsEventHandler:
                     cityName = location[DICT_CITY_NAME]
 
                     # Ask for the Other City Fields and Insert the City to Its Table
-                    await asyncio.gather(
-                        self.__citiesTable.add(aconns[0], regionId, cityName)
-                    )
+                    await self.__citiesTable.add(aconn, regionId, cityName)
 
                 elif (
                     tableName == WAREHOUSES_TABLE_NAME
                     or tableName == BRANCHES_TABLE_NAME
                 ):
                     # Get Building Coordinates
-                    getTask = asyncio.create_task(self.getPlaceCoordinates(aconns[0]))
-                    await asyncio.gather(getTask)
-                    location = getTask.result()
+                    location = await self.getPlaceCoordinates(aconn)
 
                     if location == None:
                         return
 
                     # Get Building Name
-                    buildingName = Prompt.ask("Enter Building Name")
+                    buildingName = await askPrompt("Enter Building Name")
 
                     # Check Building Name
                     isAddressValid(tableName, BUILDINGS_NAME, buildingName)
 
                     if tableName == WAREHOUSES_TABLE_NAME:
-                        # Ask for the Other Warehouse Fields and Insert the Warehouse to Its Table
-                        insertTask = asyncio.create_task(
-                            self.__warehousesTable.add(
-                                aconns[0], location, buildingName
-                            )
-                        )
-
-                        # Get Warehouse Dictionary
-                        warehouseDictTask = asyncio.create_task(
-                            self.__getWarehouseDict(aconns[1], warehouseId)
-                        )
-
-                        # Check if there's a Main Warehouse at the Region ID where It's Located
-                        regionTask = asyncio.create_task(
-                            self.__regionsTable.find(
-                                aconns[2], location[DICT_REGION_ID]
-                            )
-                        )
-
-                        tasks = [insertTask, warehouseDictTask, regionTask]
-                        try:
-                            await asyncio.gather(*tasks)
-
-                        except Exception as err:
-                            cancelTasks(tasks)
-                            raise err
-
-                        warehouseId = insertTask.result()
-                        warehouseDict = warehouseDictTask.result()
-                        region = regionTask.result()
-
-                        parentWarehouseDict = None
-
-                        async with asyncio.TaskGroup() as tg:
-                            if region.warehouseId == None:
-                                tg.create_task(
-                                    self.__warehouseConnsTable.insertRegionMainWarehouse(
-                                        apool,
-                                        self.__ORSGeocoder,
-                                        location[DICT_COUNTRY_ID],
-                                        location[DICT_REGION_ID],
-                                        warehouseDict,
-                                    )
-                                )
-                                parentWarehouseDict = warehouseDict
-
-                                # Set as Main Region Warehouse
-                                tg.create_task(
-                                    self.__regionsTable.modify(
-                                        aconns[0],
-                                        location[DICT_REGION_ID],
-                                        REGIONS_FK_WAREHOUSE,
-                                        warehouseId,
-                                    )
-                                )
-
-                            else:
-                                getTask = asyncio.create_task(
-                                    self.__getWarehouseDict(
-                                        aconns[0], region.warehouseId
-                                    )
-                                )
-                                await asyncio.gather(getTask)
-                                parentWarehouseDict = getTask.result()
-
-                            # Check if there's a Main Warehouse at the City ID where It's Located
-                            findTask = asyncio.create_task(
-                                self.__citiesTable.find(
-                                    aconns[1], location[DICT_CITY_ID]
-                                )
-                            )
-                            await asyncio.gather(findTask)
-                            city = findTask.result()
-
-                            if city.warehouseId == None:
-                                tg.create_task(
-                                    self.__warehouseConnsTable.insertCityMainWarehouse(
-                                        apool,
-                                        self.__ORSGeocoder,
-                                        location[DICT_REGION_ID],
-                                        location[DICT_CITY_ID],
-                                        parentWarehouseDict,
-                                        warehouseDict,
-                                    )
-                                )
-                                parentWarehouseDict = warehouseDict
-
-                                # Set as Main City Warehouse
-                                tg.create_task(
-                                    self.__citiesTable.modify(
-                                        aconns[1],
-                                        location[DICT_CITY_ID],
-                                        CITIES_FK_WAREHOUSE,
-                                        warehouseId,
-                                    )
-                                )
-
-                            else:
-                                getTask = asyncio.create_task(
-                                    self.__getWarehouseDict(aconns[1], city.warehouseId)
-                                )
-                                await asyncio.gather(getTask)
-                                parentWarehouseDict = getTask.result()
-
-                                # Insert City Warehouse Connection
-                                await asyncio.gather(
-                                    self.__warehouseConnsTable.insertCityWarehouse(
-                                        apool,
-                                        self.__ORSGeocoder,
-                                        parentWarehouseDict,
-                                        warehouseDict,
-                                    )
-                                )
+                        # Insert the Warehouse and its Connections
+                        await self.__addWarehouse(aconn, location, buildingName)
 
                     elif tableName == BRANCHES_TABLE_NAME:
                         # Get Warehouse at the Given City
-                        getWarehouseTask = asyncio.create_task(
-                            self.getWarehouseId(aconns[0], location[DICT_CITY_ID])
+                        warehouseId = await self.getWarehouseId(
+                            aconn, location[DICT_CITY_ID]
                         )
-                        await asyncio.gather(getWarehouseTask)
-                        warehouseId = getWarehouseTask.result()
 
                         # Get Route Distance
-                        getRouteTask = asyncio.create_task(
-                            self.__getRouteDistance(aconns[0], warehouseId, location)
+                        routeDistance = await self.__getRouteDistance(
+                            aconn, warehouseId, location
                         )
-                        await asyncio.gather(getRouteTask)
-                        routeDistance = getRouteTask.result()
 
                         # Ask for the Other Branch Fields and Insert the Branch to Its Table
-                        await asyncio.gather(
-                            self.__branchesTable.add(
-                                aconns[0],
-                                location,
-                                buildingName,
-                                warehouseId,
-                                routeDistance,
-                            )
+                        await self.__branchesTable.add(
+                            aconn,
+                            location,
+                            buildingName,
+                            warehouseId,
+                            routeDistance,
                         )
 
                 # Ask to Add More
-                if not Confirm.ask(ADD_MORE_MSG):
+                if not await askConfirm(ADD_MORE_MSG):
                     break
 
-                # Commit
-                tasks = []
-                for aconn in aconns:
-                    tasks.append(asyncio.create_task(aconn.commit()))
-
                 # Clear Terminal
                 clear()
 
-                try:
-                    await asyncio.gather(*tasks)
-
-                except Exception as err:
-                    cancelTasks(tasks)
-                    raise err
-
-            # Put the Connections Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnections(aconns))
-
-        except Exception as err:
-            # Put the Connections Back to the Asynchronous Pool
-            await asyncio.gather(apool.putConnections(aconns))
-            raise err
-
     async def _rmHandler(self, apool: AsyncPool, tableName: str) -> None:
         """
         Asynchronous Handler of ``rm`` Location-related Subcommand
@@ -1797,151 +1548,113 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get the Connection from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnection())
-        await asyncio.gather(getTask)
-        aconn = getTask.result()
-
-        if tableName == COUNTRIES_TABLE_NAME:
-            # Select Country ID to Remove
-            getTask = asyncio.create_task(self.getCountryId(aconn))
-            await asyncio.gather(getTask)
-            countryId = getTask.result()
-
-            # Print Fetched Results
-            if (
-                await asyncio.gather(
-                    self.__countriesTable.get(aconn, COUNTRIES_ID, countryId)
-                )
-                == None
-            ):
-                return
-
-            # Ask for Confirmation
-            if not Confirm.ask(RM_CONFIRM_MSG):
-                return
-
-            await asyncio.gather(self.__countriesTable.remove(aconn, countryId))
-
-        elif tableName == REGIONS_TABLE_NAME:
-            # Select Region ID to Remove
-            getTask = asyncio.create_task(self.getRegionId())
-            await asyncio.gather(getTask)
-            regionId = getTask.result()
-
-            # Print Fetched Results
-            if (
-                await asyncio.gather(
-                    self.__regionsTable.get(aconn, REGIONS_ID, regionId)
-                )
-                == None
-            ):
-                return
-
-            # Ask for Confirmation
-            if not Confirm.ask(RM_CONFIRM_MSG):
-                return
-
-            await asyncio.gather(self.__regionsTable.remove(aconn, regionId))
-
-        elif tableName == CITIES_TABLE_NAME:
-            # Select City ID to Remove
-            getTask = asyncio.create_task(self.getCityId)
-            await asyncio.gather(getTask)
-            cityId = getTask.result()
-
-            # Print Fetched Results
-            if (
-                await asyncio.gather(self.__citiesTable.get(aconn, CITIES_ID, cityId))
-                == None
-            ):
-                return
-
-            # Ask for Confirmation
-            if not Confirm.ask(RM_CONFIRM_MSG):
-                return
-
-            await asyncio.gather(self.__citiesTable.remove(aconn, cityId))
-
-        elif tableName == WAREHOUSES_TABLE_NAME:
-            # Select Warehouse ID to Remove
-            getCityTask = asyncio.create_task(self.getCityId(aconn))
-            await asyncio.gather(getCityTask)
-            cityId = getCityTask.result()
-
-            getWarehouseTask = asyncio.create_task(self.getWarehouseId(aconn, cityId))
-            await asyncio.gather(getWarehouseTask)
-            warehouseId = getWarehouseTask.result()
-
-            # Print Fetched Results
-            if (
-                await asyncio.gather(
-                    self.__warehousesTable.get(aconn, WAREHOUSES_ID, warehouseId)
-                )
-                == None
-            ):
-                return
+        # Lease a Connection in Autocommit Mode, so No Transaction is Left Open while Waiting for the User
+        async with apool.lease(1, autocommit=True) as aconns:
+            aconn = aconns[0]
 
-            # Ask for Confirmation
-            if not Confirm.ask(RM_CONFIRM_MSG):
-                return
+            if tableName == COUNTRIES_TABLE_NAME:
+                # Select Country ID to Remove
+                countryId = await self.getCountryId(aconn)
 
-            # Check if it's the Main Warehouse at Any Location
-            isMainTask = asyncio.create_task(
-                self.__warehouseConnsTable.isMainWarehouse(aconn.cursor(), warehouseId)
-            )
-            await asyncio.gather(isMainTask)
-            location = isMainTask.result()
+                # Print Fetched Results
+                if (
+                    await self.__countriesTable.get(aconn, COUNTRIES_ID, countryId)
+                    == None
+                ):
+                    return
+
+                # Ask for Confirmation
+                if not await askConfirm(RM_CONFIRM_MSG):
+                    return
 
-            if location != None:
-                locationTableName, locationId = location
-                raise MainWarehouseError(locationTableName, locationId)
+                await self.__countriesTable.remove(aconn, countryId)
 
-            else:
-                # Remove City Warehouse Connections
-                await asyncio.gather(
-                    self.__warehouseConnsTable.removeCityWarehouse(
-                        aconn.cursor(), warehouseId
-                    )
-                )
+            elif tableName == REGIONS_TABLE_NAME:
+                # Select Region ID to Remove
+                regionId = await self.getRegionId(aconn)
 
-                # Remove Warehouse
-                await asyncio.gather(self.__warehousesTable.remove(aconn, warehouseId))
+                # Print Fetched Results
+                if await self.__regionsTable.get(aconn, REGIONS_ID, regionId) == None:
+                    return
 
-        elif tableName == BRANCHES_TABLE_NAME:
-            # Select Branch ID to Remove
-            getCityTask = asyncio.create_task(self.getCityId(aconn))
-            await asyncio.gather(getCityTask)
-            cityId = getCityTask.result()
+                # Ask for Confirmation
+                if not await askConfirm(RM_CONFIRM_MSG):
+                    return
 
-            getBranchTask = asyncio.create_task(self.getBranchId(aconn, cityId))
-            await asyncio.gather(getBranchTask)
-            branchId = getBranchTask.result()
+                await self.__regionsTable.remove(aconn, regionId)
 
-            # Print Fetched Results
-            if (
-                await asyncio.gather(
-                    self.__branchesTable.get(aconn, BRANCHES_ID, branchId)
+            elif tableName == CITIES_TABLE_NAME:
+                # Select City ID to Remove
+                cityId = await self.getCityId(aconn)
+
+                # Print Fetched Results
+                if await self.__citiesTable.get(aconn, CITIES_ID, cityId) == None:
+                    return
+
+                # Ask for Confirmation
+                if not await askConfirm(RM_CONFIRM_MSG):
+                    return
+
+                await self.__citiesTable.remove(aconn, cityId)
+
+            elif tableName == WAREHOUSES_TABLE_NAME:
+                # Select Warehouse ID to Remove
+                cityId = await self.getCityId(aconn)
+
+                warehouseId = await self.getWarehouseId(aconn, cityId)
+
+                # Print Fetched Results
+                if (
+                    await self.__warehousesTable.get(aconn, WAREHOUSES_ID, warehouseId)
+                    == None
+                ):
+                    return
+
+                # Ask for Confirmation
+                if not await askConfirm(RM_CONFIRM_MSG):
+                    return
+
+                # Check if it's the Main Warehouse at Any Location
+                location = await self.__warehouseConnsTable.isMainWarehouse(
+                    aconn.cursor(), warehouseId
                 )
-                == None
-            ):
-                return
 
-            # Ask for Confirmation
-            if not Confirm.ask(RM_CONFIRM_MSG):
-                return
+                if location != None:
+                    locationTableName, locationId = location
+                    raise MainWarehouseError(locationTableName, locationId)
 
-            await asyncio.gather(self.__branchesTable.remove(aconn, branchId))
+                # Remove the Warehouse and its Connections as a Single Transaction
+                async with aconn.transaction():
+                    # Remove City Warehouse Connections
+                    await self.__warehouseConnsTable.removeCityWarehouse(
+                        aconn.cursor(), warehouseId
+                    )
+
+                    # Remove Warehouse
+                    await self.__warehousesTable.remove(aconn, warehouseId)
+
+            elif tableName == BRANCHES_TABLE_NAME:
+                # Select Branch ID to Remove
+                cityId = await self.getCityId(aconn)
 
-        # Put the Connection Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnection(aconn))
+                branchId = await self.getBranchId(aconn, cityId)
+
+                # Print Fetched Results
+                if await self.__branchesTable.get(aconn, BRANCHES_ID, branchId) == None:
+                    return
+
+                # Ask for Confirmation
+                if not await askConfirm(RM_CONFIRM_MSG):
+                    return
+
+                await self.__branchesTable.remove(aconn, branchId)
 
         # Press ENTER to Continue
-        Prompt.ask(PRESS_ENTER)
+        await askPrompt(PRESS_ENTER)
 
-    def dbHandler(self, apool: AsyncPool, action: str, tableName: str) -> None:
+    async def dbHandler(self, apool: AsyncPool, action: str, tableName: str) -> None:
         """
-        Database Handler of ``add``, ``all``, ``get``, ``mod`` and ``rm`` Location-related Subcommands
+        Asynchronous Database Handler of ``add``, ``all``, ``get``, ``mod`` and ``rm`` Location-related Subcommands
 
         :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
         :param str action: Location-related Command (``add``, ``all``, ``get``, ``mod`` or ``rm``)
@@ -1951,20 +1664,26 @@ class LocationsEventHandler:
         :raises Exception: Raised when Something Occurs at Command Execution
         """
 
-        if action == DB_ADD:
-            asyncio.run(self._addHandler(apool, tableName))
+        try:
+            if action == DB_ADD:
+                await self._addHandler(apool, tableName)
+
+            elif action == DB_GET:
+                await self._getHandler(apool, tableName)
 
-        elif action == DB_GET:
-            asyncio.run(self._getHandler(apool, tableName))
+            elif action == DB_ALL:
+                await self._allHandler(apool, tableName)
 
-        elif action == DB_ALL:
-            asyncio.run(self._allHandler(apool, tableName))
+            elif action == DB_MOD:
+                await self._modHandler(apool, tableName)
 
-        elif action == DB_MOD:
-            asyncio.run(self._modHandler(apool, tableName))
+            elif action == DB_RM:
+                await self._rmHandler(apool, tableName)
 
-        elif action == DB_RM:
-            asyncio.run(self._rmHandler(apool, tableName))
+        finally:
+            # Writes can Change the Location Hierarchy, even from the Buildings Tables through its Main Warehouses
+            if action in (DB_ADD, DB_MOD, DB_RM):
+                self.__locationsCache.invalidate()
 
     async def graphHandler(self, apool: AsyncPool, graphType: str, level: str) -> None:
         """
@@ -1980,92 +1699,64 @@ class LocationsEventHandler:
 
         global rushWGraph
 
+        from ..graph.warehouses import RushWGraph
+
         # Select Graph Layout
-        layout = Prompt.ask("Select a Layout", choices=LAYOUT_CMDS)
+        layout = await askPrompt("Select a Layout", choices=LAYOUT_CMDS)
 
-        # Get Connection from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnection())
-        await asyncio.gather(getTask)
-        aconn = getTask.result()
+        # Lease a Connection in Autocommit Mode, so No Transaction is Left Open while Waiting for the User
+        async with apool.lease(1, autocommit=True) as aconns:
+            aconn = aconns[0]
 
-        # Check the Graph Type Command
-        if graphType == WAREHOUSES_TABLE_NAME:
-            # Check if the Given Graph is Initialized
-            if rushWGraph == None:
-                initTask = asyncio.create_task(RushWGraph.create(apool, True))
-                await asyncio.gather(initTask)
-                rushWGraph = initTask.result()
+            # Check the Graph Type Command
+            if graphType == WAREHOUSES_TABLE_NAME:
+                # Check if the Given Graph is Initialized
+                if rushWGraph == None:
+                    rushWGraph = await RushWGraph.create(apool, True)
 
-            # Update the Graph
-            else:
-                await asyncio.gather(rushWGraph.update(apool))
+                # Update the Graph
+                else:
+                    await rushWGraph.update(apool)
 
-            warehouseIds = None
-            locationId = None
+                warehouseIds = None
+                locationId = None
 
-            if level == COUNTRIES_TABLE_NAME:
-                # Select Country ID
-                getTask = asyncio.create_task(self.getCountryId(aconn))
-                await asyncio.gather(getTask)
-                locationId = countryId = getTask.result()
-
-                # Get the Region Main Warehouse IDs at the Given Country
-                warehouseTask = asyncio.create_task(
-                    self.__warehouseConnsTable.getRegionMainWarehouseIds(
-                        aconn.cursor(), countryId
-                    )
-                )
-                await asyncio.gather(warehouseTask)
-                warehouseIds = warehouseTask.result()
+                if level == COUNTRIES_TABLE_NAME:
+                    # Select Country ID
+                    locationId = countryId = await self.getCountryId(aconn)
 
-            elif level == REGIONS_TABLE_NAME:
-                # Select Region ID
-                getTask = asyncio.create_task(self.getRegionId(aconn))
-                await asyncio.gather(getTask)
-                locationId = regionId = getTask.result()
-
-                # Get the City Main Warehouse IDs at the Given Region
-                warehouseTask = asyncio.create_task(
-                    self.__warehouseConnsTable.getCityMainWarehouseIds(
-                        aconn.cursor(), regionId
+                    # Get the Region Main Warehouse IDs at the Given Country
+                    warehouseIds = (
+                        await self.__warehouseConnsTable.getRegionMainWarehouseIds(
+                            aconn.cursor(), countryId
+                        )
                     )
-                )
-                # Get the Region Main Warehouse ID
-                findTask = asyncio.create_task(
-                    self.__regionsTable.find(aconn, regionId)
-                )
 
-                tasks = [warehouseTask, findTask]
-                try:
-                    await asyncio.gather(*tasks)
+                elif level == REGIONS_TABLE_NAME:
+                    # Select Region ID
+                    locationId = regionId = await self.getRegionId(aconn)
 
-                except Exception as err:
-                    cancelTasks(tasks)
-                    raise err
+                    # Get the City Main Warehouse IDs at the Given Region
+                    warehouseIds = (
+                        await self.__warehouseConnsTable.getCityMainWarehouseIds(
+                            aconn.cursor(), regionId
+                        )
+                    )
 
-                warehouseIds = warehouseTask.result()
-                region = findTask.result()
+                    # Get the Region Main Warehouse ID
+                    region = await self.__regionsTable.find(aconn, regionId)
 
-                # Add the Region Main Warehouse ID
-                warehouseIds.append(region.warehouseId)
+                    # Add the Region Main Warehouse ID
+                    warehouseIds.append(region.warehouseId)
 
-            elif level == CITIES_TABLE_NAME:
-                # Select City ID
-                getTask = asyncio.create_task(self.getCityId(aconn))
-                await asyncio.gather(getTask)
-                locationId = cityId = getTask.result()
+                elif level == CITIES_TABLE_NAME:
+                    # Select City ID
+                    locationId = cityId = await self.getCityId(aconn)
 
-                # Get the Warehouse IDs at the Given City
-                warehouseTask = asyncio.create_task(
-                    self.__warehouseConnsTable.getCityWarehouseIds(
+                    # Get the Warehouse IDs at the Given City
+                    warehouseIds = await self.__warehouseConnsTable.getCityWarehouseIds(
                         aconn.cursor(), cityId
                     )
-                )
-                await asyncio.gather(warehouseTask)
-                warehouseIds = warehouseTask.result()
-
-            # Draw the Graph with the Given Warehouse IDs and Layout. Store it Locally
-            rushWGraph.draw(layout, level, locationId, warehouseIds)
 
-        # Put the Connection Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnection(aconn))
+                # Draw the Graph with the Given Warehouse IDs and Layout. Store it Locally
+                rushWGraph.draw(layout, level, locationId, warehouseIds)
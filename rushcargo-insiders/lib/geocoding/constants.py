@@ -29,6 +29,33 @@ ORS_PROFILE_DRIVING = "driving-car"
 ORS_PREF_FASTEST = "fastest"
 ORS_PREFERENCE_SHORTEST="shortest"
 
+# Open Routine Service Requests Limits. The Rate Limit is in Requests per Minute, Matching the ORS Directions Quota
+ORS_MAX_WORKERS = 8
+ORS_RATE_LIMIT = 40
+
+# Open Routine Service Matrix Fields and Limits. Each Request can't Contain more than the Given Number of Locations, and It has its Own Quota
+ORS_METRIC_DISTANCE = "distance"
+ORS_MATRIX_MAX_LOCATIONS = 50
+ORS_MATRIX_RATE_LIMIT = 40
+
+# Route Distances Cache Keys. Directions are Requested as the Shortest Route, while the Matrix Returns the Default Driving Route, so They're Stored Apart
+ORS_CACHE_DIRECTIONS = f"{ORS_PROFILE_DRIVING}:{ORS_PREFERENCE_SHORTEST}"
+ORS_CACHE_MATRIX = f"{ORS_PROFILE_DRIVING}:matrix"
+
+# Open Routine Service Error Codes that Mean there's no Route between the Given Points. Any Other Error is Raised
+ORS_ERROR_POINT_NOT_FOUND = 2010
+ORS_ERROR_ROUTE_NOT_FOUND = 2009
+ORS_NO_ROUTE_ERRORS = [ORS_ERROR_POINT_NOT_FOUND, ORS_ERROR_ROUTE_NOT_FOUND]
+
+# Route Distance Providers. The Offline One Estimates the Route Distances without Network Access
+DISTANCE_PROVIDER_ORS = "ors"
+DISTANCE_PROVIDER_OFFLINE = "offline"
+DISTANCE_PROVIDERS = [DISTANCE_PROVIDER_ORS, DISTANCE_PROVIDER_OFFLINE]
+
+# Offline Route Distance Estimation. The Great-Circle Distance is Multiplied by the Detour Factor, that's the Usual Ratio between Road and Straight-Line Distances
+OFFLINE_EARTH_RADIUS = 6371008.8
+OFFLINE_DETOUR_FACTOR = 1.3
+
 # Warehouse Connection Dictionary Fields from a Given Main Warehouses View
 DICT_WAREHOUSE_COORDS = "coords"
 DICT_WAREHOUSE_ID = "warehouse_id"
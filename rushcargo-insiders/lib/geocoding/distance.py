@@ -0,0 +1,163 @@
+from abc import ABC, abstractmethod
+
+from .constants import (
+    DISTANCE_PROVIDER_ORS,
+    DISTANCE_PROVIDER_OFFLINE,
+    DISTANCE_PROVIDERS,
+    NOMINATIM_LATITUDE,
+    NOMINATIM_LONGITUDE,
+    OFFLINE_EARTH_RADIUS,
+    OFFLINE_DETOUR_FACTOR,
+)
+
+
+class DistanceProvider(ABC):
+    """
+    Route Distance Provider Base Class. Warehouse Connections are Calculated through Any of its Subclasses
+    """
+
+    @abstractmethod
+    async def getDrivingRouteDistance(self, coords1: dict, coords2: dict) -> int:
+        """
+        Asynchronous Method to Get Driving Route Distance between Two Coordinates (in meters)
+
+        :param dict coords1: Coordinates Dictionary of the Starting Point
+        :param dict coords2: Coordinates Dictionary of the End Point
+        :return: Route Distance between the Two Points in meters
+        :rtype: int
+        :raise RouteNotFound: Raised when there's no Physical Route between the Two Coordinates
+        """
+
+    @abstractmethod
+    async def getDrivingRouteDistances(
+        self, sources: list[dict], destinations: list[dict]
+    ) -> list[list[int | None]]:
+        """
+        Asynchronous Method to Get the Driving Route Distances from Some Sources to Some Destinations (in meters)
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :return: Matrix with a Row for Each Source and a Column for Each Destination. Each Route Distance is ``None`` if there's no Route between the Two Points
+        :rtype: list
+        """
+
+
+class OfflineDistanceProvider(DistanceProvider):
+    """
+    Class that Estimates Route Distances without Network Access, as the Great-Circle Distance Multiplied by a Detour Factor. It's Meant to Build and Benchmark Large Networks, not for Production
+    """
+
+    # Ratio between the Estimated Route Distance and the Great-Circle Distance
+    __detourFactor = None
+
+    def __init__(self, detourFactor: float = OFFLINE_DETOUR_FACTOR):
+        """
+        Offline Distance Provider Class Constructor
+
+        :param float detourFactor: Ratio between the Estimated Route Distance and the Great-Circle Distance. Default is ``OFFLINE_DETOUR_FACTOR``
+        """
+
+        self.__detourFactor = detourFactor
+
+    def __getRadians(self, coords: list[dict]):
+        """
+        Method to Get the Latitudes and Longitudes of Some Coordinates in Radians. NumPy is Imported Here, so It's not Loaded by Commands that don't Use It
+
+        :param list coords: List of Coordinates Dictionaries
+        :return: Array of Latitudes and Array of Longitudes
+        :rtype: tuple
+        """
+
+        import numpy as np
+
+        lats = np.radians(np.array([float(c[NOMINATIM_LATITUDE]) for c in coords]))
+        lons = np.radians(np.array([float(c[NOMINATIM_LONGITUDE]) for c in coords]))
+
+        return lats, lons
+
+    def getRouteDistances(
+        self, sources: list[dict], destinations: list[dict]
+    ) -> list[list[int]]:
+        """
+        Method to Estimate the Route Distances from Some Sources to Some Destinations (in meters). The Haversine Formula is Evaluated over the Whole Matrix at Once
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :return: Matrix with a Row for Each Source and a Column for Each Destination
+        :rtype: list
+        """
+
+        import numpy as np
+
+        if len(sources) == 0 or len(destinations) == 0:
+            return [[] for _ in sources]
+
+        # Sources are Broadcast as Columns and Destinations as Rows
+        lats1, lons1 = self.__getRadians(sources)
+        lats2, lons2 = self.__getRadians(destinations)
+
+        lats1, lons1 = lats1[:, None], lons1[:, None]
+
+        # Haversine Formula
+        h = (
+            np.sin((lats2 - lats1) / 2) ** 2
+            + np.cos(lats1) * np.cos(lats2) * np.sin((lons2 - lons1) / 2) ** 2
+        )
+        distances = 2 * OFFLINE_EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+
+        # Apply the Detour Factor and Round Distances to Meters
+        return np.rint(distances * self.__detourFactor).astype(int).tolist()
+
+    async def getDrivingRouteDistance(self, coords1: dict, coords2: dict) -> int:
+        """
+        Asynchronous Method to Estimate the Driving Route Distance between Two Coordinates (in meters)
+
+        :param dict coords1: Coordinates Dictionary of the Starting Point
+        :param dict coords2: Coordinates Dictionary of the End Point
+        :return: Estimated Route Distance between the Two Points in meters
+        :rtype: int
+        """
+
+        return self.getRouteDistances([coords1], [coords2])[0][0]
+
+    async def getDrivingRouteDistances(
+        self, sources: list[dict], destinations: list[dict]
+    ) -> list[list[int]]:
+        """
+        Asynchronous Method to Estimate the Driving Route Distances from Some Sources to Some Destinations (in meters)
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :return: Matrix with a Row for Each Source and a Column for Each Destination
+        :rtype: list
+        """
+
+        return self.getRouteDistances(sources, destinations)
+
+
+def getDistanceProvider(name: str, user: str, ORSApiKey: str) -> DistanceProvider:
+    """
+    Function to Initialize the Route Distance Provider with the Given Name. The ORS Provider is Initialized with the Local Route Distances Cache
+
+    :param str name: Route Distance Provider Name. It's One of ``DISTANCE_PROVIDERS``
+    :param str user: Remote Database Role Name
+    :param str ORSApiKey: Open Routing Service API Key. It's not Used by the Offline Provider
+    :return: Route Distance Provider
+    :rtype: DistanceProvider
+    :raises ValueError: Raised when the Route Distance Provider Name is not Valid
+    """
+
+    name = name.strip().lower()
+
+    if name == DISTANCE_PROVIDER_OFFLINE:
+        return OfflineDistanceProvider()
+
+    if name == DISTANCE_PROVIDER_ORS:
+        from .routingpy import ORSGeocoder
+        from ..local_database.routes import RouteDistancesCache
+
+        return ORSGeocoder(ORSApiKey, user, routesCache=RouteDistancesCache())
+
+    raise ValueError(
+        f"Invalid Route Distance Provider '{name}'. It must be One of: {', '.join(DISTANCE_PROVIDERS)}\n"
+    )
@@ -1,5 +1,3 @@
-from geopy.geocoders import Nominatim
-
 from .constants import *
 from .exceptions import LocationNotFound, PlaceNotFound
 from .geopy_region_exceptions import *
@@ -21,8 +19,9 @@ class NominatimGeocoder:
     Class that Handles GeoPy (Nominatim API) Requests
     """
 
-    # Geolocator
+    # Geolocator. It's Initialized on its First Request
     __geolocator = None
+    __userAgent = None
 
     def __init__(self, user: str):
         """
@@ -31,14 +30,24 @@ class NominatimGeocoder:
         :param str user: Remote Database Role Name
         """
 
-        try:
+        # Set User Agent Name
+        self.__userAgent = f"{NOMINATIM_USER_AGENT}-{user}"
+
+    def __getGeolocator(self):
+        """
+        Method to Get the Nominatim Geolocator. GeoPy is Imported and the Geolocator is Initialized the First Time It's Called, so It's not Loaded by Commands that don't Use It
+
+        :return: Nominatim Geolocator
+        :rtype: Nominatim
+        """
+
+        if self.__geolocator == None:
+            from geopy.geocoders import Nominatim
+
             # Initialize Geolocator
-            self.__geolocator = Nominatim(
-                user_agent=f"{NOMINATIM_USER_AGENT}-{user}", timeout=5
-            )
+            self.__geolocator = Nominatim(user_agent=self.__userAgent, timeout=5)
 
-        except Exception as err:
-            raise err
+        return self.__geolocator
 
     def __getName(self, location: dict) -> str:
         """
@@ -63,7 +72,9 @@ class NominatimGeocoder:
 
         try:
             # Get Country Location
-            geopyLocation = self.__geolocator.geocode(countryName, exactly_one=False)
+            geopyLocation = self.__getGeolocator().geocode(
+                countryName, exactly_one=False
+            )
 
             # Check Location
             if geopyLocation == None:
@@ -94,7 +105,7 @@ class NominatimGeocoder:
 
         try:
             # Get Region Location
-            geopyLocation = self.__geolocator.geocode(
+            geopyLocation = self.__getGeolocator().geocode(
                 ", ".join([regionName, location[DICT_COUNTRY_NAME]]),
                 addressdetails=True,
                 exactly_one=False,
@@ -135,7 +146,7 @@ class NominatimGeocoder:
 
         try:
             # Get City Location
-            geopyLocation = self.__geolocator.geocode(
+            geopyLocation = self.__getGeolocator().geocode(
                 ", ".join(
                     [
                         cityName,
@@ -190,7 +201,7 @@ class NominatimGeocoder:
 
         try:
             # Get Place Location
-            geopyLocation = self.__geolocator.geocode(
+            geopyLocation = self.__getGeolocator().geocode(
                 ", ".join(
                     [
                         placeName,
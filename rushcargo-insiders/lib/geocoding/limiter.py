@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Class that Limits the Rate of Requests Sent to an External API through a Token Bucket. It can be Shared by Several Threads and Event Loops
+    """
+
+    # Tokens Added per Second, and Maximum Number of Tokens Stored
+    __rate = None
+    __capacity = None
+
+    # Tokens Available, and Time when They were Last Refilled
+    __tokens = None
+    __updatedAt = None
+
+    # Lock to Refill and Take Tokens
+    __lock = None
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Token Bucket Class Constructor. The Bucket Starts Full
+
+        :param float rate: Tokens Added per Second
+        :param int capacity: Maximum Number of Tokens Stored, that's the Maximum Burst of Requests
+        """
+
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = float(capacity)
+        self.__updatedAt = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __reserve(self) -> float:
+        """
+        Method to Take a Token from the Bucket. If there are no Tokens Left, the Next One is Reserved, so Requests are Served in Order
+
+        :return: Seconds to Wait until the Reserved Token is Available
+        :rtype: float
+        """
+
+        with self.__lock:
+            # Refill the Bucket with the Tokens Added since the Last Request
+            now = time.monotonic()
+            self.__tokens = min(
+                self.__capacity,
+                self.__tokens + (now - self.__updatedAt) * self.__rate,
+            )
+            self.__updatedAt = now
+
+            # Take a Token. If the Bucket goes Below Zero, the Token is Borrowed from the Future
+            self.__tokens -= 1
+
+            if self.__tokens >= 0:
+                return 0.0
+
+            return -self.__tokens / self.__rate
+
+    async def acquire(self) -> None:
+        """
+        Asynchronous Method to Wait until a Request can be Sent
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        wait = self.__reserve()
+
+        if wait > 0:
+            await asyncio.sleep(wait)
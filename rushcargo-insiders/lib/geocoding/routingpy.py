@@ -1,43 +1,115 @@
-from routingpy import ORS
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 from .constants import (
     ORS_USER_AGENT,
+    ORS_MAX_WORKERS,
+    ORS_RATE_LIMIT,
+    ORS_METRIC_DISTANCE,
+    ORS_MATRIX_MAX_LOCATIONS,
+    ORS_MATRIX_RATE_LIMIT,
     ORS_PROFILE_DRIVING,
     ORS_PREF_FASTEST,
     ORS_PREFERENCE_SHORTEST,
+    ORS_NO_ROUTE_ERRORS,
+    ORS_CACHE_DIRECTIONS,
+    ORS_CACHE_MATRIX,
     NOMINATIM_LATITUDE,
     NOMINATIM_LONGITUDE,
 )
+from .distance import DistanceProvider
 from .exceptions import RouteNotFound
+from .limiter import TokenBucket
 
 
-class ORSGeocoder:
+class ORSGeocoder(DistanceProvider):
     """
-    Class that Handles RoutingPy (Open Routing Service API) Requests
+    Class that Handles RoutingPy (Open Routing Service API) Requests. It's the Route Distance Provider Used in Production
     """
 
-    # Geolocator
+    # Geolocator. It's Initialized on its First Request
     __geolocator = None
+    __ORSApiKey = None
+    __userAgent = None
 
-    def __init__(self, ORSApiKey: str, user: str):
+    # Worker Pool where the Blocking Requests are Sent, and Token Buckets that Limit Them to the ORS Directions and Matrix Quotas
+    __executor = None
+    __limiter = None
+    __matrixLimiter = None
+
+    # Local Route Distances Cache. If It's ``None``, Every Route Distance is Requested
+    __routesCache = None
+
+    def __init__(
+        self,
+        ORSApiKey: str,
+        user: str,
+        maxWorkers: int = ORS_MAX_WORKERS,
+        rateLimit: int = ORS_RATE_LIMIT,
+        matrixRateLimit: int = ORS_MATRIX_RATE_LIMIT,
+        routesCache=None,
+    ):
         """
         ORS RoutingPy Geocoder Class Constructor
 
         :param str ORSApiKey: Open Routing Service API Key
         :param str user: Remote Database Role Name
+        :param int maxWorkers: Maximum Number of Requests Sent Concurrently. Default is ``ORS_MAX_WORKERS``
+        :param int rateLimit: Maximum Number of Directions Requests Sent per Minute. Default is ``ORS_RATE_LIMIT``
+        :param int matrixRateLimit: Maximum Number of Matrix Requests Sent per Minute. Default is ``ORS_MATRIX_RATE_LIMIT``
+        :param RouteDistancesCache routesCache: Local Route Distances Cache. Default is ``None``
         """
 
-        # Set User Agent Name
-        userAgent = f"{ORS_USER_AGENT}-{user}"
+        # Store API Key and Set User Agent Name
+        self.__ORSApiKey = ORSApiKey
+        self.__userAgent = f"{ORS_USER_AGENT}-{user}"
+
+        # Initialize the Worker Pool. Its Threads are Started on Demand
+        self.__executor = ThreadPoolExecutor(
+            max_workers=maxWorkers, thread_name_prefix="ors"
+        )
+
+        # Initialize the Token Buckets, which Allow a Burst of a Whole Minute Quota
+        self.__limiter = TokenBucket(rateLimit / 60, rateLimit)
+        self.__matrixLimiter = TokenBucket(matrixRateLimit / 60, matrixRateLimit)
+
+        self.__routesCache = routesCache
+
+    def __getGeolocator(self):
+        """
+        Method to Get the ORS Geolocator. RoutingPy is Imported and the Geolocator is Initialized the First Time It's Called, so It's not Loaded by Commands that don't Use It
+
+        :return: ORS Geolocator
+        :rtype: ORS
+        """
+
+        if self.__geolocator == None:
+            from routingpy import ORS
 
-        try:
             # Initialize Geolocator
             self.__geolocator = ORS(
-                api_key=ORSApiKey, user_agent=userAgent, timeout=5
+                api_key=self.__ORSApiKey, user_agent=self.__userAgent, timeout=5
             )
 
-        except Exception as err:
-            raise err
+        return self.__geolocator
+
+    def __isNoRouteError(self, err) -> bool:
+        """
+        Method to Check if an ORS API Error Means there's no Route between the Requested Points
+
+        :param RouterApiError err: Error Raised by RoutingPy
+        :return: ``True`` if its Error Code is One of ``ORS_NO_ROUTE_ERRORS``. Otherwise, ``False``
+        :rtype: bool
+        """
+
+        try:
+            code = json.loads(err.message)["error"]["code"]
+
+        except (TypeError, ValueError, KeyError):
+            return False
+
+        return code in ORS_NO_ROUTE_ERRORS
 
     def __getRouteDistance(self, coords1: dict, coords2: dict, profile: str) -> int:
         """
@@ -49,36 +121,268 @@ class ORSGeocoder:
         :return: Route Distance between the Two Points in meters
         :rtype: int
         :raise RouteNotFound: Raised when there's no Physical Route between the Two Coordinates
+        :raises RouterError: Raised when the Request Fails for Any Other Reason, like the API Quota or an Invalid API Key
         """
 
-        try:
-            # Get List of Coordinates
-            coords = [
-                [str(coords1[NOMINATIM_LONGITUDE]), str(coords1[NOMINATIM_LATITUDE])],
-                [str(coords2[NOMINATIM_LONGITUDE]), str(coords2[NOMINATIM_LATITUDE])],
-            ]
+        from routingpy.exceptions import RouterApiError
+
+        # Get List of Coordinates
+        coords = [
+            [str(coords1[NOMINATIM_LONGITUDE]), str(coords1[NOMINATIM_LATITUDE])],
+            [str(coords2[NOMINATIM_LONGITUDE]), str(coords2[NOMINATIM_LATITUDE])],
+        ]
 
+        try:
             # Get Route Directions
-            route = self.__geolocator.directions(
+            route = self.__getGeolocator().directions(
                 locations=coords,
                 profile=profile,
                 preference=ORS_PREFERENCE_SHORTEST,
             )
 
-            # Get Distance in Meters
-            return route.distance
+        # There's no Route between the Two Points. Other Errors are Raised, so They aren't Mistaken for a Missing Road
+        except RouterApiError as err:
+            if self.__isNoRouteError(err):
+                raise RouteNotFound(coords1, coords2)
+
+            raise err
 
-        except:
-            raise RouteNotFound(coords1, coords2)
+        # Get Distance in Meters
+        return route.distance
 
-    def getDrivingRouteDistance(self, coords1: dict, coords2: dict) -> int:
+    async def getDrivingRouteDistance(self, coords1: dict, coords2: dict) -> int:
         """
-        Method to Get Driving Route Distance between Two Coordinates through the ORS API (in meters)
+        Asynchronous Method to Get Driving Route Distance between Two Coordinates through the ORS API (in meters). The Local Cache is Checked First. Otherwise, the Request is Sent from the Worker Pool once the Token Bucket Allows It, so Several Requests can be Awaited Concurrently
 
         :param dict coords1: Coordinates Dictionary of the Starting Point
         :param str coords2: Coordinates Dictionary of the End Point
         :return: Route Distance between the Two Points in meters
         :rtype: int
+        :raise RouteNotFound: Raised when there's no Physical Route between the Two Coordinates
+        """
+
+        # Check if It's Stored at the Local Cache
+        if self.__routesCache != None:
+            distance = self.__routesCache.get(coords1, coords2, ORS_CACHE_DIRECTIONS)
+
+            if distance != None:
+                return distance
+
+        # Wait for the Rate Limit
+        await self.__limiter.acquire()
+
+        loop = asyncio.get_running_loop()
+
+        distance = await loop.run_in_executor(
+            self.__executor,
+            self.__getRouteDistance,
+            coords1,
+            coords2,
+            ORS_PROFILE_DRIVING,
+        )
+
+        # Store It at the Local Cache
+        if self.__routesCache != None:
+            self.__routesCache.set(coords1, coords2, ORS_CACHE_DIRECTIONS, distance)
+
+        return distance
+
+    def __getRouteDistances(
+        self, sources: list[dict], destinations: list[dict], profile: str
+    ) -> list[list[int | None]]:
+        """
+        Method to Get the Route Distances from Some Sources to Some Destinations through a Single ORS Matrix API Request (in meters)
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :param str profile: Route Profile
+        :return: Matrix with a Row for Each Source and a Column for Each Destination. Each Route Distance is ``None`` if there's no Route between the Two Points
+        :rtype: list
+        :raises RouterError: Raised when the Request Fails, like when the API Quota is Surpassed or the API Key is Invalid
+        """
+
+        # Get List of Coordinates. Sources are Placed First
+        coords = [
+            [str(c[NOMINATIM_LONGITUDE]), str(c[NOMINATIM_LATITUDE])]
+            for c in sources + destinations
+        ]
+
+        # Get Route Distances Matrix. Unreachable Points are Returned as Empty Cells, so Any Error is Raised
+        matrix = self.__getGeolocator().matrix(
+            locations=coords,
+            profile=profile,
+            sources=list(range(len(sources))),
+            destinations=list(range(len(sources), len(coords))),
+            metrics=[ORS_METRIC_DISTANCE],
+        )
+
+        # Round Distances to Meters
+        return [
+            [None if d == None else int(d) for d in row] for row in matrix.distances
+        ]
+
+    def __getMatrixChunkSizes(
+        self, nSources: int, nDestinations: int
+    ) -> tuple[int, int]:
+        """
+        Method to Get How Many Sources and Destinations are Sent at Each Matrix Request, so None of Them Surpasses ``ORS_MATRIX_MAX_LOCATIONS``
+
+        :param int nSources: Number of Sources
+        :param int nDestinations: Number of Destinations
+        :return: Number of Sources and Number of Destinations per Request
+        :rtype: tuple
         """
 
-        return self.__getRouteDistance(coords1, coords2, ORS_PROFILE_DRIVING)
+        half = ORS_MATRIX_MAX_LOCATIONS // 2
+
+        # If One Side is Small, the Other One Takes the Rest of the Locations
+        if nSources <= half:
+            return nSources, min(nDestinations, ORS_MATRIX_MAX_LOCATIONS - nSources)
+
+        if nDestinations <= half:
+            return (
+                min(nSources, ORS_MATRIX_MAX_LOCATIONS - nDestinations),
+                nDestinations,
+            )
+
+        return half, half
+
+    async def __getChunkRouteDistances(
+        self, sources: list[dict], destinations: list[dict], profile: str
+    ) -> list[list[int | None]]:
+        """
+        Asynchronous Method to Send a Single Matrix Request from the Worker Pool once the Matrix Token Bucket Allows It
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :param str profile: Route Profile
+        :return: Route Distances Matrix
+        :rtype: list
+        """
+
+        # Wait for the Rate Limit
+        await self.__matrixLimiter.acquire()
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self.__executor,
+            self.__getRouteDistances,
+            sources,
+            destinations,
+            profile,
+        )
+
+    async def __requestRouteDistances(
+        self, sources: list[dict], destinations: list[dict], profile: str
+    ) -> list[list[int | None]]:
+        """
+        Asynchronous Method to Request the Route Distances from Some Sources to Some Destinations through the ORS Matrix API (in meters). The Sources and Destinations are Split in Chunks that Fit the Provider Limits, and the Chunks are Requested Concurrently
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :param str profile: Route Profile
+        :return: Matrix with a Row for Each Source and a Column for Each Destination. Each Route Distance is ``None`` if there's no Route between the Two Points
+        :rtype: list
+        """
+
+        distances = [[None] * len(destinations) for _ in sources]
+
+        if len(sources) == 0 or len(destinations) == 0:
+            return distances
+
+        srcSize, dstSize = self.__getMatrixChunkSizes(len(sources), len(destinations))
+
+        # Request Each Chunk of the Matrix Concurrently
+        chunks = []
+        tasks = []
+
+        for i in range(0, len(sources), srcSize):
+            for j in range(0, len(destinations), dstSize):
+                chunks.append((i, j))
+                tasks.append(
+                    asyncio.create_task(
+                        self.__getChunkRouteDistances(
+                            sources[i : i + srcSize],
+                            destinations[j : j + dstSize],
+                            profile,
+                        )
+                    )
+                )
+
+        try:
+            await asyncio.gather(*tasks)
+
+        except Exception as err:
+            for task in tasks:
+                task.cancel()
+            raise err
+
+        # Join the Chunks
+        for (i, j), task in zip(chunks, tasks):
+            for k, row in enumerate(task.result()):
+                distances[i + k][j : j + len(row)] = row
+
+        return distances
+
+    async def getDrivingRouteDistances(
+        self, sources: list[dict], destinations: list[dict]
+    ) -> list[list[int | None]]:
+        """
+        Asynchronous Method to Get the Driving Route Distances from Some Sources to Some Destinations (in meters). The Local Cache is Checked First, and only the Sources and Destinations with Missing Route Distances are Requested through the ORS Matrix API
+
+        :param list sources: List of Coordinates Dictionaries of the Starting Points
+        :param list destinations: List of Coordinates Dictionaries of the End Points
+        :return: Matrix with a Row for Each Source and a Column for Each Destination. Each Route Distance is ``None`` if there's no Route between the Two Points
+        :rtype: list
+        """
+
+        if self.__routesCache == None:
+            return await self.__requestRouteDistances(
+                sources, destinations, ORS_PROFILE_DRIVING
+            )
+
+        # Get the Stored Route Distances
+        nDestinations = len(destinations)
+        cached = self.__routesCache.getMany(
+            [(s, d) for s in sources for d in destinations], ORS_CACHE_MATRIX
+        )
+        distances = [
+            cached[i * nDestinations : (i + 1) * nDestinations]
+            for i in range(len(sources))
+        ]
+
+        # Get the Sources and Destinations with Missing Route Distances
+        missingSources = [i for i, row in enumerate(distances) if None in row]
+        missingDestinations = [
+            j
+            for j in range(nDestinations)
+            if any(distances[i][j] == None for i in missingSources)
+        ]
+
+        if len(missingSources) == 0:
+            return distances
+
+        # Request the Missing Route Distances
+        requested = await self.__requestRouteDistances(
+            [sources[i] for i in missingSources],
+            [destinations[j] for j in missingDestinations],
+            ORS_PROFILE_DRIVING,
+        )
+
+        routes = []
+
+        for k, i in enumerate(missingSources):
+            for l, j in enumerate(missingDestinations):
+                distance = requested[k][l]
+
+                if distances[i][j] != None or distance == None:
+                    continue
+
+                distances[i][j] = distance
+                routes.append((sources[i], destinations[j], distance))
+
+        # Store Them at the Local Cache
+        self.__routesCache.setMany(routes, ORS_CACHE_MATRIX)
+
+        return distances
@@ -59,3 +59,19 @@ GRAPH_WAREHOUSE_CONN_TYPE = "connType"
 GRAPH_REGION_MAIN_WAREHOUSE_NODE = "region-main"
 GRAPH_CITY_MAIN_WAREHOUSE_NODE = "city-main"
 GRAPH_CITY_WAREHOUSE_NODE = "city"
+
+# Maximum Number of Shortest Routes Cached between Graph Updates
+RUSHWGRAPH_ROUTES_CACHE_SIZE = 4096
+
+# Multi-process Route Solver Configuration
+SOLVER_CHUNK_SIZE = 1024
+SOLVER_PENDING_PER_WORKER = 2
+
+# Worker Processes Start Methods, by Preference. Fork is not Used, since the Caller can be Running Other Threads
+SOLVER_MP_CONTEXTS = ["forkserver", "spawn"]
+
+# Shared Memory Snapshot Arrays
+SOLVER_SNAPSHOT_DATA = "data"
+SOLVER_SNAPSHOT_INDICES = "indices"
+SOLVER_SNAPSHOT_INDPTR = "indptr"
+SOLVER_SNAPSHOT_NODES = "nodes"
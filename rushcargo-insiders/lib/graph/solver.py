@@ -0,0 +1,289 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from .constants import *
+
+# Read-only Warehouses Graph Snapshot Attached to the Current Worker Process, and the Shared Memory Blocks that Back It
+_snapshot = None
+_blocks = None
+
+
+class SharedSnapshot:
+    """
+    Read-only Snapshot of the Warehouses Graph Sparse Adjacency Matrix, Stored in Shared Memory. Worker Processes Attach to It by Name, so It's neither Copied nor Pickled per Worker
+    """
+
+    # Shared Memory Blocks by Array Name
+    __blocks = None
+
+    # Shared Memory Block Name, Data Type and Shape by Array Name
+    __spec = None
+
+    def __init__(self, csrMatrix: csr_matrix, csrNodes: list[int]):
+        """
+        Shared Snapshot Class Constructor
+
+        :param csr_matrix csrMatrix: Sparse Adjacency Matrix of the Graph
+        :param list csrNodes: List of Node IDs at each Matrix Index
+        """
+
+        self.__blocks = {}
+        self.__spec = {}
+
+        arrays = {
+            SOLVER_SNAPSHOT_DATA: csrMatrix.data,
+            SOLVER_SNAPSHOT_INDICES: csrMatrix.indices,
+            SOLVER_SNAPSHOT_INDPTR: csrMatrix.indptr,
+            SOLVER_SNAPSHOT_NODES: np.asarray(csrNodes, dtype=np.int64),
+        }
+
+        try:
+            for key, array in arrays.items():
+                # Shared Memory Blocks can't be Empty
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.__blocks[key] = block
+
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                self.__spec[key] = (block.name, array.dtype.str, array.shape)
+
+        except Exception as err:
+            self.close()
+            raise err
+
+    def getSpec(self) -> dict:
+        """
+        Method to Get the Picklable Description of the Snapshot, which is Sent to each Worker Process to Attach to It
+
+        :return: Dictionary with the Shared Memory Block Name, Data Type and Shape by Array Name
+        :rtype: dict
+        """
+
+        return self.__spec
+
+    def close(self) -> None:
+        """
+        Method to Release the Shared Memory Blocks. It must be Called once the Worker Processes have Exited
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        for block in self.__blocks.values():
+            block.close()
+            block.unlink()
+
+        self.__blocks = {}
+
+    def __enter__(self):
+        """
+        Method to Use the Snapshot as a Context Manager
+
+        :return: Shared Snapshot
+        :rtype: SharedSnapshot
+        """
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Method to Release the Shared Memory Blocks when the Context is Exited
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        self.close()
+
+
+def _attachSnapshot(spec: dict) -> None:
+    """
+    Function Called at the Start of each Worker Process to Attach the Read-only Warehouses Graph Snapshot from Shared Memory
+
+    :param dict spec: Snapshot Description Returned by ``SharedSnapshot.getSpec``
+    :return: Nothing
+    :rtype: NoneType
+    """
+
+    global _snapshot, _blocks
+
+    _blocks = {}
+    arrays = {}
+
+    for key, (name, dtype, shape) in spec.items():
+        _blocks[key] = SharedMemory(name=name)
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_blocks[key].buf)
+
+    # Build the Matrix on Top of the Shared Arrays, without Copying Them
+    nodes = arrays[SOLVER_SNAPSHOT_NODES]
+    csrMatrix = csr_matrix(
+        (
+            arrays[SOLVER_SNAPSHOT_DATA],
+            arrays[SOLVER_SNAPSHOT_INDICES],
+            arrays[SOLVER_SNAPSHOT_INDPTR],
+        ),
+        shape=(len(nodes), len(nodes)),
+        copy=False,
+    )
+    csrIndex = {int(node): i for i, node in enumerate(nodes)}
+
+    _snapshot = (csrMatrix, csrIndex)
+
+
+def _solveChunk(
+    chunk: list[tuple[int, list[int]]],
+) -> list[tuple[int, int, int | None]]:
+    """
+    Function to Get the Route Distance of each Origin-Destination Pair inside a Chunk, with the Snapshot Attached to the Worker Process
+
+    :param list chunk: List of Tuples that Contain the Origin Node ID and the List of its Destination Node IDs
+    :return: List of Tuples that Contain the Origin Node ID, the Destination Node ID and the Route Distance. ``None`` if there's no Path between Them
+    :rtype: list
+    """
+
+    csrMatrix, csrIndex = _snapshot
+    distances = []
+
+    for warehouseFromId, warehouseToIds in chunk:
+        # Check if the Origin Node is inside the Graph
+        if warehouseFromId not in csrIndex:
+            distances.extend(
+                (warehouseFromId, warehouseToId, None)
+                for warehouseToId in warehouseToIds
+            )
+            continue
+
+        # Get the Distance to All the Nodes at Once
+        routeDistances = dijkstra(
+            csrMatrix, directed=True, indices=csrIndex[warehouseFromId]
+        )
+
+        for warehouseToId in warehouseToIds:
+            i = csrIndex.get(warehouseToId)
+            routeDistance = None if i is None else routeDistances[i]
+
+            distances.append(
+                (
+                    warehouseFromId,
+                    warehouseToId,
+                    (
+                        None
+                        if routeDistance is None or np.isinf(routeDistance)
+                        else int(routeDistance)
+                    ),
+                )
+            )
+
+    return distances
+
+
+def getChunks(
+    pairs: Iterable[tuple[int, int]], chunkSize: int = SOLVER_CHUNK_SIZE
+) -> Iterator[list[tuple[int, list[int]]]]:
+    """
+    Generator Function to Group the Origin-Destination Pairs by its Origin Node inside Chunks, so each Origin Node is Solved only Once per Chunk. Pairs are Read Lazily, so only the Current Chunk is Kept in Memory. Pairs Sorted by its Origin Node are Grouped the Best
+
+    :param pairs: Iterable of Tuples that Contain the Origin and Destination Node IDs
+    :param int chunkSize: Maximum Number of Pairs per Chunk. Default is ``SOLVER_CHUNK_SIZE``
+    :return: Iterator of Chunks
+    :rtype: Iterator
+    """
+
+    # Destination Nodes of the Current Chunk Grouped by its Origin Node
+    warehouseToIdsDict = {}
+    chunkLen = 0
+
+    for warehouseFromId, warehouseToId in pairs:
+        warehouseToIdsDict.setdefault(int(warehouseFromId), []).append(
+            int(warehouseToId)
+        )
+        chunkLen += 1
+
+        # Close the Current Chunk if it's Full
+        if chunkLen == chunkSize:
+            yield list(warehouseToIdsDict.items())
+            warehouseToIdsDict = {}
+            chunkLen = 0
+
+    if warehouseToIdsDict:
+        yield list(warehouseToIdsDict.items())
+
+
+def getMpContext():
+    """
+    Function to Get the Multiprocessing Context of the Worker Processes. Workers are never Forked from the Caller, since It can be Running Other Threads that Hold a Lock
+
+    :return: Multiprocessing Context
+    :rtype: BaseContext
+    """
+
+    for method in SOLVER_MP_CONTEXTS:
+        if method in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context(method)
+
+    return multiprocessing.get_context("spawn")
+
+
+def solveBatch(
+    csrMatrix: csr_matrix,
+    csrNodes: list[int],
+    pairs: Iterable[tuple[int, int]],
+    workers: int = None,
+    chunkSize: int = SOLVER_CHUNK_SIZE,
+) -> Iterator[list[tuple[int, int, int | None]]]:
+    """
+    Generator Function to Get the Route Distance of Several Origin-Destination Pairs with a Pool of Worker Processes. Workers Attach Once to a Shared Memory Snapshot of the Graph, and only a Bounded Number of Chunks is Pending at Any Time, so Memory doesn't Grow with the Number of Pairs. Results are Streamed Back in Order.
+
+    Workers are Started with ``forkserver`` or ``spawn``, which Import the Caller ``__main__`` Module, so Its Start-up Code must be Guarded by ``if __name__ == "__main__"``
+
+    :param csr_matrix csrMatrix: Sparse Adjacency Matrix of the Graph
+    :param list csrNodes: List of Node IDs at each Matrix Index
+    :param pairs: Iterable of Tuples that Contain the Origin and Destination Node IDs
+    :param int workers: Number of Worker Processes. Default is ``None``, which Uses the Number of CPUs
+    :param int chunkSize: Maximum Number of Pairs per Chunk. Default is ``SOLVER_CHUNK_SIZE``
+    :return: Iterator of Lists of Tuples that Contain the Origin Node ID, the Destination Node ID and the Route Distance. ``None`` if there's no Path between Them
+    :rtype: Iterator
+    """
+
+    chunks = getChunks(pairs, chunkSize)
+
+    # Nothing to Solve
+    firstChunk = next(chunks, None)
+
+    if firstChunk is None:
+        return
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    maxPending = workers * SOLVER_PENDING_PER_WORKER
+
+    with SharedSnapshot(csrMatrix, csrNodes) as snapshot:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=getMpContext(),
+            initializer=_attachSnapshot,
+            initargs=(snapshot.getSpec(),),
+        ) as executor:
+            pending = deque([executor.submit(_solveChunk, firstChunk)])
+
+            try:
+                # Keep the Window Full, and Yield the Oldest Chunk once It's Solved
+                for chunk in chunks:
+                    if len(pending) >= maxPending:
+                        yield pending.popleft().result()
+
+                    pending.append(executor.submit(_solveChunk, chunk))
+
+                while pending:
+                    yield pending.popleft().result()
+
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -1,11 +1,35 @@
 import asyncio
+import logging
+from typing import Iterable
 from unidecode import unidecode
 
 import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
 from psycopg import sql
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
 
 from .constants import *
+from .solver import solveBatch
+
+# Use the Faster JSON Encoder if it's Installed
+try:
+    from orjson import dumps as jsonDumps
+
+except ImportError:
+    import json
+
+    def jsonDumps(obj) -> bytes:
+        """
+        Function to Encode a Given Object as Compact JSON
+
+        :param obj: Object to Encode
+        :return: JSON Encoded Object
+        :rtype: bytes
+        """
+
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 from ..model.constants import *
 from ..model.database import AsyncPool
@@ -31,6 +55,23 @@ class RushWGraph:
     __citiesMainNodes = None
     __citiesNodes = None
     __nodesEdges = None
+    __lockersWarehouse = None
+    __branchesWarehouse = None
+
+    # Locations Name Interned by its ID, and Decoded Names Cache
+    __countriesName = None
+    __regionsName = None
+    __citiesName = None
+    __decodedNames = None
+
+    # Shortest Routes and Nodes JSON Fragments Cache
+    __routesCache = None
+    __nodesFragment = None
+
+    # SciPy Sparse Adjacency Matrix
+    __csrMatrix = None
+    __csrNodes = None
+    __csrIndex = None
 
     # Graph Layouts
     __circular = None
@@ -53,6 +94,12 @@ class RushWGraph:
         # Iniliaze NetworkX Graph Class
         self.__DiGraph = nx.DiGraph()
         self.__draw = draw
+        self.__routesCache = {}
+        self.__nodesFragment = {}
+        self.__countriesName = {}
+        self.__regionsName = {}
+        self.__citiesName = {}
+        self.__decodedNames = {}
 
     @classmethod
     async def create(cls, apool: AsyncPool, draw: bool = False):
@@ -66,20 +113,16 @@ class RushWGraph:
 
         self = RushWGraph(draw)
 
-        # Get the Connections from the Asynchronous Connection Pool
-        getTask = asyncio.create_task(apool.getConnections(4))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
-
-        # Get All the Required Warehouses Nodes and Nodes Edges from the Remote Database
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(self.__getRegionsMainNodes(aconns[0].cursor()))
-            tg.create_task(self.__getCitiesMainNodes(aconns[1].cursor()))
-            tg.create_task(self.__getCitiesNodes(aconns[2].cursor()))
-            tg.create_task(self.__getNodesEdges(aconns[3].cursor()))
-
-        # Put the Connections Back to the Asynchronous Connection Pool
-        putTask = asyncio.create_task(apool.putConnections(aconns))
+        # Lease the Connections from the Asynchronous Connection Pool
+        async with apool.lease(6) as aconns:
+            # Get All the Required Warehouses Nodes and Nodes Edges from the Remote Database
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.__getRegionsMainNodes(aconns[0].cursor()))
+                tg.create_task(self.__getCitiesMainNodes(aconns[1].cursor()))
+                tg.create_task(self.__getCitiesNodes(aconns[2].cursor()))
+                tg.create_task(self.__getNodesEdges(aconns[3].cursor()))
+                tg.create_task(self.__getLockersWarehouse(aconns[4].cursor()))
+                tg.create_task(self.__getBranchesWarehouse(aconns[5].cursor()))
 
         # Set Nodes
         self.__setRegionsMainNodes(draw)
@@ -92,8 +135,6 @@ class RushWGraph:
         # Set the Graph as Available
         self.__busy = False
 
-        await asyncio.gather(putTask)
-
         # Return the Instance
         return self
 
@@ -107,9 +148,7 @@ class RushWGraph:
         """
 
         # Call the Constructor
-        createTask = asyncio.create_task(cls.create(apool, draw))
-        await asyncio.gather(createTask)
-        self = createTask.result()
+        self = await cls.create(apool, draw)
 
         # Return the Instance
         return self
@@ -125,30 +164,60 @@ class RushWGraph:
         return self.__busy
 
     def __getWarehousesDict(
-        self, warehousesList: list[tuple[str, str, str, str, int]]
+        self, warehousesList: list[tuple[int, str, int, str, int, str, str, int]]
     ) -> dict:
         """
-        Method to Get a Dictionary that Contains All the Warehouses ID, the Country, Region and City where it's Located and its Building Name
+        Method to Get a Dictionary that Contains All the Warehouses ID, the Country, Region and City ID where it's Located and its Building Name. Locations Name are Interned Once per Location
 
         :param list warehousesList: List of Fetched Warehouses
-        :return: Dictionary that Contains All the Warehouses ID, the Locations Name where it's Located and its Building Name
+        :return: Dictionary that Contains All the Warehouses ID, the Locations ID where it's Located and its Building Name
         :rtype: dict
         """
 
         warehousesDict = {}
 
         for w in warehousesList:
-            countryName, regionName, cityName, buildingName, buildingId = w
-
-            warehousesDict[buildingId] = [
+            (
+                countryId,
                 countryName,
+                regionId,
                 regionName,
+                cityId,
                 cityName,
                 buildingName,
+                buildingId,
+            ) = w
+
+            # Intern Locations Name
+            self.__countriesName[countryId] = countryName
+            self.__regionsName[regionId] = regionName
+            self.__citiesName[cityId] = cityName
+
+            warehousesDict[buildingId] = [
+                countryId,
+                regionId,
+                cityId,
+                buildingName,
             ]
 
         return warehousesDict
 
+    def __getDecodedName(self, name: str) -> str:
+        """
+        Method to Get the ASCII Transliteration of a Given Name. Each Name is Decoded only Once
+
+        :param str name: Name to Decode
+        :return: Decoded Name
+        :rtype: str
+        """
+
+        decodedName = self.__decodedNames.get(name)
+
+        if decodedName is None:
+            decodedName = self.__decodedNames[name] = unidecode(name)
+
+        return decodedName
+
     def __getWarehouseConnsDicts(
         self, warehouseConnsList: list[tuple[int, int, int, str]]
     ) -> dict:
@@ -233,10 +302,8 @@ class RushWGraph:
         allNodesQuery = self.__allNodesQuery()
 
         # Execute Query and Fetch Items (Nodes)
-        await asyncio.gather(acursor.execute(allNodesQuery))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self.__items = fetchTask.result()
+        await acursor.execute(allNodesQuery)
+        self.__items = await acursor.fetchall()
         self.__allWarehouses = dict.fromkeys(item[0] for item in self.__items)
 
     def __regionsMainNodesQuery(self):
@@ -248,10 +315,13 @@ class RushWGraph:
         """
 
         return sql.SQL(
-            "SELECT {countryNameField}, {regionNameField}, {cityNameField}, {buildingNameField}, {warehouseIdField} FROM {connectionsSchemeName}.{regionMainWarehousesViewName}"
+            "SELECT {countryIdField}, {countryNameField}, {regionIdField}, {regionNameField}, {cityIdField}, {cityNameField}, {buildingNameField}, {warehouseIdField} FROM {connectionsSchemeName}.{regionMainWarehousesViewName}"
         ).format(
+            countryIdField=sql.Identifier(COUNTRIES_ID),
             countryNameField=sql.Identifier(COUNTRIES_NAME),
+            regionIdField=sql.Identifier(REGIONS_ID),
             regionNameField=sql.Identifier(REGIONS_NAME),
+            cityIdField=sql.Identifier(CITIES_ID),
             cityNameField=sql.Identifier(CITIES_NAME),
             buildingNameField=sql.Identifier(BUILDINGS_NAME),
             warehouseIdField=sql.Identifier(WAREHOUSES_ID),
@@ -275,10 +345,8 @@ class RushWGraph:
         regionsMainNodesQuery = self.__regionsMainNodesQuery()
 
         # Execute Query and Fetch Items (Nodes)
-        await asyncio.gather(acursor.execute(regionsMainNodesQuery))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self.__regionsMainNodes = fetchTask.result()
+        await acursor.execute(regionsMainNodesQuery)
+        self.__regionsMainNodes = await acursor.fetchall()
 
     def __citiesMainNodesQuery(self):
         """
@@ -290,10 +358,13 @@ class RushWGraph:
 
         # Doesn't Include the Intersection of Region Main Warehouses and City Main Warehouses
         return sql.SQL(
-            "SELECT {citiesMain}.{countryNameField}, {citiesMain}.{regionNameField}, {citiesMain}.{cityNameField}, {citiesMain}.{buildingNameField}, {citiesMain}.{warehouseIdField} FROM {connectionsSchemeName}.{cityMainWarehousesViewName} AS {citiesMain} FULL OUTER JOIN {connectionsSchemeName}.{regionMainWarehousesViewName} AS {regionsMain} ON {citiesMain}.{warehouseIdField} = {regionsMain}.{warehouseIdField} WHERE {regionsMain}.{warehouseIdField} IS NULL"
+            "SELECT {citiesMain}.{countryIdField}, {citiesMain}.{countryNameField}, {citiesMain}.{regionIdField}, {citiesMain}.{regionNameField}, {citiesMain}.{cityIdField}, {citiesMain}.{cityNameField}, {citiesMain}.{buildingNameField}, {citiesMain}.{warehouseIdField} FROM {connectionsSchemeName}.{cityMainWarehousesViewName} AS {citiesMain} FULL OUTER JOIN {connectionsSchemeName}.{regionMainWarehousesViewName} AS {regionsMain} ON {citiesMain}.{warehouseIdField} = {regionsMain}.{warehouseIdField} WHERE {regionsMain}.{warehouseIdField} IS NULL"
         ).format(
+            countryIdField=sql.Identifier(COUNTRIES_ID),
             countryNameField=sql.Identifier(COUNTRIES_NAME),
+            regionIdField=sql.Identifier(REGIONS_ID),
             regionNameField=sql.Identifier(REGIONS_NAME),
+            cityIdField=sql.Identifier(CITIES_ID),
             cityNameField=sql.Identifier(CITIES_NAME),
             buildingNameField=sql.Identifier(BUILDINGS_NAME),
             warehouseIdField=sql.Identifier(WAREHOUSES_ID),
@@ -320,10 +391,8 @@ class RushWGraph:
         citiesMainNodesQuery = self.__citiesMainNodesQuery()
 
         # Execute Query and Fetch Items (Nodes)
-        await asyncio.gather(acursor.execute(citiesMainNodesQuery))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self.__citiesMainNodes = fetchTask.result()
+        await acursor.execute(citiesMainNodesQuery)
+        self.__citiesMainNodes = await acursor.fetchall()
 
     def __citiesNodesQuery(self):
         """
@@ -334,10 +403,13 @@ class RushWGraph:
         """
 
         return sql.SQL(
-            "SELECT {warehouses}.{countryNameField}, {warehouses}.{regionNameField}, {warehouses}.{cityNameField}, {warehouses}.{buildingNameField}, {warehouses}.{warehouseIdField} FROM {connectionsSchemeName}.{warehouses} AS {warehouses} FULL OUTER JOIN {connectionsSchemeName}.{cityMainWarehousesViewName} AS {citiesMain} ON {warehouses}.{warehouseIdField} = {citiesMain}.{warehouseIdField} FULL OUTER JOIN {connectionsSchemeName}.{regionMainWarehousesViewName} AS {regionsMain} ON {warehouses}.{warehouseIdField} = {regionsMain}.{warehouseIdField} WHERE {citiesMain}.{warehouseIdField} IS NULL AND {regionsMain}.{warehouseIdField} IS NULL"
+            "SELECT {warehouses}.{countryIdField}, {warehouses}.{countryNameField}, {warehouses}.{regionIdField}, {warehouses}.{regionNameField}, {warehouses}.{cityIdField}, {warehouses}.{cityNameField}, {warehouses}.{buildingNameField}, {warehouses}.{warehouseIdField} FROM {connectionsSchemeName}.{warehouses} AS {warehouses} FULL OUTER JOIN {connectionsSchemeName}.{cityMainWarehousesViewName} AS {citiesMain} ON {warehouses}.{warehouseIdField} = {citiesMain}.{warehouseIdField} FULL OUTER JOIN {connectionsSchemeName}.{regionMainWarehousesViewName} AS {regionsMain} ON {warehouses}.{warehouseIdField} = {regionsMain}.{warehouseIdField} WHERE {citiesMain}.{warehouseIdField} IS NULL AND {regionsMain}.{warehouseIdField} IS NULL"
         ).format(
+            countryIdField=sql.Identifier(COUNTRIES_ID),
             countryNameField=sql.Identifier(COUNTRIES_NAME),
+            regionIdField=sql.Identifier(REGIONS_ID),
             regionNameField=sql.Identifier(REGIONS_NAME),
+            cityIdField=sql.Identifier(CITIES_ID),
             cityNameField=sql.Identifier(CITIES_NAME),
             buildingNameField=sql.Identifier(BUILDINGS_NAME),
             warehouses=sql.Identifier(WAREHOUSES_VIEW_NAME),
@@ -365,10 +437,8 @@ class RushWGraph:
         citiesNodesQuery = self.__citiesNodesQuery()
 
         # Execute Query and Fetch Items (Nodes)
-        await asyncio.gather(acursor.execute(citiesNodesQuery))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self.__citiesNodes = fetchTask.result()
+        await acursor.execute(citiesNodesQuery)
+        self.__citiesNodes = await acursor.fetchall()
 
     def __nodesEdgesQuery(self):
         """
@@ -404,10 +474,76 @@ class RushWGraph:
         nodesEdgesQuery = self.__nodesEdgesQuery()
 
         # Execute Query and Fetch Items (Nodes)
-        await asyncio.gather(acursor.execute(nodesEdgesQuery))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self.__nodesEdges = fetchTask.result()
+        await acursor.execute(nodesEdgesQuery)
+        self.__nodesEdges = await acursor.fetchall()
+
+    def __lockersWarehouseQuery(self):
+        """
+        Method that Retuns a Query to Get All the Lockers ID and the Warehouse ID where they're Located from its Remote Table
+
+        :return: SQL Query to Get All the Lockers ID and its Warehouse ID from its Remote Table
+        :rtype: Composed
+        """
+
+        return sql.SQL(
+            "SELECT {lockerIdField}, {warehouseIdField} FROM {shippingsSchemeName}.{lockersTableName} WHERE {warehouseIdField} IS NOT NULL"
+        ).format(
+            lockerIdField=sql.Identifier(LOCKERS_ID),
+            warehouseIdField=sql.Identifier(LOCKERS_FK_WAREHOUSE),
+            shippingsSchemeName=sql.Identifier(SHIPPINGS_SCHEME_NAME),
+            lockersTableName=sql.Identifier(LOCKERS_TABLE_NAME),
+        )
+
+    async def __getLockersWarehouse(self, acursor):
+        """
+        Asynchronous Method to Get the Index of Lockers ID to the Warehouse ID where they're Located
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Query to Get All the Lockers ID and its Warehouse ID from its Remote Table
+        lockersWarehouseQuery = self.__lockersWarehouseQuery()
+
+        # Execute Query and Fetch Items
+        await acursor.execute(lockersWarehouseQuery)
+        self.__lockersWarehouse = dict(await acursor.fetchall())
+
+    def __branchesWarehouseQuery(self):
+        """
+        Method that Retuns a Query to Get All the Branches ID and its Warehouse Connection ID from its Remote Table
+
+        :return: SQL Query to Get All the Branches ID and its Warehouse Connection ID from its Remote Table
+        :rtype: Composed
+        """
+
+        return sql.SQL(
+            "SELECT {branchIdField}, {warehouseIdField} FROM {locationsSchemeName}.{branchesTableName}"
+        ).format(
+            branchIdField=sql.Identifier(BRANCHES_ID),
+            warehouseIdField=sql.Identifier(BRANCHES_FK_WAREHOUSE_CONNECTION),
+            locationsSchemeName=sql.Identifier(LOCATIONS_SCHEME_NAME),
+            branchesTableName=sql.Identifier(BRANCHES_TABLE_NAME),
+        )
+
+    async def __getBranchesWarehouse(self, acursor):
+        """
+        Asynchronous Method to Get the Index of Branches ID to its Warehouse Connection ID
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Query to Get All the Branches ID and its Warehouse Connection ID from its Remote Table
+        branchesWarehouseQuery = self.__branchesWarehouseQuery()
+
+        # Execute Query and Fetch Items
+        await acursor.execute(branchesWarehouseQuery)
+        self.__branchesWarehouse = dict(await acursor.fetchall())
 
     def __storeGraph(
         self, baseFileName: str, layout: str, level: str, locationId: int
@@ -423,6 +559,9 @@ class RushWGraph:
         :rtype: None
         """
 
+        # Matplotlib is only Imported when a Graph is Drawn
+        import matplotlib.pyplot as plt
+
         # Set Graph Title
         plt.title(f"{RUSWGRAPH_TITLE}: Location ID {locationId} at {level} Table")
 
@@ -488,10 +627,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=REGIONS_MAIN,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                 )
 
             # Add Node with Some Style Attributes (when Drawing)
@@ -499,10 +638,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=REGIONS_MAIN,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                     alpha=GRAPH_REGION_MAIN_WAREHOUSE_NODE_ALPHA,
                     color=GRAPH_REGION_MAIN_WAREHOUSE_NODE_COLOR,
                     edgecolors=GRAPH_WAREHOUSE_NODE_EDGE_COLOR,
@@ -558,10 +697,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=CITIES_MAIN,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                 )
 
             # Add Node with Some Style Attributes (when Drawing)
@@ -569,10 +708,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=CITIES_MAIN,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                     alpha=GRAPH_CITY_MAIN_WAREHOUSE_NODE_ALPHA,
                     color=GRAPH_CITY_MAIN_WAREHOUSE_NODE_COLOR,
                     edgecolors=GRAPH_WAREHOUSE_NODE_EDGE_COLOR,
@@ -601,10 +740,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=CITIES,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                 )
 
             # Add Node with Some Style Attributes (when Drawing)
@@ -612,10 +751,10 @@ class RushWGraph:
                 self.__DiGraph.add_node(
                     key,
                     nodeType=CITIES,
-                    country=unidecode(value[0]),
-                    region=unidecode(value[1]),
-                    city=unidecode(value[2]),
-                    building=unidecode(value[3]),
+                    countryId=value[0],
+                    regionId=value[1],
+                    cityId=value[2],
+                    building=value[3],
                     alpha=GRAPH_CITY_WAREHOUSE_NODE_ALPHA,
                     color=GRAPH_CITY_WAREHOUSE_NODE_COLOR,
                     edgecolors=GRAPH_WAREHOUSE_NODE_EDGE_COLOR,
@@ -715,27 +854,28 @@ class RushWGraph:
         Asynchronous Method to Update the Graph Nodes and Edges
 
         :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
-        :param logger: Flask App Logger. Default is ``None``
+        :param logger: Flask App Logger. Default is ``None``, which Uses the Module Logger
         :return: Nothing
         :rtype: NoneType
         """
 
-        # Get the Connections from the Asynchronous Connection Pool
-        logger.info("Getting Pool Connections...")
-        getTask = asyncio.create_task(apool.getConnections(5))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
+        if logger is None:
+            logger = logging.getLogger(__name__)
 
-        # Get All the Required Warehouses Nodes and Nodes Edges from the Remote Database
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(self.__getAllNodes(aconns[0].cursor()))
-            tg.create_task(self.__getRegionsMainNodes(aconns[1].cursor()))
-            tg.create_task(self.__getCitiesMainNodes(aconns[2].cursor()))
-            tg.create_task(self.__getCitiesNodes(aconns[3].cursor()))
-            tg.create_task(self.__getNodesEdges(aconns[4].cursor()))
+        # Lease the Connections from the Asynchronous Connection Pool
+        logger.info("Getting Pool Connections...")
+        async with apool.lease(7) as aconns:
+            # Get All the Required Warehouses Nodes and Nodes Edges from the Remote Database
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.__getAllNodes(aconns[0].cursor()))
+                tg.create_task(self.__getRegionsMainNodes(aconns[1].cursor()))
+                tg.create_task(self.__getCitiesMainNodes(aconns[2].cursor()))
+                tg.create_task(self.__getCitiesNodes(aconns[3].cursor()))
+                tg.create_task(self.__getNodesEdges(aconns[4].cursor()))
+                tg.create_task(self.__getLockersWarehouse(aconns[5].cursor()))
+                tg.create_task(self.__getBranchesWarehouse(aconns[6].cursor()))
 
-        # Put the Connections Back to the Asynchronous Connection Pool
-        putTask = asyncio.create_task(apool.putConnections(aconns))
+        logger.info("Returned Pool Connections")
 
         # Get Current Warehouse Nodes to Check
         self.__nodesToCheck = dict(self.__DiGraph.nodes(data=GRAPH_WAREHOUSE_NODE_TYPE))
@@ -758,13 +898,15 @@ class RushWGraph:
         # Set Nodes Edges
         self.__setNodesEdges(self.__draw, True)
 
+        # Clear the Shortest Routes, the Nodes JSON Fragments and the Adjacency Matrix Cached with the Previous Graph
+        self.__routesCache = {}
+        self.__nodesFragment = {}
+        self.__csrMatrix = None
+
         # Set the Graph as Available
         self.__busy = False
         logger.info("Rush Cargo Warehouses Graph has been Updated")
 
-        await asyncio.gather(putTask)
-        logger.info("Returned Pool Connections")
-
     def draw(
         self, layout: str, level: str, locationId: int, warehouseIds: list[int]
     ) -> None:
@@ -849,6 +991,9 @@ class RushWGraph:
         # Get Nodes Edges Attributes
         edgeColor = self.__getEdgesValue(subgraph, "edge_color")
 
+        # Matplotlib is only Imported when a Graph is Drawn
+        import matplotlib.pyplot as plt
+
         # Draw the Graph with the Given Layout, and Save it Locally
         plt.figure()
         nx.draw_networkx_nodes(
@@ -880,6 +1025,99 @@ class RushWGraph:
         # Drawing Arguments
         self.__storeGraph(RUSHWGRAPH_FILENAME, layout, level, locationId)
 
+    def getLockerWarehouseId(self, lockerId: int) -> int | None:
+        """
+        Method to Get the Warehouse ID where a Given Locker is Located
+
+        :param int lockerId: Locker ID at its Remote Table
+        :return: Warehouse ID. ``None`` if the Locker wasn't Found
+        :rtype: int if the Locker was Found. Otherwise, NoneType
+        """
+
+        return self.__lockersWarehouse.get(int(lockerId))
+
+    def getBranchWarehouseId(self, branchId: int) -> int | None:
+        """
+        Method to Get the Warehouse ID that's Connected with a Given Branch
+
+        :param int branchId: Branch ID at its Remote Table
+        :return: Warehouse ID. ``None`` if the Branch wasn't Found
+        :rtype: int if the Branch was Found. Otherwise, NoneType
+        """
+
+        return self.__branchesWarehouse.get(int(branchId))
+
+    def __getNodeData(self, node: int) -> dict:
+        """
+        Method to Get the Data of a Given Warehouse Node that's Sent at the Route Responses
+
+        :param int node: Warehouse Node ID
+        :return: Dictionary that Contains the Node ID, the Decoded Locations Name where it's Located and its Building Name
+        :rtype: dict
+        """
+
+        nodeData = self.__DiGraph.nodes[node]
+
+        return {
+            "id": node,
+            "country": self.__getDecodedName(
+                self.__countriesName[nodeData["countryId"]]
+            ),
+            "region": self.__getDecodedName(self.__regionsName[nodeData["regionId"]]),
+            "city": self.__getDecodedName(self.__citiesName[nodeData["cityId"]]),
+            "building": self.__getDecodedName(nodeData["building"]),
+        }
+
+    def __getNodeFragment(self, node: int) -> bytes:
+        """
+        Method to Get the JSON Fragment of the Data of a Given Warehouse Node, without the Enclosing Braces. Each Fragment is Encoded only Once per Graph Version
+
+        :param int node: Warehouse Node ID
+        :return: JSON Fragment of the Node Data
+        :rtype: bytes
+        """
+
+        nodeFragment = self.__nodesFragment.get(node)
+
+        if nodeFragment is None:
+            nodeFragment = self.__nodesFragment[node] = jsonDumps(
+                self.__getNodeData(node)
+            )[1:-1]
+
+        return nodeFragment
+
+    def __getShortestRoute(
+        self, warehouseFromId: int, warehouseToId: int
+    ) -> tuple[list[int], int]:
+        """
+        Method to Get the Node IDs that Constitute the Shortest Path between the Two Warehouse Nodes, and the Route Distance. The Result is Cached until the Next Graph Update
+
+        :param int warehouseFromId: Starting Node ID
+        :param int warehouseToId: End Node ID
+        :return: Tuple that Contains the List of Node IDs, and the Route Distance
+        :rtype: tuple
+        """
+
+        # Check if the Route has been Cached
+        routesCache = self.__routesCache
+        routeKey = (int(warehouseFromId), int(warehouseToId))
+
+        if routeKey in routesCache:
+            return routesCache[routeKey]
+
+        # Get Nodes that Constitute the Shortest Path between the Two Nodes, and the Distance between Them
+        routeDistance, nodes = nx.single_source_dijkstra(
+            self.__DiGraph, routeKey[0], routeKey[1], weight="weight"
+        )
+
+        # Cache the Route. Drop the Oldest One if the Cache is Full
+        if len(routesCache) >= RUSHWGRAPH_ROUTES_CACHE_SIZE:
+            routesCache.pop(next(iter(routesCache)), None)
+
+        routesCache[routeKey] = (nodes, routeDistance)
+
+        return nodes, routeDistance
+
     def getShortest(self, warehouseFromId: int, warehouseToId: int) -> tuple[list, int]:
         """
         Method to Get the Shortest Path between the Two Warehouse Nodes
@@ -888,40 +1126,163 @@ class RushWGraph:
         :rtype: tuple
         """
 
-        # Get Nodes that Constitute the Shortest Path between the Two Nodes
-        nodes = nx.shortest_path(
-            self.__DiGraph, int(warehouseFromId), int(warehouseToId), weight="weight"
+        nodes, routeDistance = self.__getShortestRoute(warehouseFromId, warehouseToId)
+
+        # Get Nodes Attributes
+        nodesAttr = [
+            {"pos": pos, **self.__getNodeData(node)} for pos, node in enumerate(nodes)
+        ]
+
+        return nodesAttr, routeDistance
+
+    def getShortestJson(self, warehouseFromId: int, warehouseToId: int) -> bytes:
+        """
+        Method to Get the Shortest Path between the Two Warehouse Nodes as a JSON Response Body. It's Assembled from the Precomputed Nodes JSON Fragments
+
+        :param int warehouseFromId: Starting Node ID
+        :param int warehouseToId: End Node ID
+        :return: JSON Object with the ``nodes`` and ``distance`` Fields
+        :rtype: bytes
+        """
+
+        nodes, routeDistance = self.__getShortestRoute(warehouseFromId, warehouseToId)
+
+        nodesJson = b",".join(
+            b'{"pos":%d,%b}' % (pos, self.__getNodeFragment(node))
+            for pos, node in enumerate(nodes)
+        )
+
+        return b'{"nodes":[%b],"distance":%b}' % (nodesJson, jsonDumps(routeDistance))
+
+    def getBatchDistances(
+        self,
+        pairs: Iterable[tuple[int, int]],
+        workers: int = None,
+        chunkSize: int = SOLVER_CHUNK_SIZE,
+    ):
+        """
+        Generator Method to Get the Route Distance between Several Pairs of Warehouse Nodes with a Pool of Worker Processes, which Attach to a Shared Memory Copy of the Sparse Adjacency Matrix. Results are Streamed Back in Chunks
+
+        :param pairs: Iterable of Tuples that Contain the Starting and End Node IDs. It's Read Lazily
+        :param int workers: Number of Worker Processes. Default is ``None``, which Uses the Number of CPUs
+        :param int chunkSize: Maximum Number of Pairs per Chunk. Default is ``SOLVER_CHUNK_SIZE``
+        :return: Iterator of Lists of Tuples that Contain the Starting Node ID, the End Node ID and the Route Distance. ``None`` if there's no Path between Them
+        :rtype: Iterator
+        """
+
+        csrMatrix, csrNodes, _ = self.getCsrMatrix()
+
+        return solveBatch(csrMatrix, csrNodes, pairs, workers, chunkSize)
+
+    def getCsrMatrix(self) -> tuple[csr_matrix, list[int], dict]:
+        """
+        Method to Get the Graph Edges Weight as a SciPy Sparse Adjacency Matrix. The Matrix is Cached until the Next Graph Update
+
+        :return: Tuple that Contains the Sparse Adjacency Matrix, the List of Node IDs at each Matrix Index, and the Dictionary of Matrix Indexes by Node ID
+        :rtype: tuple
+        """
+
+        # Check if the Matrix has been Cached
+        if self.__csrMatrix is not None:
+            return self.__csrMatrix, self.__csrNodes, self.__csrIndex
+
+        csrNodes = list(self.__DiGraph)
+        csrIndex = {node: i for i, node in enumerate(csrNodes)}
+
+        # Get the Edges Weight with its Nodes Matrix Index
+        edges = self.__DiGraph.edges(data="weight")
+        nEdges = self.__DiGraph.number_of_edges()
+
+        rows = np.empty(nEdges, dtype=np.int32)
+        cols = np.empty(nEdges, dtype=np.int32)
+        weights = np.empty(nEdges, dtype=np.float64)
+
+        for i, (warehouseFromId, warehouseToId, weight) in enumerate(edges):
+            rows[i] = csrIndex[warehouseFromId]
+            cols[i] = csrIndex[warehouseToId]
+            weights[i] = weight
+
+        csrMatrix = csr_matrix(
+            (weights, (rows, cols)), shape=(len(csrNodes), len(csrNodes))
+        )
+
+        # Cache the Matrix
+        self.__csrNodes = csrNodes
+        self.__csrIndex = csrIndex
+        self.__csrMatrix = csrMatrix
+
+        return csrMatrix, csrNodes, csrIndex
+
+    def distanceMatrix(
+        self, sources: list[int], targets: list[int] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Method to Get the Route Distance Matrix between Several Starting and End Warehouse Nodes with SciPy Dijkstra's Algorithm
+
+        :param list sources: List of Starting Node IDs
+        :param list targets: List of End Node IDs. Default is ``None``, which Uses All the Graph Nodes
+        :return: Tuple that Contains the Distance Matrix (``inf`` if there's no Path between the Nodes), of Shape ``(len(sources), len(targets))``, and the Predecessors Matrix by Matrix Index, of Shape ``(len(sources), nNodes)``
+        :rtype: tuple
+        :raises KeyError: Raised when a Node ID is not Inside the Graph
+        """
+
+        csrMatrix, csrNodes, csrIndex = self.getCsrMatrix()
+
+        # Get the Nodes Matrix Indexes
+        sourcesIndex = [csrIndex[int(node)] for node in sources]
+        targetsIndex = (
+            None if targets is None else [csrIndex[int(node)] for node in targets]
         )
 
-        # Get the Distance between the Two Nodes
-        routeDistance = nx.shortest_path_length(
-            self.__DiGraph, int(warehouseFromId), int(warehouseToId), weight="weight"
+        distances, predecessors = dijkstra(
+            csrMatrix,
+            directed=True,
+            indices=sourcesIndex,
+            return_predecessors=True,
         )
 
-        # Nodes Attributes List
-        nodesAttr = []
-        pos = 0
+        # Keep only the Distances to the End Nodes
+        if targetsIndex is not None:
+            distances = distances[:, targetsIndex]
 
-        # Get Nodes Attributes
-        countryName = nx.get_node_attributes(self.__DiGraph, name="country")
-        regionName = nx.get_node_attributes(self.__DiGraph, name="region")
-        cityName = nx.get_node_attributes(self.__DiGraph, name="city")
-        buildingName = nx.get_node_attributes(self.__DiGraph, name="building")
-
-        for node in nodes:
-            nodesAttr.append(
-                {
-                    "pos": pos,
-                    "id": node,
-                    "country": countryName[node],
-                    "region": regionName[node],
-                    "city": cityName[node],
-                    "building": buildingName[node],
-                }
-            )
-            pos += 1
+        return distances, predecessors
 
-        return nodesAttr, routeDistance
+    def getMatrixPath(
+        self,
+        predecessors: np.ndarray,
+        sourcePos: int,
+        warehouseFromId: int,
+        warehouseToId: int,
+    ) -> list[int]:
+        """
+        Method to Reconstruct the Shortest Path between Two Nodes from the Predecessors Matrix Returned by ``distanceMatrix``
+
+        :param predecessors: Predecessors Matrix Returned by ``distanceMatrix``
+        :param int sourcePos: Position of the Starting Node at the ``sources`` List Passed to ``distanceMatrix``
+        :param int warehouseFromId: Starting Node ID
+        :param int warehouseToId: End Node ID
+        :return: List of Node IDs that Constitute the Shortest Path. Empty if there's no Path between the Nodes
+        :rtype: list
+        """
+
+        _, csrNodes, csrIndex = self.getCsrMatrix()
+        row = predecessors[sourcePos]
+
+        # Walk Back from the End Node until a Node without Predecessor is Reached
+        i = csrIndex[int(warehouseToId)]
+        path = []
+
+        while i >= 0:
+            path.append(csrNodes[i])
+            i = row[i]
+
+        # Check if the Walk Ended at the Starting Node
+        if path[-1] != int(warehouseFromId):
+            return []
+
+        path.reverse()
+
+        return path
 
     def hasPath(self, warehouseFromId: int, warehouseToId: int) -> bool:
         """
@@ -933,4 +1294,8 @@ class RushWGraph:
         :rtype: bool
         """
 
+        # Check if the Route has been Cached
+        if (int(warehouseFromId), int(warehouseToId)) in self.__routesCache:
+            return True
+
         return nx.has_path(self.__DiGraph, int(warehouseFromId), int(warehouseToId))
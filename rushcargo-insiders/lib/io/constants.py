@@ -16,6 +16,7 @@ CMD_TYPE = "cmdType"
 # Action Type Commands
 DB = "db"
 GRAPH = "graph"
+IMPORT = "import"
 
 # Avalaible Main Commands
 CMD_TYPE_CMDS = [DB, GRAPH, EXIT]
@@ -29,6 +30,10 @@ DB_TABLE = "table"
 GRAPH_TYPE = "type"
 GRAPH_LEVEL = "level"
 
+# Import-related Action Parsers
+IMPORT_TABLE = "table"
+IMPORT_FILE = "file"
+
 # Action-related Commands
 DB_ADD = "add"
 DB_RM = "rm"
@@ -61,3 +66,11 @@ GRAPH_TYPE_CMDS = [WAREHOUSES_TABLE_NAME]
 
 # Graph Level Available Commands
 GRAPH_LEVEL_CMDS = [COUNTRIES_TABLE_NAME, REGIONS_TABLE_NAME, CITIES_TABLE_NAME, EXIT]
+
+# Import Table Available Commands
+IMPORT_TABLE_CMDS = [
+    COUNTRIES_TABLE_NAME,
+    REGIONS_TABLE_NAME,
+    CITIES_TABLE_NAME,
+    WAREHOUSES_TABLE_NAME,
+]
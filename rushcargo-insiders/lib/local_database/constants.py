@@ -34,3 +34,27 @@ LOCAL_NOMINATIM_CITY_MAX = 2 * LOCAL_NOMINATIM_REGION_MAX
 
 # Times its Corresponding Location. Maximum Number of Searches for Given Table
 LOCAL_NOMINATIM_LOCATION_SEARCH_MAX = 10
+
+# Route Distances Cache Database Name and Table
+ROUTES_DATABASE_NAME = "routes.db"
+ROUTES_TABLE_NAME = "route_distances"
+
+# Route Distances Table Columns
+ROUTES_LON_FROM = "lon_from"
+ROUTES_LAT_FROM = "lat_from"
+ROUTES_LON_TO = "lon_to"
+ROUTES_LAT_TO = "lat_to"
+ROUTES_PROFILE = "profile"
+ROUTES_DISTANCE = "distance"
+ROUTES_CREATED_AT = "created_at"
+ROUTES_ACCESSED_AT = "accessed_at"
+
+# Number of Decimals Kept from Each Coordinate. Five Decimals are about One Meter, so Points that Only Differ by Float Noise Share the Same Key
+ROUTES_CACHE_PRECISION = 5
+
+# Seconds a Route Distance is Valid, since Roads can Change
+ROUTES_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Maximum Number of Route Distances Stored. The Least Recently Used Ones are Evicted when It's Surpassed, which is Checked every Given Number of Insertions
+ROUTES_CACHE_MAX_ROWS = 100000
+ROUTES_CACHE_EVICT_EVERY = 500
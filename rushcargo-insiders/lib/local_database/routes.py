@@ -0,0 +1,245 @@
+import sqlite3
+import threading
+import time
+
+from .constants import *
+from ..geocoding.constants import NOMINATIM_LATITUDE, NOMINATIM_LONGITUDE
+
+
+def quantizeCoord(coord) -> int:
+    """
+    Function to Round a Coordinate to ``ROUTES_CACHE_PRECISION`` Decimals, and Store It as an Integer
+
+    :param coord: Latitude or Longitude. It can be a String, a Float or a Decimal
+    :return: Quantized Coordinate
+    :rtype: int
+    """
+
+    return round(float(coord) * 10**ROUTES_CACHE_PRECISION)
+
+
+class RouteDistancesCache:
+    """
+    Local Route Distances Cache Class. It Stores the Route Distances Returned by the Routing API, Keyed by the Quantized Coordinates of Both Points and the Route Profile, so They're Kept between Sessions. The Profile also Names how the Distance was Requested, since Different Requests can Return Different Routes between the Same Points
+    """
+
+    # Database Connection
+    __dbname = ROUTES_DATABASE_NAME
+    __conn = None
+    __c = None
+
+    # Lock to Use the Connection from the Event Loop and the Worker Threads
+    __lock = None
+
+    # Seconds a Route Distance is Valid, and Maximum Number of Route Distances Stored
+    __ttl = None
+    __maxRows = None
+
+    # Number of Route Distances Inserted since the Last Eviction
+    __inserts = None
+
+    def __init__(
+        self, ttl: int = ROUTES_CACHE_TTL, maxRows: int = ROUTES_CACHE_MAX_ROWS
+    ):
+        """
+        Route Distances Cache Class Constructor
+
+        :param int ttl: Seconds a Route Distance is Valid. Default is ``ROUTES_CACHE_TTL``
+        :param int maxRows: Maximum Number of Route Distances Stored. Default is ``ROUTES_CACHE_MAX_ROWS``
+        """
+
+        self.__ttl = ttl
+        self.__maxRows = maxRows
+        self.__inserts = 0
+        self.__lock = threading.Lock()
+
+        # Store Database Connection
+        self.__conn = sqlite3.connect(
+            self.__dbname, timeout=LOCAL_TIMEOUT, check_same_thread=False
+        )
+        self.__c = self.__conn.cursor()
+
+        # Initialize Route Distances Table
+        self.__initTable()
+
+    def __initTable(self) -> None:
+        """
+        Method to Create the Route Distances Table if It doesn't Exist, and Remove the Expired Route Distances
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        # Write-Ahead Log, so Committing Each Lookup doesn't Sync the Whole Database
+        self.__c.execute("PRAGMA journal_mode=WAL;")
+        self.__c.execute("PRAGMA synchronous=NORMAL;")
+
+        # Query to Create the Route Distances Table in the Local Database
+        query = f"CREATE TABLE IF NOT EXISTS {ROUTES_TABLE_NAME} ({ROUTES_LON_FROM} INT NOT NULL, {ROUTES_LAT_FROM} INT NOT NULL, {ROUTES_LON_TO} INT NOT NULL, {ROUTES_LAT_TO} INT NOT NULL, {ROUTES_PROFILE} VARCHAR(50) NOT NULL, {ROUTES_DISTANCE} INT NOT NULL, {ROUTES_CREATED_AT} REAL NOT NULL, {ROUTES_ACCESSED_AT} REAL NOT NULL, PRIMARY KEY ({ROUTES_LON_FROM}, {ROUTES_LAT_FROM}, {ROUTES_LON_TO}, {ROUTES_LAT_TO}, {ROUTES_PROFILE})) WITHOUT ROWID;"
+        self.__c.execute(query)
+
+        # Query to Create the Index Used to Find the Least Recently Used Route Distances
+        query = f"CREATE INDEX IF NOT EXISTS {ROUTES_TABLE_NAME}_{ROUTES_ACCESSED_AT} ON {ROUTES_TABLE_NAME} ({ROUTES_ACCESSED_AT});"
+        self.__c.execute(query)
+
+        self.__evict()
+
+    def __del__(self):
+        """
+        Route Distances Cache Class Destructor
+        """
+
+        # Commit Command
+        if self.__conn != None:
+            self.__conn.commit()
+
+        # Close Connection
+        if self.__c != None:
+            self.__c.close()
+
+        if self.__conn != None:
+            self.__conn.close()
+
+    def __getKey(self, coords1: dict, coords2: dict, profile: str) -> tuple:
+        """
+        Method to Get the Key of the Route between Two Coordinates
+
+        :param dict coords1: Coordinates Dictionary of the Starting Point
+        :param dict coords2: Coordinates Dictionary of the End Point
+        :param str profile: Route Profile, Together with the Request Type that Returned the Route Distance
+        :return: Quantized Longitude and Latitude of Both Points, and the Route Profile
+        :rtype: tuple
+        """
+
+        return (
+            quantizeCoord(coords1[NOMINATIM_LONGITUDE]),
+            quantizeCoord(coords1[NOMINATIM_LATITUDE]),
+            quantizeCoord(coords2[NOMINATIM_LONGITUDE]),
+            quantizeCoord(coords2[NOMINATIM_LATITUDE]),
+            profile,
+        )
+
+    def __evict(self) -> None:
+        """
+        Method to Remove the Expired Route Distances, and the Least Recently Used Ones that Surpass the Maximum Number of Rows. The Lock must be Held by the Caller, or the Connection must not be Shared yet
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        # Remove Expired Route Distances
+        query = f"DELETE FROM {ROUTES_TABLE_NAME} WHERE {ROUTES_CREATED_AT} < ?"
+        self.__c.execute(query, (time.time() - self.__ttl,))
+
+        # Get the Access Time of the First Route Distance that doesn't Fit
+        query = f"SELECT {ROUTES_ACCESSED_AT} FROM {ROUTES_TABLE_NAME} ORDER BY {ROUTES_ACCESSED_AT} DESC LIMIT 1 OFFSET ?"
+        self.__c.execute(query, (self.__maxRows,))
+        row = self.__c.fetchone()
+
+        # Remove It and the Ones Accessed before It
+        if row != None:
+            query = f"DELETE FROM {ROUTES_TABLE_NAME} WHERE {ROUTES_ACCESSED_AT} <= ?"
+            self.__c.execute(query, row)
+
+        self.__conn.commit()
+        self.__inserts = 0
+
+    def getMany(self, pairs: list[tuple[dict, dict]], profile: str) -> list[int | None]:
+        """
+        Method to Get the Stored Route Distances between Some Pairs of Coordinates
+
+        :param list pairs: List of Tuples with the Coordinates Dictionaries of the Starting and End Points
+        :param str profile: Route Profile
+        :return: List with the Route Distance of Each Pair in meters. It's ``None`` if It isn't Stored or It has Expired
+        :rtype: list
+        """
+
+        distances = []
+        hits = []
+        now = time.time()
+
+        # Query to Get a Route Distance and the Time It was Stored
+        query = f"SELECT {ROUTES_DISTANCE}, {ROUTES_CREATED_AT} FROM {ROUTES_TABLE_NAME} WHERE {ROUTES_LON_FROM} = ? AND {ROUTES_LAT_FROM} = ? AND {ROUTES_LON_TO} = ? AND {ROUTES_LAT_TO} = ? AND {ROUTES_PROFILE} = ?"
+
+        with self.__lock:
+            for coords1, coords2 in pairs:
+                key = self.__getKey(coords1, coords2, profile)
+
+                self.__c.execute(query, key)
+                row = self.__c.fetchone()
+
+                # Check if It's Stored and It hasn't Expired
+                if row == None or now - row[1] >= self.__ttl:
+                    distances.append(None)
+                    continue
+
+                distances.append(row[0])
+                hits.append((now,) + key)
+
+            # Update the Access Time of the Route Distances Found
+            if len(hits) > 0:
+                update = f"UPDATE {ROUTES_TABLE_NAME} SET {ROUTES_ACCESSED_AT} = ? WHERE {ROUTES_LON_FROM} = ? AND {ROUTES_LAT_FROM} = ? AND {ROUTES_LON_TO} = ? AND {ROUTES_LAT_TO} = ? AND {ROUTES_PROFILE} = ?"
+                self.__c.executemany(update, hits)
+                self.__conn.commit()
+
+        return distances
+
+    def get(self, coords1: dict, coords2: dict, profile: str) -> int | None:
+        """
+        Method to Get the Stored Route Distance between Two Coordinates
+
+        :param dict coords1: Coordinates Dictionary of the Starting Point
+        :param dict coords2: Coordinates Dictionary of the End Point
+        :param str profile: Route Profile
+        :return: Route Distance between the Two Points in meters. It's ``None`` if It isn't Stored or It has Expired
+        :rtype: int if It's Stored. Otherwise, NoneType
+        """
+
+        return self.getMany([(coords1, coords2)], profile)[0]
+
+    def setMany(self, routes: list[tuple[dict, dict, int]], profile: str) -> None:
+        """
+        Method to Store the Route Distances between Some Pairs of Coordinates
+
+        :param list routes: List of Tuples with the Coordinates Dictionaries of the Starting and End Points, and their Route Distance in meters
+        :param str profile: Route Profile
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        if len(routes) == 0:
+            return
+
+        now = time.time()
+
+        # Query to Insert or Replace a Route Distance
+        query = f"INSERT OR REPLACE INTO {ROUTES_TABLE_NAME} ({ROUTES_LON_FROM}, {ROUTES_LAT_FROM}, {ROUTES_LON_TO}, {ROUTES_LAT_TO}, {ROUTES_PROFILE}, {ROUTES_DISTANCE}, {ROUTES_CREATED_AT}, {ROUTES_ACCESSED_AT}) VALUES (?,?,?,?,?,?,?,?)"
+
+        rows = [
+            self.__getKey(coords1, coords2, profile) + (distance, now, now)
+            for coords1, coords2, distance in routes
+        ]
+
+        with self.__lock:
+            self.__c.executemany(query, rows)
+            self.__conn.commit()
+
+            # Evict Route Distances Periodically, instead of Counting the Rows at Each Insertion
+            self.__inserts += len(rows)
+
+            if self.__inserts >= ROUTES_CACHE_EVICT_EVERY:
+                self.__evict()
+
+    def set(self, coords1: dict, coords2: dict, profile: str, distance: int) -> None:
+        """
+        Method to Store the Route Distance between Two Coordinates
+
+        :param dict coords1: Coordinates Dictionary of the Starting Point
+        :param dict coords2: Coordinates Dictionary of the End Point
+        :param str profile: Route Profile
+        :param int distance: Route Distance between the Two Points in meters
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        self.setMany([(coords1, coords2, distance)], profile)
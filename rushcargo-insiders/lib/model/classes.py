@@ -3,10 +3,13 @@ class Country:
     Country Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = ("name", "phonePrefix", "countryId")
+
     # Public Fields
-    name: str = None
-    phonePrefix: int = None
-    countryId: int = None
+    name: str
+    phonePrefix: int
+    countryId: int
 
     def __init__(self, name: str, phonePrefix: int, countryId: int = None):
         """
@@ -35,19 +38,41 @@ class Country:
 
         return cls(name, phonePrefix, countryId)
 
+    @classmethod
+    def rowFactory(cls, cursor):
+        """
+        Country Classmethod that Works as a ``psycopg`` Row Factory, so the Cursor Initializes the Country Objects Directly from the Fetched Rows
+
+        :param cursor: Cursor that Fetches the Rows from Country Remote Table
+        :return: Function that Initializes a Country Object from a Fetched Row
+        :rtype: Callable
+        """
+
+        return cls.fromFetchedItem
+
 
 class Region:
     """
     Region Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = (
+        "name",
+        "countryId",
+        "regionId",
+        "airForwarderId",
+        "oceanForwarderId",
+        "warehouseId",
+    )
+
     # Public Fields
-    name: str = None
-    countryId: int = None
-    regionId: int = None
-    airForwarderId: int = None
-    oceanForwarderId: int = None
-    warehouseId: int = None
+    name: str
+    countryId: int
+    regionId: int
+    airForwarderId: int
+    oceanForwarderId: int
+    warehouseId: int
 
     def __init__(
         self,
@@ -93,17 +118,32 @@ class Region:
             name, countryId, regionId, airForwarderId, oceanForwarderId, warehouseId
         )
 
+    @classmethod
+    def rowFactory(cls, cursor):
+        """
+        Region Classmethod that Works as a ``psycopg`` Row Factory, so the Cursor Initializes the Region Objects Directly from the Fetched Rows
+
+        :param cursor: Cursor that Fetches the Rows from Region Remote Table
+        :return: Function that Initializes a Region Object from a Fetched Row
+        :rtype: Callable
+        """
+
+        return cls.fromFetchedItem
+
 
 class City:
     """
     City Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = ("name", "regionId", "cityId", "warehouseId")
+
     # Public Fields
-    name: str = None
-    regionId: int = None
-    cityId: int = None
-    warehouseId: int = None
+    name: str
+    regionId: int
+    cityId: int
+    warehouseId: int
 
     def __init__(
         self,
@@ -140,21 +180,45 @@ class City:
 
         return cls(name, regionId, cityId, warehouseId)
 
+    @classmethod
+    def rowFactory(cls, cursor):
+        """
+        City Classmethod that Works as a ``psycopg`` Row Factory, so the Cursor Initializes the City Objects Directly from the Fetched Rows
+
+        :param cursor: Cursor that Fetches the Rows from City Remote Table
+        :return: Function that Initializes a City Object from a Fetched Row
+        :rtype: Callable
+        """
+
+        return cls.fromFetchedItem
+
 
 class Building:
     """
     Building Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = (
+        "buildingId",
+        "buildingName",
+        "cityId",
+        "addressDescription",
+        "gpsLatitude",
+        "gpsLongitude",
+        "phone",
+        "email",
+    )
+
     # Public Fields
-    buildingId: int = None
-    buildingName: str = None
-    cityId: int = None
-    addressDescription: str = None
-    gpsLatitude: float = None
-    gpsLongitude: float = None
-    phone: int = None
-    email: str = None
+    buildingId: int
+    buildingName: str
+    cityId: int
+    addressDescription: str
+    gpsLatitude: float
+    gpsLongitude: float
+    phone: int
+    email: str
 
     def __init__(
         self,
@@ -221,12 +285,27 @@ class Building:
             buildingId,
         )
 
+    @classmethod
+    def rowFactory(cls, cursor):
+        """
+        Building Classmethod that Works as a ``psycopg`` Row Factory, so the Cursor Initializes the Building Objects Directly from the Fetched Rows
+
+        :param cursor: Cursor that Fetches the Rows from Building Remote Table
+        :return: Function that Initializes a Building Object from a Fetched Row
+        :rtype: Callable
+        """
+
+        return cls.fromFetchedItem
+
 
 class Warehouse(Building):
     """
     Warehouse Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = ()
+
     def __init__(
         self,
         buildingName: str,
@@ -302,10 +381,12 @@ class Branch(Building):
     Branch Class that Represents a Row from its Remote Table
     """
 
+    # Instance Fields, without a Per-instance Dictionary
+    __slots__ = ("warehouseConnection", "routeDistance")
+
     # Public Fields
-    branchId: int = None
-    warehouseConnection: int = None
-    routeDistance: float = None
+    warehouseConnection: int
+    routeDistance: float
 
     def __init__(
         self,
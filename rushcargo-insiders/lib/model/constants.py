@@ -7,8 +7,36 @@ ROUTES_DEBUG_MODE = False
 # Maximum Route Distance (500km, between 5-6h by Vehicle)
 ROUTE_DISTANCE_MAX = 500000
 
-# Asynchronous Pool Variables. MUST NOT BE LESS THAN 12
+# Asynchronous Pool Default Configuration. Can be Overriden at the .env File
 APOOL_MIN_SIZE = 12
+APOOL_MAX_SIZE = 24
+APOOL_TIMEOUT = 30.0
+APOOL_MAX_WAITING = 0
+APOOL_MAX_IDLE = 600.0
+APOOL_MAX_LIFETIME = 3600.0
+APOOL_CHECK = True
+
+# Timeout in Seconds for the Asynchronous Pool Health Probe
+APOOL_HEALTH_TIMEOUT = 5.0
+
+# Asynchronous Pool Statistics Keys
+APOOL_STATS_POOL_SIZE = "pool_size"
+APOOL_STATS_POOL_AVAILABLE = "pool_available"
+APOOL_STATS_POOL_MAX = "pool_max"
+APOOL_STATS_IN_USE = "connections_in_use"
+APOOL_STATS_REQUESTS_WAITING = "requests_waiting"
+APOOL_STATS_REQUESTS_WAIT_MS = "requests_wait_ms"
+APOOL_STATS_REQUESTS_ERRORS = "requests_errors"
+APOOL_STATS_CONNECTIONS_ERRORS = "connections_errors"
+
+# Prepare the Table Classes Queries Server-side, so Repeated Lookups Skip the Parse and Plan Steps. Must be Disabled behind Transaction-level Poolers
+PREPARE_QUERIES = True
+
+# Number of Rows Fetched and Printed per Page when Streaming a Whole Table
+ALL_PAGE_SIZE = 500
+
+# Seconds the Location Hierarchy Cache is Trusted before It's Reloaded, to Pick Up Changes Made by Other Processes
+LOCATIONS_CACHE_TTL = 300
 
 # Environment Variables
 ENV_HOST = "HOST"
@@ -18,6 +46,14 @@ ENV_USER = "USER"
 ENV_PASSWORD = "PASSWORD"
 ENV_PORT = "PORT"
 ENV_ORS_API_KEY = "ORS_API_KEY"
+ENV_DISTANCE_PROVIDER = "DISTANCE_PROVIDER"
+ENV_APOOL_MIN_SIZE = "APOOL_MIN_SIZE"
+ENV_APOOL_MAX_SIZE = "APOOL_MAX_SIZE"
+ENV_APOOL_TIMEOUT = "APOOL_TIMEOUT"
+ENV_APOOL_MAX_WAITING = "APOOL_MAX_WAITING"
+ENV_APOOL_MAX_IDLE = "APOOL_MAX_IDLE"
+ENV_APOOL_MAX_LIFETIME = "APOOL_MAX_LIFETIME"
+ENV_APOOL_CHECK = "APOOL_CHECK"
 
 # Theme Styles
 THEME = Theme(
@@ -139,6 +175,16 @@ RECEIVERS_WAREHOUSE_CONN_ID = "connection_id"
 SENDERS_WAREHOUSE_ID = "warehouse_id"
 SENDERS_WAREHOUSE_CONN_ID = "connection_id"
 
+# Shippings Scheme Name
+SHIPPINGS_SCHEME_NAME = "shippings"
+
+# Shippings Scheme Tables Name
+LOCKERS_TABLE_NAME = "lockers"
+
+# Lockers Table Columns
+LOCKERS_ID = "locker_id"
+LOCKERS_FK_WAREHOUSE = "warehouse"
+
 # Warehouse Connection Types
 CONN_TYPE_REGION = "Region"
 CONN_TYPE_CITY = "City"
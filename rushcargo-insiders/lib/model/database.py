@@ -1,5 +1,6 @@
 import asyncio
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,6 +11,21 @@ from rich.console import Console
 
 from .constants import (
     APOOL_MIN_SIZE,
+    APOOL_MAX_SIZE,
+    APOOL_TIMEOUT,
+    APOOL_MAX_WAITING,
+    APOOL_MAX_IDLE,
+    APOOL_MAX_LIFETIME,
+    APOOL_CHECK,
+    APOOL_HEALTH_TIMEOUT,
+    APOOL_STATS_POOL_SIZE,
+    APOOL_STATS_POOL_AVAILABLE,
+    APOOL_STATS_POOL_MAX,
+    APOOL_STATS_IN_USE,
+    APOOL_STATS_REQUESTS_WAITING,
+    APOOL_STATS_REQUESTS_WAIT_MS,
+    APOOL_STATS_REQUESTS_ERRORS,
+    APOOL_STATS_CONNECTIONS_ERRORS,
     THEME,
     ENV_HOST,
     ENV_DBPORT,
@@ -18,7 +34,15 @@ from .constants import (
     ENV_PASSWORD,
     ENV_PORT,
     ENV_ORS_API_KEY,
+    ENV_APOOL_MIN_SIZE,
+    ENV_APOOL_MAX_SIZE,
+    ENV_APOOL_TIMEOUT,
+    ENV_APOOL_MAX_WAITING,
+    ENV_APOOL_MAX_IDLE,
+    ENV_APOOL_MAX_LIFETIME,
+    ENV_APOOL_CHECK,
 )
+from .exceptions import PoolLoopError
 
 # Set Custom Theme
 console = Console(theme=THEME)
@@ -55,6 +79,11 @@ class AsyncPool:
     __password = None
     __port = None
     __apool = None
+    __maxSize = None
+    __poolConfig = None
+
+    # Event Loop where the Pool was Opened
+    __loop = None
 
     # Constructor
     def __init__(
@@ -64,6 +93,13 @@ class AsyncPool:
         password: str,
         host: str,
         port: int = 5432,
+        minSize: int = APOOL_MIN_SIZE,
+        maxSize: int = APOOL_MAX_SIZE,
+        timeout: float = APOOL_TIMEOUT,
+        maxWaiting: int = APOOL_MAX_WAITING,
+        maxIdle: float = APOOL_MAX_IDLE,
+        maxLifetime: float = APOOL_MAX_LIFETIME,
+        check: bool = APOOL_CHECK,
     ):
         """
         Remote Database Asynchronous Connection Pool Class Constructor
@@ -73,6 +109,13 @@ class AsyncPool:
         :param str password: Role Name Password
         :param str host: URL where the Database is being Hosted
         :param int port: Database Connection Port Number. Default is ``5432``
+        :param int minSize: Minimum Number of Connections Kept by the Pool. Default is ``APOOL_MIN_SIZE``
+        :param int maxSize: Maximum Number of Connections the Pool can Grow to. If it's Less than ``minSize``, ``minSize`` is Used. Default is ``APOOL_MAX_SIZE``
+        :param float timeout: Seconds to Wait for a Connection before Raising an Exception. Default is ``APOOL_TIMEOUT``
+        :param int maxWaiting: Maximum Number of Requests that can Wait for a Connection. ``0`` for No Limit. Default is ``APOOL_MAX_WAITING``
+        :param float maxIdle: Seconds a Connection can Stay Unused before being Closed. Default is ``APOOL_MAX_IDLE``
+        :param float maxLifetime: Seconds after which a Connection is Replaced. Default is ``APOOL_MAX_LIFETIME``
+        :param bool check: Specifies whether to Check or not the Connections before Handing Them Out. Default is ``APOOL_CHECK``
         """
 
         # Store Database Connection Information
@@ -81,45 +124,143 @@ class AsyncPool:
         self.__user = user
         self.__password = password
         self.__port = port
+        self.__maxSize = max(minSize, maxSize)
+
+        # Store Asynchronous Connection Pool Configuration
+        self.__poolConfig = {
+            "conninfo": f"host={self.__host} dbname={self.__dbname} user={self.__user} password={self.__password} port={self.__port} sslmode={'require'}",
+            "min_size": minSize,
+            "max_size": self.__maxSize,
+            "timeout": timeout,
+            "max_waiting": maxWaiting,
+            "max_idle": maxIdle,
+            "max_lifetime": maxLifetime,
+            "check": AsyncConnectionPool.check_connection if check else None,
+        }
 
         try:
-            # Get and Open Asynchronous Connection Pool
-            self.__apool = AsyncConnectionPool(
-                conninfo=f"host={self.__host} dbname={self.__dbname} user={self.__user} password={self.__password} port={self.__port} sslmode={'require'}",
-                open=False,
-                min_size=APOOL_MIN_SIZE,
-            )
+            # Get Asynchronous Connection Pool. It's Opened Lazily, the First Time a Connection is Requested
+            self.__apool = AsyncConnectionPool(open=False, **self.__poolConfig)
 
         except Exception as err:
             return err
 
-    async def openPool(self):
+    async def openPool(self, wait: bool = False):
         """
-        Method to Open the Asynchronous Connection Pool
+        Method to Open the Asynchronous Connection Pool at the Running Event Loop. It's Called Lazily before Handing Out Any Connection, so It's not Required to Call It at Startup
+
+        The Pool Background Workers are Bound to the Event Loop where It was Opened, so It must be Closed with ``closePool`` at that Event Loop before Using It from a Different One
 
+        :param bool wait: If ``True``, Waits until the Pool has ``minSize`` Connections. Otherwise, It Returns Immediately, the Pool Grows to ``minSize`` in the Background and the First Connection Request Waits only for One Connection. Default is ``False``
+        :raises PoolLoopError: Raised if the Pool is Open at a Different Event Loop
         :raises Exception: Raised if Something Occurs when the Pool is Opening
         """
 
-        # Wait for the Requested Connections
-        await asyncio.gather(self.__apool.open(wait=True))
+        loop = asyncio.get_running_loop()
+
+        if self.__loop == None:
+            self.__loop = loop
+
+        elif self.__loop is not loop:
+            raise PoolLoopError()
+
+        # Start the Pool Workers. It does Nothing if the Pool is Already Open
+        await self.__apool.open(wait=wait)
 
     async def closePool(self):
         """
-        Method to Close the Asynchronous Connection Pool
+        Method to Close the Asynchronous Connection Pool. It must be Called at the Event Loop where the Pool was Opened. A Closed Pool can't be Reopened, so a New One is Created to be Opened Lazily at the Next Request, from Any Event Loop
 
+        :raises PoolLoopError: Raised if the Pool is Open at a Different Event Loop
         :raises Exception: Raised if Something Occurs when the Pool is Closing
         """
 
-        await asyncio.gather(self.__apool.close())
+        if self.__loop != None and self.__loop is not asyncio.get_running_loop():
+            raise PoolLoopError()
+
+        try:
+            await self.__apool.close()
+
+        finally:
+            self.__apool = AsyncConnectionPool(open=False, **self.__poolConfig)
+            self.__loop = None
+
+    def getStats(self) -> dict:
+        """
+        Method to Get the Asynchronous Connection Pool Statistics. Counters are not Reset
+
+        :return: Dictionary with the Pool Size, the Connections Available and in Use, the Requests Waiting, the Total Wait Time in Milliseconds, and the Requests and Connections Errors
+        :rtype: dict
+        """
+
+        stats = self.__apool.get_stats()
+
+        poolSize = stats.get(APOOL_STATS_POOL_SIZE, 0)
+        poolAvailable = stats.get(APOOL_STATS_POOL_AVAILABLE, 0)
+
+        return {
+            APOOL_STATS_POOL_SIZE: poolSize,
+            APOOL_STATS_POOL_AVAILABLE: poolAvailable,
+            APOOL_STATS_POOL_MAX: self.__maxSize,
+            APOOL_STATS_IN_USE: poolSize - poolAvailable,
+            APOOL_STATS_REQUESTS_WAITING: stats.get(APOOL_STATS_REQUESTS_WAITING, 0),
+            APOOL_STATS_REQUESTS_WAIT_MS: stats.get(APOOL_STATS_REQUESTS_WAIT_MS, 0),
+            APOOL_STATS_REQUESTS_ERRORS: stats.get(APOOL_STATS_REQUESTS_ERRORS, 0),
+            APOOL_STATS_CONNECTIONS_ERRORS: stats.get(
+                APOOL_STATS_CONNECTIONS_ERRORS, 0
+            ),
+        }
+
+    def isSaturated(self) -> bool:
+        """
+        Method to Check if the Asynchronous Connection Pool is Saturated, that's when it has Grown to its Maximum Size, there are no Connections Available and there are Requests Waiting for One
+
+        :return: Specifies whether or not the Pool is Saturated
+        :rtype: bool
+        """
+
+        stats = self.getStats()
+
+        return (
+            stats[APOOL_STATS_REQUESTS_WAITING] > 0
+            and stats[APOOL_STATS_POOL_AVAILABLE] == 0
+            and stats[APOOL_STATS_POOL_SIZE] >= self.__maxSize
+        )
+
+    async def checkHealth(self, timeout: float = APOOL_HEALTH_TIMEOUT) -> bool:
+        """
+        Asynchronous Method to Check if a Connection can be Obtained from the Pool and Used within the Given Time
+
+        :param float timeout: Seconds to Wait for the Connection and the Query. Default is ``APOOL_HEALTH_TIMEOUT``
+        :return: Specifies whether or not the Pool is Healthy
+        :rtype: bool
+        """
+
+        try:
+            async with asyncio.timeout(timeout):
+                await self.openPool()
+
+                async with self.__apool.connection(timeout=timeout) as aconn:
+                    await aconn.execute("SELECT 1")
+
+        except Exception:
+            return False
+
+        return True
 
-    def connection(self):
+    @asynccontextmanager
+    async def connection(self):
         """
-        Method to Get a Pool Connection Context Manager
+        Asynchronous Context Manager to Get a Pool Connection
 
-        :return: Asynchronous Pool Connection Context Manager
+        :return: Asynchronous Pool Connection
+        :raises Exception: Raised if Something Occurs when Getting a Connection from the Pool
         """
 
-        return self.__apool.connection()
+        await self.openPool()
+
+        async with self.__apool.connection() as aconn:
+            yield aconn
 
     async def getConnection(self):
         """
@@ -129,38 +270,63 @@ class AsyncPool:
         :raises Exception: Raised if Something Occurs when Getting a Connection from the Pool
         """
 
-        aconnTask = asyncio.create_task(self.__apool.getconn())
-        await asyncio.gather(aconnTask)
+        await self.openPool()
 
-        return aconnTask.result()
+        return await self.__apool.getconn()
 
-    async def getConnections(self, number: int) -> list:
+    @asynccontextmanager
+    async def lease(self, number: int = 1, autocommit: bool = False):
         """
-        Asynchronous Method to Get Some Pool Connections
+        Asynchronous Context Manager to Lease Some Pool Connections. The Connections are Always Put Back to the Pool when the Context is Exited, even if an Exception was Raised
 
-        :param int number: Number of Connections to Get
+        :param int number: Number of Connections to Lease. Default is ``1``
+        :param bool autocommit: If ``True``, the Connections are Leased in Autocommit Mode, so the Reads Done between User Prompts don't Leave a Transaction Open, and Each ``transaction()`` Block is Committed on its Own. Default is ``False``
         :return: List of Asynchronous Pool Connections
         :rtype: list
         :raises Exception: Raised if Something Occurs when Getting a Connection from the Pool
         """
 
-        # Get the Connections
-        tasks = []
-        for _ in range(number):
-            tasks.append(asyncio.create_task(self.getConnection()))
+        aconns = []
+
+        await self.openPool()
 
         try:
-            await asyncio.gather(*tasks)
+            # Get the Connections One at a Time, so a Failed Request doesn't Leave a Pending One Behind
+            for _ in range(number):
+                aconns.append(await self.__apool.getconn())
 
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
+                if autocommit:
+                    await aconns[-1].set_autocommit(True)
 
-        aconns = []
-        for t in tasks:
-            aconns.append(t.result())
+            yield aconns
+
+        finally:
+            # Put the Connections Back to the Pool
+            for aconn in aconns:
+                try:
+                    # Restore the Default Mode before the Connection is Leased Again
+                    if autocommit and not aconn.closed:
+                        await aconn.set_autocommit(False)
+
+                    await self.__apool.putconn(aconn)
+
+                except Exception as err:
+                    console.print(err, style="warning")
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Asynchronous Context Manager to Run a Unit of Work. It Leases a Pool Connection and Opens a Transaction on It, so All the Writes Done through It are Committed Once when the Context is Exited, or Rolled Back if an Exception was Raised
+
+        :return: Asynchronous Pool Connection, with an Open Transaction
+        :raises Exception: Raised if Something Occurs when Getting a Connection from the Pool, or when Committing the Transaction
+        """
 
-        return aconns
+        async with self.lease(1) as aconns:
+            aconn = aconns[0]
+
+            async with aconn.transaction():
+                yield aconn
 
     async def putConnection(self, aconn):
         """
@@ -170,29 +336,30 @@ class AsyncPool:
         :raises Exception: Raised if Something Occurs when Putting Back a Connection to the Pool
         """
 
-        await asyncio.gather(self.__apool.putconn(aconn))
+        await self.__apool.putconn(aconn)
 
-    async def putConnections(self, aconns: list) -> None:
-        """
-        Asynchronous Method to Put Some Pool Connections
 
-        :param int aconns: List of Asynchronous Pool Connections
-        :return: Nothing
-        :rtype: NoneType
-        :raises Exception: Raised if Something Occurs when Putting Back a Connection to the Pool
-        """
+def getEnvValue(name: str, default, cast=str):
+    """
+    Function to Get an Environment Variable Casted to the Given Type
 
-        # Put the Connections
-        tasks = []
-        for aconn in aconns:
-            tasks.append(asyncio.create_task(self.putConnection(aconn)))
+    :param str name: Environment Variable Name
+    :param default: Value Returned if the Environment Variable is not Set or it's Empty
+    :param cast: Function Used to Cast the Environment Variable Value. Default is ``str``
+    :return: Casted Environment Variable Value, or the Default Value
+    :raises ValueError: Raised if the Environment Variable Value can't be Casted
+    """
 
-        try:
-            await asyncio.gather(*tasks)
+    value = os.getenv(name)
 
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
+    if value is None or value == "":
+        return default
+
+    # Cast Boolean Values
+    if cast is bool:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    return cast(value)
 
 
 # Initialize Asynchronous Connection Pool
@@ -229,7 +396,25 @@ def initAsyncPool() -> tuple[AsyncPool, str, int, str]:
     except Exception as err:
         console.print(err, style="warning")
 
+    # Get Asynchronous Connection Pool Configuration Environment Variables
+    try:
+        apoolConfig = {
+            "minSize": getEnvValue(ENV_APOOL_MIN_SIZE, APOOL_MIN_SIZE, int),
+            "maxSize": getEnvValue(ENV_APOOL_MAX_SIZE, APOOL_MAX_SIZE, int),
+            "timeout": getEnvValue(ENV_APOOL_TIMEOUT, APOOL_TIMEOUT, float),
+            "maxWaiting": getEnvValue(ENV_APOOL_MAX_WAITING, APOOL_MAX_WAITING, int),
+            "maxIdle": getEnvValue(ENV_APOOL_MAX_IDLE, APOOL_MAX_IDLE, float),
+            "maxLifetime": getEnvValue(
+                ENV_APOOL_MAX_LIFETIME, APOOL_MAX_LIFETIME, float
+            ),
+            "check": getEnvValue(ENV_APOOL_CHECK, APOOL_CHECK, bool),
+        }
+
+    except ValueError as err:
+        console.print(err, style="warning")
+        apoolConfig = {}
+
     # Initialize Remote Database Asynchronous Connection Pool Object
-    apool = AsyncPool(dbname, user, password, host, dbport)
+    apool = AsyncPool(dbname, user, password, host, dbport, **apoolConfig)
 
     return apool, user, port, ORSApiKey
@@ -1,9 +1,3 @@
-import asyncio
-
-from psycopg import sql
-
-from rich.prompt import IntPrompt, Prompt
-
 from .classes import Building, Warehouse, Branch
 from .constants import *
 from .exceptions import BuildingNameAssigned
@@ -24,6 +18,7 @@ from ..io.validator import isAddressValid, isEmailValid
 
 from ..terminal.constants import MOD_VALUE_MSG
 from ..terminal.clear import clear
+from ..terminal.prompt import askPrompt, askIntPrompt
 
 
 def fullBuildingName(tableName: str, buildingName: str) -> str:
@@ -48,9 +43,9 @@ def fullBuildingName(tableName: str, buildingName: str) -> str:
     return f"{buildingType} {buildingName}"
 
 
-def askBuildingValue(tableName: str, field: str):
+async def askBuildingValue(tableName: str, field: str):
     """
-    Function to Get and Check a Building-related Field
+    Asynchronous Function to Get and Check a Building-related Field
 
     :param str tableName: Building Table Name at Remote Database
     :param str field: Building Field
@@ -61,16 +56,16 @@ def askBuildingValue(tableName: str, field: str):
     value = None
 
     if field == BUILDINGS_PHONE:
-        value = str(IntPrompt.ask(MOD_VALUE_MSG))
+        value = str(await askIntPrompt(MOD_VALUE_MSG))
 
     elif field == BUILDINGS_EMAIL:
-        value = Prompt.ask(MOD_VALUE_MSG)
+        value = await askPrompt(MOD_VALUE_MSG)
 
         # Check Building Email and Get its Normalized Form
         value = isEmailValid(value)
 
     elif field == BUILDINGS_NAME:
-        value = Prompt.ask(MOD_VALUE_MSG)
+        value = await askPrompt(MOD_VALUE_MSG)
 
         isAddressValid(BUILDINGS_TABLE_NAME, field, value)
 
@@ -118,32 +113,6 @@ class BuildingsTable(SpecializationTable):
             LOCATIONS_SCHEME_NAME,
         )
 
-    def __insertQuery(self):
-        """
-        Method that Retuns a Query to Insert a New Building to its Remote Table
-
-        :return: SQL Query to Insert a New Building
-        :rtype: Composed
-        """
-
-        return sql.SQL(
-            "INSERT INTO {schemeName}.{parentTableName} VALUES (%s,%s, %s, %s, %s, %s, %s)"
-        ).format(
-            schemeName=sql.Identifier(self._schemeName),
-            parentTableName=sql.Identifier(self._parentTableName),
-            fields=sql.SQL(",").join(
-                [
-                    sql.Identifier(BUILDINGS_ADDRESS_DESCRIPTION),
-                    sql.Identifier(BUILDINGS_FK_CITY),
-                    sql.Identifier(BUILDINGS_NAME),
-                    sql.Identifier(BUILDINGS_EMAIL),
-                    sql.Identifier(BUILDINGS_PHONE),
-                    sql.Identifier(BUILDINGS_GPS_LATITUDE),
-                    sql.Identifier(BUILDINGS_GPS_LONGITUDE),
-                ]
-            ),
-        )
-
     async def __buildingExists(self, aconn, cityId: int, buildingName: str) -> bool:
         """
         Asynchronous Method to Check if a Building Name has already been Assigned to Another One at the Given City ID
@@ -160,37 +129,16 @@ class BuildingsTable(SpecializationTable):
         buildingValues = [cityId, buildingName]
 
         # Check if Building Name has already been Inserted at the Given City ID
-        await asyncio.gather(
-            SpecializationTable._getMultParentTable(
-                self, aconn.cursor(), buildingFields, buildingValues
-            )
-        )
-
-        if self._items == None:
+        if not await SpecializationTable._existsParentTable(
+            self, aconn.cursor(), buildingFields, buildingValues
+        ):
             return False
 
-        uniqueInsertedMult(buildingValues, buildingFields, buildingValues)
+        uniqueInsertedMult(BUILDINGS_TABLE_NAME, buildingFields, buildingValues)
         return True
 
-    def __getFetchedObjects(self) -> list[Building]:
-        """
-        Method to Get a List of Fetched Buildings Objects from ``self_items``
-
-        :return: List of Fetched Buildings Objects
-        :rtype: list
-        """
-
-        buildingsList = []
-
-        for item in self._items:
-            # Intialize Building from the SQL Fetched Row
-            b = Building.fromFetchedItem(item)
-            buildingsList.append(b)
-
-        return buildingsList
-
     async def _getMult(
-        self, aconn, fields: list[str], values: list
+        self, aconn, fields: list[str], values: list, limit: int = None
     ) -> list[Building] | None:
         """
         Asynchronous Method to Filter Buildings from its Remote Table based on Some Given Field-Value Pair
@@ -198,23 +146,54 @@ class BuildingsTable(SpecializationTable):
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param list fields: Region Fields that will be Used to Compare in the Region Table
         :param list values: Values to Compare
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
         :return: List of Fetched Buildings Objects if there's at Least One Coincidence. Otherwise, ``None``
         :rtype: list if there's at Least One Coincidence. Otherwise, NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         # Exceute the Query
-        await asyncio.gather(
-            SpecializationTable._getMultParentTable(
-                self, aconn.cursor(), fields, values
-            )
+        await SpecializationTable._getMultParentTable(
+            self,
+            aconn.cursor(row_factory=Building.rowFactory),
+            fields,
+            values,
+            limit=limit,
         )
 
-        # Get the Regions Objects from the Fetched Regions
-        regionsList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Regions Objects
+        regionsList = self._items
 
         return None if len(regionsList) == 0 else regionsList
 
+    async def _getNamesSet(self, aconn, buildings: list[tuple[int, str]]) -> set:
+        """
+        Asynchronous Method to Check which of the Given Building Names have already been Assigned at its City, in a Single Query
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list buildings: List of Tuples that Contain the City ID where the Building is Located and the Building Name
+        :return: Set of (City ID, Building Name) Tuples that are Already Inserted
+        :rtype: set
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Nothing to Search for
+        if len(buildings) == 0:
+            return set()
+
+        cityIds = list({cityId for cityId, _ in buildings})
+        names = list({name for _, name in buildings})
+
+        await SpecializationTable._getMultParentTable(
+            self,
+            aconn.cursor(),
+            [BUILDINGS_FK_CITY, BUILDINGS_NAME],
+            [cityIds, names],
+            columns=[BUILDINGS_FK_CITY, BUILDINGS_NAME],
+        )
+
+        return set(self._items) & set(buildings)
+
     async def _findMult(self, aconn, cityId: int, buildingName: str) -> Building | None:
         """
         Asynchronous Method to Find a Building at its Remote Table based on its Name and the City ID where It's Located
@@ -228,13 +207,9 @@ class BuildingsTable(SpecializationTable):
         """
 
         # Get Building from its Remote Table
-        getTask = asyncio.create_task(
-            self._getMult(
-                aconn, [BUILDINGS_FK_CITY, BUILDINGS_NAME], [cityId, buildingName]
-            )
+        building = await self._getMult(
+            aconn, [BUILDINGS_FK_CITY, BUILDINGS_NAME], [cityId, buildingName], 1
         )
-        await asyncio.gather(getTask)
-        building = getTask.result()
 
         # Get Building Object from the Fetched Item
         if building == None:
@@ -242,33 +217,28 @@ class BuildingsTable(SpecializationTable):
 
         return building[0]
 
-    async def _add(self, aconn, location: dict, buildingName: str) -> None:
+    async def _askFields(self, aconn, location: dict, buildingName: str) -> dict:
         """
-        Asynchronous Method to Insert a New Building to the Building Table
+        Asynchronous Method to Ask for the Fields of a New Building. It doesn't Insert Anything, so It can be Called before Opening the Transaction where the Building is Inserted
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param dict location: Location Dictionary that Contains All the Information Related to the Building Location
         :param str buildingName: Building Name to Insert
-        :returns: None
-        :rtype: NoneType
+        :returns: Dictionary with the Building Address Description, Email and Phone
+        :rtype: dict
         :raises BuildingNameAssigned: Raised if the Building Name of the that's being Inserted is Already Inserted to Another Building at the Same City ID
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Check if the Building Name for the Given City ID Already Exists
-        existsTask = asyncio.create_task(
-            self.__buildingExists(aconn, location[DICT_CITY_ID], buildingName)
-        )
-        await asyncio.gather(existsTask)
-
-        if existsTask.result():
+        # Check if the Building Name for the Given City ID Already Exists, before Asking for the Other Fields
+        if await self.__buildingExists(aconn, location[DICT_CITY_ID], buildingName):
             raise BuildingNameAssigned(buildingName, location[DICT_CITY_ID])
 
         # Ask for New Building Fields
         console.print("\nAdding New Building...", style="caption")
-        buildingPhone = IntPrompt.ask("Enter Building Phone Number")
-        buildingEmail = Prompt.ask("Enter Building Email")
-        addressDescription = Prompt.ask("Enter Building Address Description")
+        buildingPhone = await askIntPrompt("Enter Building Phone Number")
+        buildingEmail = await askPrompt("Enter Building Email")
+        addressDescription = await askPrompt("Enter Building Address Description")
 
         # Check Building Building Email and Address Description
         isEmailValid(buildingEmail)
@@ -276,25 +246,73 @@ class BuildingsTable(SpecializationTable):
             self._tableName, BUILDINGS_ADDRESS_DESCRIPTION, addressDescription
         )
 
-        # Get Query to Insert the Building to its Remote Table
-        query = self.__insertQuery()
-
-        # Execute the Query
-        await asyncio.gather(
-            aconn.cursor().execute(
-                query,
-                [
-                    addressDescription,
-                    location[DICT_CITY_ID],
-                    buildingName,
-                    buildingEmail,
-                    buildingPhone,
-                    location[NOMINATIM_LATITUDE],
-                    location[NOMINATIM_LONGITUDE],
-                ],
-            )
+        return {
+            BUILDINGS_ADDRESS_DESCRIPTION: addressDescription,
+            BUILDINGS_EMAIL: buildingEmail,
+            BUILDINGS_PHONE: buildingPhone,
+        }
+
+    async def _add(
+        self,
+        aconn,
+        location: dict,
+        buildingName: str,
+        fields: list[str] = None,
+        values: list = None,
+        buildingFields: dict = None,
+    ) -> int:
+        """
+        Asynchronous Method to Insert a New Building to the Building Table, Together with its Specialization Row in a Single Statement
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param dict location: Location Dictionary that Contains All the Information Related to the Building Location
+        :param str buildingName: Building Name to Insert
+        :param list fields: Specialization Table Fields Name to Insert, Apart from its Primary Key. Default is ``None``
+        :param list values: Specialization Table Values to Insert. Default is ``None``
+        :param dict buildingFields: Building Fields Returned by ``_askFields``. If ``None``, They're Asked Here. Default is ``None``
+        :returns: Building ID of the Inserted Building
+        :rtype: int
+        :raises BuildingNameAssigned: Raised if the Building Name of the that's being Inserted is Already Inserted to Another Building at the Same City ID
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Ask for New Building Fields
+        if buildingFields == None:
+            buildingFields = await self._askFields(aconn, location, buildingName)
+
+        # Insert the Building and its Specialization Row, and Get its ID
+        buildingId = await SpecializationTable._addWithParentTable(
+            self,
+            aconn.cursor(),
+            [
+                BUILDINGS_ADDRESS_DESCRIPTION,
+                BUILDINGS_FK_CITY,
+                BUILDINGS_NAME,
+                BUILDINGS_EMAIL,
+                BUILDINGS_PHONE,
+                BUILDINGS_GPS_LATITUDE,
+                BUILDINGS_GPS_LONGITUDE,
+            ],
+            [
+                buildingFields[BUILDINGS_ADDRESS_DESCRIPTION],
+                location[DICT_CITY_ID],
+                buildingName,
+                buildingFields[BUILDINGS_EMAIL],
+                buildingFields[BUILDINGS_PHONE],
+                location[NOMINATIM_LATITUDE],
+                location[NOMINATIM_LONGITUDE],
+            ],
+            fields,
+            values,
         )
-        insertedRow(buildingName, self._parentTableName)
+
+        # The Building Name was Assigned in the Meantime
+        if buildingId == None:
+            raise BuildingNameAssigned(buildingName, location[DICT_CITY_ID])
+
+        insertedRow(buildingName, self._tableName)
+
+        return buildingId
 
 
 class WarehousesTable(BuildingsTable):
@@ -310,23 +328,6 @@ class WarehousesTable(BuildingsTable):
         # Initialize Building Table Class
         super().__init__(WAREHOUSES_TABLE_NAME, WAREHOUSES_ID, LOCATIONS_SCHEME_NAME)
 
-    def __getFetchedObjects(self) -> list[Warehouse]:
-        """
-        Method to Get a List of Fetched Warehouses Objects from ``self_items``
-
-        :return: List of Fetched Warehouses Objects
-        :rtype: list
-        """
-
-        warehousesList = []
-
-        for item in self._items:
-            # Intialize Warehouse from the SQL Fetched Row
-            w = Warehouse.fromFetchedItem(item)
-            warehousesList.append(w)
-
-        return warehousesList
-
     def __print(self, warehousesList: list[Warehouse]) -> None:
         """
         Method that Prints the Warehouses Fetched from its Remote Table
@@ -363,29 +364,33 @@ class WarehousesTable(BuildingsTable):
 
         console.print(table)
 
-    def __insertQuery(self):
+    async def askFields(self, aconn, location: dict, buildingName: str) -> dict:
         """
-        Method that Retuns a Query to Insert a New Warehouse to its Remote Table
+        Asynchronous Method to Ask for the Fields of a New Warehouse, before Inserting It
 
-        :return: SQL Query to Insert a New Warehouse
-        :rtype: Composed
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param dict location: Location Dictionary that Contains All the Information Related to the Warehouse Location
+        :param str buildingName: Warehouse Name to Insert
+        :return: Dictionary with the Warehouse Address Description, Email and Phone
+        :rtype: dict
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        return sql.SQL(
-            "INSERT INTO {schemeName}.{tableName} ({field}) VALUES (%s)"
-        ).format(
-            schemeName=sql.Identifier(self._schemeName),
-            tableName=sql.Identifier(self._tableName),
-            field=sql.Identifier(self._tablePKFKName),
-        )
+        # Get Full Building Name
+        buildingName = fullBuildingName(self._tableName, buildingName)
 
-    async def add(self, aconn, location: dict, buildingName: str) -> int:
+        return await BuildingsTable._askFields(self, aconn, location, buildingName)
+
+    async def add(
+        self, aconn, location: dict, buildingName: str, buildingFields: dict = None
+    ) -> int:
         """
         Asynchronous Method to Insert a New Warehouse to the Warehouse Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param dict location: Location Dictionary that Contains All the Information Related to the Warehouse Location
         :param str buildingName: Warehouse Name to Insert
+        :param dict buildingFields: Warehouse Fields Returned by ``askFields``. If ``None``, They're Asked Here. Default is ``None``
         :return: Warehouse Building ID
         :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
@@ -394,32 +399,49 @@ class WarehousesTable(BuildingsTable):
         # Get Full Building Name
         buildingName = fullBuildingName(self._tableName, buildingName)
 
-        # Insert Building to Building Table
-        await asyncio.gather(BuildingsTable._add(self, location, buildingName))
-
-        # Get Building Object of the Recently Inserted Warehouse Building
-        findTask = asyncio.create_task(
-            BuildingsTable._findMult(self, aconn, location[DICT_CITY_ID], buildingName)
+        # Insert the Warehouse and its Building
+        return await BuildingsTable._add(
+            self, aconn, location, buildingName, buildingFields=buildingFields
         )
-        await asyncio.gather(findTask)
-        b = findTask.result()
 
-        # Ask for the Warehouse Fields
-        console.print("Adding New Warehouse...", style="caption")
+    async def addMany(self, aconn, buildings: list[tuple]) -> list[int]:
+        """
+        Asynchronous Method to Insert Several Warehouses, and its Buildings, in a Single Batch per Table
 
-        # Get Warehouse Insert Query
-        warehouseQuery = self.__insertQuery()
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list buildings: List of Tuples that Contain the Building Address Description, City ID, Full Name, Email, Phone, GPS Latitude and GPS Longitude
+        :return: List of the Inserted Warehouses ID, in the Same Order as ``buildings``
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
 
-        # Execute the Query to Insert the Warehouse
-        await asyncio.gather(
-            aconn.cursor().execute(
-                warehouseQuery,
-                [b.buildingId],
-            )
+        acursor = aconn.cursor()
+
+        # Insert the Buildings and Get its IDs
+        warehouseIds = await SpecializationTable._addManyParentTable(
+            self,
+            acursor,
+            [
+                BUILDINGS_ADDRESS_DESCRIPTION,
+                BUILDINGS_FK_CITY,
+                BUILDINGS_NAME,
+                BUILDINGS_EMAIL,
+                BUILDINGS_PHONE,
+                BUILDINGS_GPS_LATITUDE,
+                BUILDINGS_GPS_LONGITUDE,
+            ],
+            buildings,
+        )
+
+        # Insert the Warehouses
+        await SpecializationTable._addManyTable(
+            self,
+            acursor,
+            [self._tablePKFKName],
+            [(warehouseId,) for warehouseId in warehouseIds],
         )
-        insertedRow(b.buildingName, self._tableName)
 
-        return b.buildingId
+        return warehouseIds
 
     async def get(
         self, aconn, field: str, value, printItems: bool = True
@@ -436,21 +458,21 @@ class WarehousesTable(BuildingsTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Warehouses
-        queryTask = asyncio.gather(
-            SpecializationTable._getTable(
-                self, aconn.cursor(), field, value, BUILDINGS_NAME
-            )
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Warehouses
+        await SpecializationTable._getTable(
+            self,
+            aconn.cursor(row_factory=Warehouse.rowFactory),
+            field,
+            value,
+            BUILDINGS_NAME,
+        )
 
-        # Get the Warehouses Objects from the Fetched Warehouses
-        warehousesList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Warehouses Objects
+        warehousesList = self._items
 
         # Print Filtered Warehouses
         if printItems:
@@ -470,11 +492,7 @@ class WarehousesTable(BuildingsTable):
         """
 
         # Get Warehouses from its Remote Table
-        getTask = asyncio.create_task(
-            self.get(aconn, WAREHOUSES_ID, warehouseId, False)
-        )
-        await asyncio.gather(getTask)
-        warehouse = getTask.result()
+        warehouse = await self.get(aconn, WAREHOUSES_ID, warehouseId, False)
 
         # Get Warehouses Object from the Fetched Item
         if warehouse == None:
@@ -482,33 +500,36 @@ class WarehousesTable(BuildingsTable):
 
         return warehouse[0]
 
-    async def all(self, aconn, orderBy: str, desc: bool) -> None:
+    async def all(self, aconn, orderBy: str, desc: bool) -> int:
         """
         Asynchronous Method that Prints the All the Warehouses Stored at its Remote Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str orderBy: Warehouse Field that will be Used to Sort the Warehouse Table
         :param bool desc: Specificies whether to Sort in Ascending Order (``False``) or in Descending Order (``True``)
-        :return: Nothing
-        :rtype: NoneType
+        :return: Number of Printed Warehouses
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch All Warehouses
-        queryTask = asyncio.gather(
-            SpecializationTable._all(self, aconn.cursor(), orderBy, desc)
-        )
-
         # Clear Terminal
         clear()
 
-        await queryTask
+        nRows = 0
+
+        # Fetch and Print All Warehouses, Page by Page
+        async for warehousesList in SpecializationTable._iterAll(
+            self, aconn, orderBy, desc, rowFactory=Warehouse.rowFactory
+        ):
+            # Print the Current Page
+            self.__print(warehousesList)
+            nRows += len(warehousesList)
 
-        # Get the Warehouses Objects from the Fetched Warehouses
-        warehousesList = self.__getFetchedObjects()
+        # Print Empty Table
+        if nRows == 0:
+            self.__print([])
 
-        # Print All Warehouses
-        self.__print(warehousesList)
+        return nRows
 
     async def modify(self, aconn, warehouseId: int, field: str, value) -> None:
         """
@@ -526,10 +547,8 @@ class WarehousesTable(BuildingsTable):
         """
 
         # Modify Building Table Row Column
-        await asyncio.gather(
-            SpecializationTable._modifyParentTable(
-                self, aconn.cursor(), warehouseId, field, value
-            )
+        await SpecializationTable._modifyParentTable(
+            self, aconn.cursor(), warehouseId, field, value
         )
 
     async def remove(self, aconn, warehouseId: int) -> None:
@@ -543,9 +562,7 @@ class WarehousesTable(BuildingsTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(
-            SpecializationTable._remove(self, aconn.cursor(), warehouseId)
-        )
+        await SpecializationTable._remove(self, aconn.cursor(), warehouseId)
 
 
 class BranchesTable(BuildingsTable):
@@ -561,23 +578,6 @@ class BranchesTable(BuildingsTable):
         # Initialize Building Table Class
         super().__init__(BRANCHES_TABLE_NAME, BRANCHES_ID, LOCATIONS_SCHEME_NAME)
 
-    def __getFetchedObjects(self) -> list[Branch]:
-        """
-        Method to Get a List of Fetched Branches Objects from ``self_items``
-
-        :return: List of Fetched Branches Objects
-        :rtype: list
-        """
-
-        branchesList = []
-
-        for item in self._items:
-            # Intialize Branch from the SQL Fetched Row
-            b = Branch.fromFetchedItem(item)
-            branchesList.append(b)
-
-        return branchesList
-
     def __print(self, branchesList: list[Branch]) -> None:
         """
         Method that Prints the Branches Fetched from its Remote Table
@@ -618,28 +618,6 @@ class BranchesTable(BuildingsTable):
 
         console.print(table)
 
-    def __insertQuery(self):
-        """
-        Method that Retuns a Query to Insert a New Branch to its Remote Table
-
-        :return: SQL Query to Insert a New Branch
-        :rtype: Composed
-        """
-
-        return sql.SQL(
-            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s, %s)"
-        ).format(
-            schemeName=sql.Identifier(self._schemeName),
-            tableName=sql.Identifier(self._tableName),
-            fields=sql.SQL(",").join(
-                [
-                    sql.Identifier(self._tablePKFKName),
-                    sql.Identifier(BRANCHES_FK_WAREHOUSE_CONNECTION),
-                    sql.Identifier(BRANCHES_ROUTE_DISTANCE),
-                ]
-            ),
-        )
-
     async def add(
         self,
         aconn,
@@ -664,30 +642,15 @@ class BranchesTable(BuildingsTable):
         # Get Full Building Name
         buildingName = fullBuildingName(self._tableName, buildingName)
 
-        # Insert Building to its Remote Table
-        await asyncio.gather(BuildingsTable._add(self, aconn, location, buildingName))
-
-        # Get Building Object of the Recently Inserted Branch Building
-        findTask = asyncio.create_task(
-            BuildingsTable._findMult(self, aconn, location[DICT_CITY_ID], buildingName)
+        # Insert the Branch and its Building
+        await BuildingsTable._add(
+            self,
+            aconn,
+            location,
+            buildingName,
+            [BRANCHES_FK_WAREHOUSE_CONNECTION, BRANCHES_ROUTE_DISTANCE],
+            [warehouseConnId, routeDistance],
         )
-        await asyncio.gather(findTask)
-        b = findTask.result()
-
-        # Ask for the Branch Fields
-        console.print("Adding New Branch...", style="caption")
-
-        # Get Query to Insert Branch to its Remote Table
-        branchQuery = self.__insertQuery()
-
-        # Execute the Query to Insert the Branch
-        await asyncio.gather(
-            aconn[0].execute(
-                branchQuery,
-                [b.buildingId, warehouseConnId, routeDistance],
-            )
-        )
-        insertedRow(b.buildingName, self._tableName)
 
     async def get(
         self, aconn, field: str, value, printItems: bool = True
@@ -704,21 +667,21 @@ class BranchesTable(BuildingsTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Branches
-        queryTask = asyncio.gather(
-            SpecializationTable._getTable(
-                self, aconn.cursor(), field, value, BUILDINGS_NAME
-            )
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Branches
+        await SpecializationTable._getTable(
+            self,
+            aconn.cursor(row_factory=Branch.rowFactory),
+            field,
+            value,
+            BUILDINGS_NAME,
+        )
 
-        # Get the Branches Objects from the Fetched Branches
-        branchesList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Branches Objects
+        branchesList = self._items
 
         # Print Filtered Branches
         if printItems:
@@ -738,9 +701,7 @@ class BranchesTable(BuildingsTable):
         """
 
         # Get Branch from its Remote Table
-        getTask = asyncio.create_task(self.get(aconn, BRANCHES_ID, branchId, False))
-        await asyncio.gather(getTask)
-        branch = getTask.result()
+        branch = await self.get(aconn, BRANCHES_ID, branchId, False)
 
         # Get Branch Object from the Fetched Item
         if branch == None:
@@ -748,33 +709,36 @@ class BranchesTable(BuildingsTable):
 
         return branch[0]
 
-    async def all(self, aconn, orderBy: str, desc: bool) -> None:
+    async def all(self, aconn, orderBy: str, desc: bool) -> int:
         """
         Asynchronous Method that Prints the All the Branches Stored at its Remote Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str orderBy: Branches Field that will be Used to Sort the Branches Table
         :param bool desc: Specificies whether to Sort in Ascending Order (``False``) or in Descending Order (``True``)
-        :return: Nothing
-        :rtype: NoneType
+        :return: Number of Printed Branches
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch All Branches
-        queryTask = asyncio.gather(
-            SpecializationTable._all(self, aconn.cursor(), orderBy, desc)
-        )
-
         # Clear Terminal
         clear()
 
-        await queryTask
+        nRows = 0
 
-        # Get the Branches Objects from the Fetched Branches
-        branchesList = self.__getFetchedObjects()
+        # Fetch and Print All Branches, Page by Page
+        async for branchesList in SpecializationTable._iterAll(
+            self, aconn, orderBy, desc, rowFactory=Branch.rowFactory
+        ):
+            # Print the Current Page
+            self.__print(branchesList)
+            nRows += len(branchesList)
 
-        # Print All Branches
-        self.__print(branchesList)
+        # Print Empty Table
+        if nRows == 0:
+            self.__print([])
+
+        return nRows
 
     async def modify(self, aconn, branchId: int, field: str, value) -> None:
         """
@@ -794,18 +758,14 @@ class BranchesTable(BuildingsTable):
             field == BRANCHES_FK_WAREHOUSE_CONNECTION
             or field == BRANCHES_ROUTE_DISTANCE
         ):
-            await asyncio.gather(
-                SpecializationTable._modifyTable(
-                    self, aconn.cursor(), branchId, field, value
-                )
+            await SpecializationTable._modifyTable(
+                self, aconn.cursor(), branchId, field, value
             )
 
         # Modify Building Table Row Column
         else:
-            await asyncio.gather(
-                SpecializationTable._modifyParentTable(
-                    self, aconn.cursor(), branchId, field, value
-                )
+            await SpecializationTable._modifyParentTable(
+                self, aconn.cursor(), branchId, field, value
             )
 
     async def remove(self, aconn, branchId: int) -> None:
@@ -819,6 +779,4 @@ class BranchesTable(BuildingsTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(
-            SpecializationTable._remove(self, aconn.cursor(), branchId)
-        )
+        await SpecializationTable._remove(self, aconn.cursor(), branchId)
@@ -0,0 +1,184 @@
+import time
+
+from .classes import Country, Region, City
+from .constants import LOCATIONS_CACHE_TTL
+from .database_territory import CountriesTable, RegionsTable, CitiesTable
+
+
+class LocationsCache:
+    """
+    Class that Keeps an In-memory Copy of the Countries, Regions and Cities Remote Tables, so the Location Hierarchy can be Navigated without Querying Them Again
+    """
+
+    # Table Classes
+    __countriesTable = None
+    __regionsTable = None
+    __citiesTable = None
+
+    # Cached Locations, Indexed by its ID
+    __countries = None
+    __regions = None
+    __cities = None
+
+    # Cached Locations, Grouped by its Parent Location ID
+    __countryRegions = None
+    __regionCities = None
+
+    # Cache Version, Increased each Time It's Invalidated, and the Version that's Currently Loaded
+    __version = None
+    __loadedVersion = None
+
+    # Time when the Cache was Loaded, and Seconds It's Trusted
+    __loadedAt = None
+    __ttl = None
+
+    def __init__(
+        self,
+        countriesTable: CountriesTable,
+        regionsTable: RegionsTable,
+        citiesTable: CitiesTable,
+        ttl: float = LOCATIONS_CACHE_TTL,
+    ):
+        """
+        Locations Cache Class Constructor
+
+        :param CountriesTable countriesTable: Countries Remote Table Class
+        :param RegionsTable regionsTable: Regions Remote Table Class
+        :param CitiesTable citiesTable: Cities Remote Table Class
+        :param float ttl: Seconds the Cache is Trusted before It's Reloaded. Default is ``LOCATIONS_CACHE_TTL``
+        """
+
+        # Store Table Classes
+        self.__countriesTable = countriesTable
+        self.__regionsTable = regionsTable
+        self.__citiesTable = citiesTable
+
+        # Initialize Cache Version
+        self.__version = 0
+        self.__ttl = ttl
+
+    def isFresh(self) -> bool:
+        """
+        Method to Check whether the Cache is Loaded, hasn't been Invalidated and hasn't Expired
+
+        :return: ``True`` if the Cache can be Used without Reloading It. Otherwise, ``False``
+        :rtype: bool
+        """
+
+        if self.__loadedVersion != self.__version:
+            return False
+
+        return time.monotonic() - self.__loadedAt < self.__ttl
+
+    def invalidate(self) -> None:
+        """
+        Method to Invalidate the Cache, so It's Reloaded the Next Time It's Used. It MUST be Called after Any Write to the Locations Tables
+
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        self.__version += 1
+
+    async def load(self, aconn) -> None:
+        """
+        Asynchronous Method to Load the Countries, Regions and Cities Remote Tables into the Cache. Nothing is Queried if the Cache is Fresh
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        if self.isFresh():
+            return
+
+        version = self.__version
+
+        # Fetch All the Locations, Sorted by its Name
+        countriesList = await self.__countriesTable.fetchAll(aconn)
+        regionsList = await self.__regionsTable.fetchAll(aconn)
+        citiesList = await self.__citiesTable.fetchAll(aconn)
+
+        # Index the Locations by its ID
+        self.__countries = {c.countryId: c for c in countriesList}
+        self.__regions = {r.regionId: r for r in regionsList}
+        self.__cities = {c.cityId: c for c in citiesList}
+
+        # Group the Locations by its Parent Location ID, Keeping the Sorting
+        self.__countryRegions = {}
+        self.__regionCities = {}
+
+        for r in regionsList:
+            self.__countryRegions.setdefault(r.countryId, []).append(r)
+
+        for c in citiesList:
+            self.__regionCities.setdefault(c.regionId, []).append(c)
+
+        self.__loadedVersion = version
+        self.__loadedAt = time.monotonic()
+
+    def getCountries(self) -> list[Country]:
+        """
+        Method to Get All the Cached Countries, Sorted by its Name
+
+        :return: List of Countries Objects
+        :rtype: list
+        """
+
+        return list(self.__countries.values())
+
+    def getCountry(self, countryId: int) -> Country | None:
+        """
+        Method to Get a Cached Country by its ID
+
+        :param int countryId: Country ID at its Remote Table
+        :return: Country Object if Found. Otherwise, ``None``
+        :rtype: Country if Found. Otherwise, NoneType
+        """
+
+        return self.__countries.get(countryId)
+
+    def getRegions(self, countryId: int) -> list[Region]:
+        """
+        Method to Get the Cached Regions Located at a Given Country, Sorted by its Name
+
+        :param int countryId: Country ID at its Remote Table where the Regions are Located
+        :return: List of Regions Objects
+        :rtype: list
+        """
+
+        return self.__countryRegions.get(countryId, [])
+
+    def getRegion(self, regionId: int) -> Region | None:
+        """
+        Method to Get a Cached Region by its ID
+
+        :param int regionId: Region ID at its Remote Table
+        :return: Region Object if Found. Otherwise, ``None``
+        :rtype: Region if Found. Otherwise, NoneType
+        """
+
+        return self.__regions.get(regionId)
+
+    def getCities(self, regionId: int) -> list[City]:
+        """
+        Method to Get the Cached Cities Located at a Given Region, Sorted by its Name
+
+        :param int regionId: Region ID at its Remote Table where the Cities are Located
+        :return: List of Cities Objects
+        :rtype: list
+        """
+
+        return self.__regionCities.get(regionId, [])
+
+    def getCity(self, cityId: int) -> City | None:
+        """
+        Method to Get a Cached City by its ID
+
+        :param int cityId: City ID at its Remote Table
+        :return: City Object if Found. Otherwise, ``None``
+        :rtype: City if Found. Otherwise, NoneType
+        """
+
+        return self.__cities.get(cityId)
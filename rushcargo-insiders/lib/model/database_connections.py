@@ -3,7 +3,7 @@ from psycopg import sql
 
 from .constants import *
 
-from .database import AsyncPool, console, cancelTasks
+from .database import console, cancelTasks
 
 from ..controller.constants import RICH_LOGGER_DEBUG_MODE
 
@@ -14,7 +14,7 @@ from ..geocoding.constants import (
     DICT_WAREHOUSE_ID,
 )
 from ..geocoding.exceptions import RouteNotFound, RouteLimitSurpassed
-from ..geocoding.routingpy import ORSGeocoder
+from ..geocoding.distance import DistanceProvider
 
 
 def getLocationInfo(locationTableName: str) -> tuple[str, str] | None:
@@ -150,19 +150,15 @@ class WarehouseConnectionsTable:
         )
 
         # Check if the Warehouse is the Main One to Any Region
-        await asyncio.gather(acursor.execute(regionMainQuery, [warehouseId]))
-        fetchTask = asyncio.create_task(acursor.fetchone())
-        await asyncio.gather(fetchTask)
-        regionId = fetchTask.result()
+        await acursor.execute(regionMainQuery, [warehouseId])
+        regionId = await acursor.fetchone()
 
         if regionId != None:
             return REGIONS_TABLE_NAME, regionId
 
         # Check if the Warehouse is the Main One to Any City
-        await asyncio.gather(acursor.execute(cityMainQuery, [warehouseId]))
-        fetchTask = asyncio.create_task(acursor.fetchone())
-        await asyncio.gather(fetchTask)
-        cityId = fetchTask.result()
+        await acursor.execute(cityMainQuery, [warehouseId])
+        cityId = await acursor.fetchone()
 
         if cityId != None:
             return CITIES_TABLE_NAME, cityId
@@ -219,7 +215,7 @@ class WarehouseConnectionsTable:
 
     async def __removeMainWarehouse(
         self,
-        apool: AsyncPool,
+        aconn,
         locationTableName: str,
         locationId: int,
         warehouseId: int,
@@ -227,7 +223,7 @@ class WarehouseConnectionsTable:
         """
         Method to Remove a Main Warehouse of a Given Location as a Sender and as a Receiver from All of its Warehouse Connections at a Given Location Level
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
+        :param aconn: Asynchronous Pool Connection with the Remote Database, with an Open Transaction
         :param str locationTableName: Location Table Name where the Warehouse is Located and Set as the Main One
         :param str locationId: Location ID at its Table where the Warehouse is Located
         :param int warehouseId: Main Warehouse ID that is going to be Removed from its Warehouse Connections at the Given Location Level
@@ -238,39 +234,16 @@ class WarehouseConnectionsTable:
 
         locationType, locationIdField = getLocationInfo(locationTableName)
 
-        # Get Two Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(2))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
-
         # Get Query to Remove the Given Warehouse as a Sender
         senderQuery = self.__removeSenderMainWarehouseQuery(locationIdField)
 
         # Get Query to Remove the Given Warehouse as a Receiver
         receiverQuery = self.__removeReceiverMainWarehouseQuery(locationIdField)
 
-        # Remove Given Warehouse as a Sender and as a Receiver
-        senderTask = asyncio.create_task(
-            aconns[0]
-            .cursor()
-            .execute(senderQuery, [locationId, warehouseId, locationType])
-        )
-        removeTask = asyncio.create_task(
-            aconns[1]
-            .cursor()
-            .execute(receiverQuery, [locationId, warehouseId, locationType])
-        )
-
-        tasks = [senderTask, removeTask]
-        try:
-            await asyncio.gather(*tasks)
-
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
-
-        # Put the Connections Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnections(aconns))
+        # Remove Given Warehouse as a Sender and as a Receiver, Inside the Same Transaction
+        acursor = aconn.cursor()
+        await acursor.execute(senderQuery, [locationId, warehouseId, locationType])
+        await acursor.execute(receiverQuery, [locationId, warehouseId, locationType])
 
         if ROUTES_DEBUG_MODE:
             console.print(
@@ -279,12 +252,12 @@ class WarehouseConnectionsTable:
             )
 
     async def removeRegionMainWarehouse(
-        self, apool: AsyncPool, regionId: int, warehouseId: int
+        self, aconn, regionId: int, warehouseId: int
     ) -> None:
         """
         Asynchronous  Method to Remove a Given Region Main Warehouse as a Sender and as a Receiver from All of its Warehouse Connections
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
+        :param aconn: Asynchronous Pool Connection with the Remote Database, with an Open Transaction
         :param str regionId: Region ID where the Warehouse is Located and Set as the Main One
         :param int warehouseId: Main Warehouse ID that is going to be Removed from its Warehouse Connections at the Given Location Level (Region)
         :return: Nothing
@@ -293,17 +266,17 @@ class WarehouseConnectionsTable:
         """
 
         # Remove Region-Type Connections
-        await asyncio.gather(
-            self.__removeMainWarehouse(apool, REGIONS_TABLE_NAME, regionId, warehouseId)
+        await self.__removeMainWarehouse(
+            aconn, REGIONS_TABLE_NAME, regionId, warehouseId
         )
 
     async def removeCityMainWarehouse(
-        self, apool: AsyncPool, regionId: int, cityId: int, warehouseId: int
+        self, aconn, regionId: int, cityId: int, warehouseId: int
     ) -> None:
         """
         Asynchronous Method to Remove a Given City Main Warehouse as a Sender and as a Receiver from All of its Warehouse Connections
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
+        :param aconn: Asynchronous Pool Connection with the Remote Database, with an Open Transaction
         :param str regionId: Region ID where the Parent Main Warehouse is Located
         :param str cityId: City ID where the Warehouse is Located and Set as the Main One
         :param int warehouseId: Main Warehouse ID that is going to be Removed from its Warehouse Connections at the Given Location Level (City)
@@ -313,22 +286,12 @@ class WarehouseConnectionsTable:
         """
 
         # Remove Region-Type Connection (with its Parent Main Warehouse)
-        regionTask = asyncio.create_task(
-            self.__removeMainWarehouse(apool, REGIONS_TABLE_NAME, regionId, warehouseId)
+        await self.__removeMainWarehouse(
+            aconn, REGIONS_TABLE_NAME, regionId, warehouseId
         )
 
         # Remove City-Type Connections
-        cityTask = asyncio.create_task(
-            self.__removeMainWarehouse(apool, CITIES_TABLE_NAME, cityId, warehouseId)
-        )
-
-        tasks = [regionTask, cityTask]
-        try:
-            await asyncio.gather(*tasks)
-
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
+        await self.__removeMainWarehouse(aconn, CITIES_TABLE_NAME, cityId, warehouseId)
 
     def __getMainWarehousesQuery(
         self, locationMainWarehousesViewName: str, parentLocationIdField: str
@@ -370,10 +333,8 @@ class WarehouseConnectionsTable:
         """
 
         # Get All Main Warehouses
-        await asyncio.gather(acursor.execute(query, [parentLocationId]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [parentLocationId])
+        self._items = await acursor.fetchall()
 
         # Get List of Warehouse Dictionaries
         warehouseConns = self.__getWarehouseDicts(self._items)
@@ -416,10 +377,8 @@ class WarehouseConnectionsTable:
         )
 
         # Get All the Warehouses
-        await asyncio.gather(acursor.execute(query, [countryId]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [countryId])
+        self._items = await acursor.fetchall()
 
         # Get List of Warehouse IDs
         warehouseIds = self.__getWarehouseIds(self._items)
@@ -442,12 +401,7 @@ class WarehouseConnectionsTable:
             REGIONS_MAIN_WAREHOUSES_VIEW_NAME, COUNTRIES_ID
         )
 
-        getTask = asyncio.create_task(
-            self.__getMainWarehouses(acursor, query, countryId)
-        )
-        await asyncio.gather(getTask)
-
-        return getTask.result()
+        return await self.__getMainWarehouses(acursor, query, countryId)
 
     async def getCityMainWarehouseIds(self, acursor, regionId: int) -> list[int]:
         """
@@ -466,10 +420,8 @@ class WarehouseConnectionsTable:
         )
 
         # Get All the Warehouses
-        await asyncio.gather(acursor.execute(query, [regionId]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [regionId])
+        self._items = await acursor.fetchall()
 
         # Get List of Warehouse IDs
         warehouseIds = self.__getWarehouseIds(self._items)
@@ -492,12 +444,7 @@ class WarehouseConnectionsTable:
             CITIES_MAIN_WAREHOUSES_VIEW_NAME, REGIONS_ID
         )
 
-        getTask = asyncio.create_task(
-            self.__getMainWarehouses(acursor, query, regionId)
-        )
-        await asyncio.gather(getTask)
-
-        return getTask.result()
+        return await self.__getMainWarehouses(acursor, query, regionId)
 
     async def getCityWarehouseIds(self, acursor, cityId: int) -> list[int]:
         """
@@ -514,10 +461,8 @@ class WarehouseConnectionsTable:
         query = self.__getCityWarehousesQuery()
 
         # Get All the Warehouses
-        await asyncio.gather(acursor.execute(query, [cityId]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [cityId])
+        self._items = await acursor.fetchall()
 
         # Get List of Warehouse IDs
         warehouseIds = self.__getWarehouseIds(self._items)
@@ -539,10 +484,8 @@ class WarehouseConnectionsTable:
         query = self.__getCityWarehousesQuery()
 
         # Get All City Warehouses
-        await asyncio.gather(acursor.execute(query, [cityId]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [cityId])
+        self._items = await acursor.fetchall()
 
         # Get List of Warehouse Dictionaries
         warehouseConns = self.__getWarehouseDicts(self._items)
@@ -571,428 +514,291 @@ class WarehouseConnectionsTable:
             ),
         )
 
-    async def __insertWarehouseSenderConn(
+    def __isRouteValid(
         self,
-        acursor,
-        ORSGeocoder: ORSGeocoder,
-        query,
-        connType: str,
         warehouseDict: dict,
         warehouseConnDict: dict,
-    ) -> None:
+        routeDistance: int | None,
+    ) -> bool:
         """
-        Method to Insert a Warehouse Sender Connection Asynchronously
+        Method to Check if the Route Distance between Two Warehouses can be Used as a Warehouse Connection
 
-        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
-        :param Composed query: SQL Query to Insert a Warehouse Connection
-        :param str connType: Location Connection Level
-        :param dict warehouseDict: Warehouse Connection Dictionary of the One that Sends the Packages
-        :param dict warehouseConnDict: Warehouse Connection Dictionary of the One that Receives the Packages
-        :return: Nothing
-        :rtype: NoneType
-        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        :param dict warehouseDict: Main Warehouse Connection Dictionary
+        :param dict warehouseConnDict: Warehouse Connection Dictionary that will be Connected with the Main Warehouse
+        :param int routeDistance: Route Distance between the Two Warehouses (in meters). ``None`` if there's no Route between Them
+        :return: ``True`` if there's a Route between the Two Warehouses, and It doesn't Surpass ``ROUTE_DISTANCE_MAX``. Otherwise, ``False``
+        :rtype: bool
         """
 
         try:
-            # Get Route Distance from the Main Warehouse to Insert and the Inserted Warehouse
-            routeDistanceSender = ORSGeocoder.getDrivingRouteDistance(
-                warehouseDict[DICT_WAREHOUSE_COORDS],
-                warehouseConnDict[DICT_WAREHOUSE_COORDS],
-            )
+            # Check if there's a Route between the Two Warehouses
+            if routeDistance == None:
+                raise RouteNotFound(
+                    warehouseDict[DICT_WAREHOUSE_COORDS],
+                    warehouseConnDict[DICT_WAREHOUSE_COORDS],
+                )
 
             # Check Route Distance Length
-            if routeDistanceSender > ROUTE_DISTANCE_MAX:
+            if routeDistance > ROUTE_DISTANCE_MAX:
                 raise RouteLimitSurpassed(
-                    warehouseConnDict[DICT_WAREHOUSE_COORDS],
                     warehouseDict[DICT_WAREHOUSE_COORDS],
-                    routeDistanceSender,
+                    warehouseConnDict[DICT_WAREHOUSE_COORDS],
+                    routeDistance,
                     ROUTE_DISTANCE_MAX,
                 )
 
         # There's no Road Connection between the Two Warehouses
         except RouteNotFound as err:
             console.print(err, style="warning")
-            return
+            return False
 
         # The Road Connection between the Two Warehouses is too Long
         except RouteLimitSurpassed as err:
             console.print(err, style="warning")
-            return
+            return False
 
-        # Get Warehouse and Warehouse Connection ID
-        warehouseId = warehouseDict[DICT_WAREHOUSE_ID]
-        warehouseConnId = warehouseConnDict[DICT_WAREHOUSE_ID]
+        return True
 
-        # Insert the Given Warehouse as a Sender
-        await asyncio.gather(
-            acursor.execute(
-                query,
-                [warehouseId, warehouseConnId, routeDistanceSender, connType],
-            )
-        )
-
-        if ROUTES_DEBUG_MODE:
-            console.print(
-                f"Inserted Warehouse Sender Connection from ID {warehouseId} to ID {warehouseConnId} at {connType}-Level\n",
-                style="success",
-            )
-
-    async def __insertWarehouseReceiverConn(
+    async def __getMainWarehouseConns(
         self,
-        acursor,
-        ORSGeocoder: ORSGeocoder,
-        query,
-        connType: str,
-        warehouseDict: dict,
-        warehouseConnDict: dict,
-    ):
+        distanceProvider: DistanceProvider,
+        mainWarehouseConns: list[tuple[str, dict, list[dict]]],
+    ) -> list[tuple[str, dict, dict, int]]:
         """
-        Asynchronous Method to Insert a Warehouse Receiver Connection Asynchronously
+        Asynchronous Method to Get All the Warehouse Connections for Some Given Main Warehouses. Each Pair of Warehouses is Requested Once, through the Route Distances Matrix of its Main Warehouse. It doesn't Use the Remote Database, so It can be Called before Opening the Transaction where the Connections are Inserted
 
-        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
-        :param Composed query: SQL Query to Insert a Warehouse Connection
-        :param str connType: Location Connection Level
-        :param dict warehouseDict: Warehouse Connection Dictionary of the One that Receives the Packages
-        :param dict warehouseConnDict: Warehouse Connection Dictionary of the One that Sends the Packages
-        :return: Nothing
-        :rtype: NoneType
-        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        :param DistanceProvider distanceProvider: Route Distance Provider Object to Calculate the Route Distance between the Two Warehouses
+        :param list mainWarehouseConns: List of Tuples with the Location Connection Level, the Main Warehouse Connection Dictionary, and the List of Warehouse Connection Dictionaries that will be Connected with It. A Warehouse that hasn't been Inserted yet has a ``None`` ID
+        :return: List of Tuples with the Location Connection Level, the Main Warehouse Connection Dictionary, the Warehouse Connection Dictionary and the Route Distance between Them, One for Each Valid Route
+        :rtype: list
         """
 
-        try:
-            # Get Route Distance from the Inserted Warehouse to the Main Warehouse to Insert
-            routeDistanceReceiver = ORSGeocoder.getDrivingRouteDistance(
-                warehouseConnDict[DICT_WAREHOUSE_COORDS],
-                warehouseDict[DICT_WAREHOUSE_COORDS],
-            )
-
-            # Check Route Distance Length
-            if routeDistanceReceiver > ROUTE_DISTANCE_MAX:
-                raise RouteLimitSurpassed(
-                    warehouseConnDict[DICT_WAREHOUSE_COORDS],
-                    warehouseDict[DICT_WAREHOUSE_COORDS],
-                    routeDistanceReceiver,
-                    ROUTE_DISTANCE_MAX,
-                )
-
-        # There's no Road Connection between the Two Warehouses
-        except RouteNotFound as err:
-            console.print(err, style="warning")
-            return
-
-        # The Road Connection between the Two Warehouses is too Long
-        except RouteLimitSurpassed as err:
-            console.print(err, style="warning")
-            return
-
-        # Get Warehouse and Warehouse Connection ID
-        warehouseId = warehouseDict[DICT_WAREHOUSE_ID]
-        warehouseConnId = warehouseConnDict[DICT_WAREHOUSE_ID]
+        # Get the Unordered Pairs of Warehouses to Connect at Each Location Level
+        pairs = {}
 
-        # Insert the Given Warehouse as a Receiver
-        await asyncio.gather(
-            acursor.execute(
-                query, [warehouseConnId, warehouseId, routeDistanceReceiver, connType]
-            )
-        )
+        for connType, warehouseDict, warehouseConns in mainWarehouseConns:
+            for warehouseConnDict in warehouseConns:
+                warehouseId = warehouseDict[DICT_WAREHOUSE_ID]
+                warehouseConnId = warehouseConnDict[DICT_WAREHOUSE_ID]
 
-        if ROUTES_DEBUG_MODE:
-            console.print(
-                f"Inserted Warehouse Receiver Connection from ID {warehouseConnId} to ID {warehouseId} at {connType}-Level\n",
-                style="success",
-            )
+                # Check the Warehouse Connection ID. Ignore if they're the Same
+                if warehouseConnId == warehouseId:
+                    continue
 
-    async def __insertMainWarehouseConns(
-        self,
-        apool: AsyncPool,
-        ORSGeocoder: ORSGeocoder,
-        connType: str,
-        warehouseDict: dict,
-        warehouseConns: list[dict],
-    ):
-        """
-        Asynchronous Method to Insert All the Warehouse Connections for a Given Main Warehouse Asynchronously
+                # Ignore the Pair if It was Already Added, in Any Direction
+                key = (connType, frozenset((warehouseId, warehouseConnId)))
+                pairs.setdefault(key, (connType, warehouseDict, warehouseConnDict))
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
-        :param str connType: Location Connection Level
-        :param dict warehouseDict: Main Warehouse Connection Dictionary
-        :param list warehouseConnDict: List of Warehouse Connection Dictionaries that will be Connected with the Main Warehouse
-        :return: Nothing
-        :rtype: NoneType
-        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
-        """
+        # Group the Pairs by its Main Warehouse, so Each Group is Requested as a Single Row of the Route Distances Matrix
+        groups = {}
 
-        i = 0
-        nConns = 3
+        for connType, warehouseDict, warehouseConnDict in pairs.values():
+            warehouseId = warehouseDict[DICT_WAREHOUSE_ID]
 
-        def getConnIndex(i: int) -> int:
-            """
-            Function to Get the Connection Index to be Assigned from the ``aconns`` List
+            if warehouseId not in groups:
+                groups[warehouseId] = (warehouseDict, [])
 
-            :param int i: Index of the Last Connection Assigned from ``aconns``
-            :return: Index of the Connection to be Assigned
-            :rtype: int
-            """
+            groups[warehouseId][1].append((connType, warehouseConnDict))
 
-            return 0 if i == nConns - 1 else i + 1
+        # Get the Route Distances of Each Group Concurrently
+        tasks = [
+            asyncio.create_task(
+                distanceProvider.getDrivingRouteDistances(
+                    [warehouseDict[DICT_WAREHOUSE_COORDS]],
+                    [
+                        warehouseConnDict[DICT_WAREHOUSE_COORDS]
+                        for _, warehouseConnDict in warehouseConns
+                    ],
+                )
+            )
+            for warehouseDict, warehouseConns in groups.values()
+        ]
 
-        # Get 3 Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(nConns))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
-        print(aconns)
+        try:
+            await asyncio.gather(*tasks)
 
-        # Get Query to Insert Warehouse Connections
-        query = self.__insertWarehouseConnQuery()
+        except Exception as err:
+            cancelTasks(tasks)
+            raise err
 
-        # Insert Each Warehouse Connection to its Table Asynchronously
-        async with asyncio.TaskGroup() as tg:
-            for warehouseConnDict in warehouseConns:
-                # Check the Warehouse Connection ID. Ignore if they're the Same
-                if (
-                    warehouseConnDict[DICT_WAREHOUSE_ID]
-                    == warehouseDict[DICT_WAREHOUSE_ID]
-                ):
-                    continue
+        # Keep the Pairs with a Valid Route
+        conns = []
 
-                # Insert the Main Warehouse Sender Connection
-                tg.create_task(
-                    self.__insertWarehouseSenderConn(
-                        aconns[0].cursor(),
-                        ORSGeocoder,
-                        query,
-                        connType,
-                        warehouseDict,
-                        warehouseConnDict,
-                    )
-                )
+        for (warehouseDict, warehouseConns), task in zip(groups.values(), tasks):
+            routeDistances = task.result()[0]
 
-                # Insert the Main Warehouse Receiver Connection
-                tg.create_task(
-                    self.__insertWarehouseReceiverConn(
-                        aconns[2].cursor(),
-                        ORSGeocoder,
-                        query,
-                        connType,
-                        warehouseDict,
-                        warehouseConnDict,
+            for (connType, warehouseConnDict), routeDistance in zip(
+                warehouseConns, routeDistances
+            ):
+                if self.__isRouteValid(warehouseDict, warehouseConnDict, routeDistance):
+                    conns.append(
+                        (connType, warehouseDict, warehouseConnDict, routeDistance)
                     )
-                )
 
-        # Put the Connections Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnections(aconns))
+        return conns
 
-    async def insertRegionMainWarehouse(
+    async def getRegionMainWarehouseConns(
         self,
-        apool,
-        ORSGeocoder: ORSGeocoder,
+        aconn,
+        distanceProvider: DistanceProvider,
         countryId: int,
         regionId: int,
         warehouseDict: dict,
-    ) -> None:
+        replacedWarehouseId: int = None,
+    ) -> list[tuple[str, dict, dict, int]]:
         """
-        Asynchronous Method to Insert All the Region Main Warehouse Connections for a Given Region
+        Asynchronous Method to Get All the Region Main Warehouse Connections for a Given Region
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param DistanceProvider distanceProvider: Route Distance Provider Object to Calculate the Route Distance between the Two Warehouses
         :param int countryId: Country ID where the Region is Located
         :param int regionId: Region ID where the Warehouse is Located
         :param dict warehouseDict: New Region Main Warehouse Connection Dictionary
-        :return: Nothing
-        :rtype: NoneType
+        :param int replacedWarehouseId: Current Region Main Warehouse ID, that will be Replaced by the New One. Default is ``None``
+        :return: List of Warehouse Connections to Insert through ``insertWarehouseConns``
+        :rtype: list
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Two Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(2))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
+        acursor = aconn.cursor()
 
-        # Get All the Region Main Warehouses at the Given Country ID
-        regionMainWarehousesTask = asyncio.create_task(
-            self.getRegionMainWarehouseDicts(aconns[0].cursor(), countryId)
-        )
+        # Get All the Region Main Warehouses at the Given Country ID, but the Replaced One
+        regionMainWarehouses = [
+            w
+            for w in await self.getRegionMainWarehouseDicts(acursor, countryId)
+            if w[DICT_WAREHOUSE_ID] != replacedWarehouseId
+        ]
 
         # Get All the City Main Warehouses at the Given Region ID
-        cityMainWarehousesTask = asyncio.create_task(
-            self.getCityMainWarehouseDicts(aconns[1].cursor(), regionId)
-        )
-
-        tasks = [regionMainWarehousesTask, cityMainWarehousesTask]
-        try:
-            await asyncio.gather(*tasks)
-
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
+        cityMainWarehouses = await self.getCityMainWarehouseDicts(acursor, regionId)
 
-        regionMainWarehouses = regionMainWarehousesTask.result()
-        cityMainWarehouses = cityMainWarehousesTask.result()
-
-        # Put the Connections Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnections(aconns))
-
-        # Set the Region Main Warehouse Connections
-        regionMainTask = asyncio.create_task(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_REGION,
-                warehouseDict,
-                regionMainWarehouses,
-            )
+        # Get the Region Main Warehouse Connections and the City Main Warehouse Connections
+        warehouseConns = await self.__getMainWarehouseConns(
+            distanceProvider,
+            [
+                (CONN_TYPE_REGION, warehouseDict, regionMainWarehouses),
+                (CONN_TYPE_REGION, warehouseDict, cityMainWarehouses),
+            ],
         )
 
-        # Set the City Main Warehouse Connections
-        cityMainTask = asyncio.create_task(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_REGION,
-                warehouseDict,
-                cityMainWarehouses,
-            )
-        )
-
-        tasks = [regionMainTask, cityMainTask]
-        try:
-            await asyncio.gather(*tasks)
-
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
-
         if not ROUTES_DEBUG_MODE:
             console.print()
 
-    async def insertCityMainWarehouse(
+        return warehouseConns
+
+    async def getCityMainWarehouseConns(
         self,
-        apool: AsyncPool,
-        ORSGeocoder: ORSGeocoder,
+        aconn,
+        distanceProvider: DistanceProvider,
         regionId: int,
         cityId: int,
         parentWarehouseDict: dict,
         warehouseDict: dict,
-    ) -> None:
+        replacedWarehouseId: int = None,
+    ) -> list[tuple[str, dict, dict, int]]:
         """
-        Asynchronous Method to Insert All the City Main Warehouse Connections for a Given City
+        Asynchronous Method to Get All the City Main Warehouse Connections for a Given City
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param DistanceProvider distanceProvider: Route Distance Provider Object to Calculate the Route Distance between the Two Warehouses
         :param int regionId: Region ID where the City is Located
         :param int cityId: City ID where the Warehouse is Located
         :param dict parentWarehouseDict: Region Main Warehouse Connection Dictionary
         :param dict warehouseDict: New City Main Warehouse Connection Dictionary
-        :return: Nothing
-        :rtype: NoneType
+        :param int replacedWarehouseId: Current City Main Warehouse ID, that will be Replaced by the New One. Default is ``None``
+        :return: List of Warehouse Connections to Insert through ``insertWarehouseConns``
+        :rtype: list
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Get Two Connections from the Asynchronous Pool
-        getTask = asyncio.create_task(apool.getConnections(2))
-        await asyncio.gather(getTask)
-        aconns = getTask.result()
+        acursor = aconn.cursor()
 
-        # Get All the City Main Warehouses at the Given Region ID
-        cityMainWarehousesTask = asyncio.create_task(
-            self.getCityMainWarehouseDicts(aconns[0].cursor(), regionId)
-        )
+        # Get All the City Main Warehouses at the Given Region ID, but the Replaced One
+        cityMainWarehouses = [
+            w
+            for w in await self.getCityMainWarehouseDicts(acursor, regionId)
+            if w[DICT_WAREHOUSE_ID] != replacedWarehouseId
+        ]
 
         # Get All the City Warehouses at the Given City ID
-        cityWarehousesTask = asyncio.create_task(
-            self.getCityWarehouseDicts(aconns[1].cursor(), cityId)
-        )
-
-        tasks = [cityMainWarehousesTask, cityWarehousesTask]
-        try:
-            await asyncio.gather(*tasks)
+        cityWarehouses = await self.getCityWarehouseDicts(acursor, cityId)
 
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
-
-        cityMainWarehouses = cityMainWarehousesTask.result()
-        cityWarehouses = cityWarehousesTask.result()
-
-        # Put the Connections Back to the Asynchronous Pool
-        await asyncio.gather(apool.putConnections(aconns))
-
-        # Set the Region Main Warehouse Connection
-        regionMainTask = asyncio.create_task(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_REGION,
-                parentWarehouseDict,
-                [warehouseDict],
-            )
-        )
-
-        # Set the City Main Warehouse Connections
-        cityMainTask = asyncio.create_task(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_CITY,
-                warehouseDict,
-                cityMainWarehouses,
-            )
-        )
-
-        # Set the City Warehouse Connections
-        cityTask = asyncio.create_task(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_CITY,
-                warehouseDict,
-                cityWarehouses,
-            )
+        # Get the Region Main Warehouse Connection, the City Main Warehouse Connections and the City Warehouse Connections
+        warehouseConns = await self.__getMainWarehouseConns(
+            distanceProvider,
+            [
+                (CONN_TYPE_REGION, parentWarehouseDict, [warehouseDict]),
+                (CONN_TYPE_CITY, warehouseDict, cityMainWarehouses),
+                (CONN_TYPE_CITY, warehouseDict, cityWarehouses),
+            ],
         )
 
-        tasks = [regionMainTask, cityMainTask, cityTask]
-        try:
-            await asyncio.gather(*tasks)
-
-        except Exception as err:
-            cancelTasks(tasks)
-            raise err
-
         if not ROUTES_DEBUG_MODE and RICH_LOGGER_DEBUG_MODE:
             console.print("\n")
 
-    async def insertCityWarehouse(
+        return warehouseConns
+
+    async def getCityWarehouseConns(
         self,
-        apool: AsyncPool,
-        ORSGeocoder: ORSGeocoder,
+        distanceProvider: DistanceProvider,
         warehouseDict: dict,
         warehouseConnDict: dict,
-    ):
+    ) -> list[tuple[str, dict, dict, int]]:
         """
-        Asynchronous Method to Insert the Warehouse Connection with the Given Main Warehouse at the City ID where the Warehouse is Located Asynchronously
+        Asynchronous Method to Get the Warehouse Connection with the Given Main Warehouse at the City ID where the Warehouse is Located
 
-        :param AsyncPool apool: Object of the Asynchronous Connection Pool with the Remote Database
-        :param ORSGeocoder ORSGeocoder: ORSGeocoder Object to Calculate the Route Distance between the Two Warehouses
+        :param DistanceProvider distanceProvider: Route Distance Provider Object to Calculate the Route Distance between the Two Warehouses
         :param dict warehouseDict: Warehouse Connection Dictionary
         :param list warehouseConnDict: Warehouse Connection Dictionary that will be Connected with the Warehouse
-        :return: Nothing
-        :rtype: NoneType
-        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        :return: List of Warehouse Connections to Insert through ``insertWarehouseConns``
+        :rtype: list
         """
 
-        # Insert the Warehouse Connection to its Table Asynchronously
-        await asyncio.gather(
-            self.__insertMainWarehouseConns(
-                apool,
-                ORSGeocoder,
-                CONN_TYPE_CITY,
-                warehouseDict,
-                [warehouseConnDict],
-            )
+        warehouseConns = await self.__getMainWarehouseConns(
+            distanceProvider,
+            [(CONN_TYPE_CITY, warehouseDict, [warehouseConnDict])],
         )
 
         if not ROUTES_DEBUG_MODE and RICH_LOGGER_DEBUG_MODE:
             console.print("\n")
+
+        return warehouseConns
+
+    async def insertWarehouseConns(
+        self, aconn, warehouseConns: list[tuple[str, dict, dict, int]]
+    ) -> None:
+        """
+        Asynchronous Method to Insert Some Warehouse Connections. Both Directions are the Driving Route between the Same Points, so They Share a Single Route Distance, and All the Rows are Sent as a Single Batch. The Warehouse IDs are Read Here, so a New Warehouse ID can be Set after Getting its Connections
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database, with an Open Transaction
+        :param list warehouseConns: List of Warehouse Connections Returned by ``getRegionMainWarehouseConns``, ``getCityMainWarehouseConns`` or ``getCityWarehouseConns``
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Get the Sender and the Receiver Connection Rows of Each Pair
+        rows = []
+
+        for connType, warehouseDict, warehouseConnDict, routeDistance in warehouseConns:
+            warehouseId = warehouseDict[DICT_WAREHOUSE_ID]
+            warehouseConnId = warehouseConnDict[DICT_WAREHOUSE_ID]
+
+            rows.append((warehouseId, warehouseConnId, routeDistance, connType))
+            rows.append((warehouseConnId, warehouseId, routeDistance, connType))
+
+        if len(rows) == 0:
+            return
+
+        # Get Query to Insert Warehouse Connections
+        query = self.__insertWarehouseConnQuery()
+
+        # Insert All the Warehouse Connections
+        await aconn.cursor().executemany(query, rows)
+
+        if ROUTES_DEBUG_MODE:
+            for warehouseFromId, warehouseToId, _, connType in rows:
+                console.print(
+                    f"Inserted Warehouse Connection from ID {warehouseFromId} to ID {warehouseToId} at {connType}-Level\n",
+                    style="success",
+                )
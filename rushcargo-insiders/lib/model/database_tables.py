@@ -1,10 +1,8 @@
-import asyncio
-
 from psycopg import sql
 
 from rich.table import Table
 
-from .constants import BOX_STYLE
+from .constants import ALL_PAGE_SIZE, BOX_STYLE, PREPARE_QUERIES
 from .database import console
 from .exceptions import LenError
 
@@ -129,6 +127,115 @@ def getTable(tableName: str, nRows: int) -> Table:
     )
 
 
+def getColumnsQuery(columns: tuple = None):
+    """
+    Function to Get the Columns to Select at a Given Query. If there are no Columns Given, All of Them are Selected
+
+    :param tuple columns: Table Fields Name to Select. Default is ``None``
+    :return: SQL Columns Projection
+    :rtype: Composable
+    """
+
+    if columns == None:
+        return sql.SQL("*")
+
+    return sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+
+
+def getFilterQuery(
+    fields: tuple,
+    anyFields: tuple,
+    orderBy: str = None,
+    desc: bool = False,
+    keyset: bool = False,
+    limit: bool = False,
+):
+    """
+    Function to Get the WHERE, ORDER BY and LIMIT Clauses to Filter the Rows of a Given Query with N Field-Value Pairs Joined with AND
+
+    :param tuple fields: Table Fields Name to be Compared
+    :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values (``= ANY``, Same as ``IN`` but with a Single Array Parameter) or a Single Value
+    :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+    :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
+    :param bool keyset: Specifies whether to Add a Keyset Pagination Condition over ``orderBy``, to Fetch only the Rows after a Given Value. Default is ``False``
+    :param bool limit: Specifies whether to Add a LIMIT Clause. Default is ``False``
+    :return: SQL Filter Clauses
+    :rtype: Composed
+    """
+
+    # Get the WHERE Conditions
+    conditions = [
+        sql.SQL("{field} = ANY(%s)" if anyField else "{field} = (%s)").format(
+            field=sql.Identifier(field)
+        )
+        for field, anyField in zip(fields, anyFields)
+    ]
+
+    # Fetch only the Rows after the Last Value of the Previous Page
+    if keyset:
+        conditions.append(
+            sql.SQL("{orderBy} < (%s)" if desc else "{orderBy} > (%s)").format(
+                orderBy=sql.Identifier(orderBy)
+            )
+        )
+
+    clauses = []
+
+    if len(conditions) > 0:
+        clauses.append(sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions))
+
+    # Check if there's Some Sorting to be Applied
+    if orderBy != None:
+        clauses.append(
+            sql.SQL(
+                " ORDER BY {orderBy} DESC" if desc else " ORDER BY {orderBy}"
+            ).format(orderBy=sql.Identifier(orderBy))
+        )
+
+    if limit:
+        clauses.append(sql.SQL(" LIMIT %s"))
+
+    return sql.Composed(clauses)
+
+
+def getFilterParams(values: list, after=None, limit: int = None) -> list:
+    """
+    Function to Get the Parameters of a Query Filtered with ``getFilterQuery``
+
+    :param list values: Values to be Compared. Lists, Tuples and Sets are Compared with ``= ANY``
+    :param after: Last Value of ``orderBy`` at the Previous Page. Default is ``None``
+    :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
+    :return: List of Query Parameters
+    :rtype: list
+    """
+
+    # Arrays are Adapted from Lists
+    params = [
+        list(value) if isinstance(value, (list, tuple, set)) else value
+        for value in values
+    ]
+
+    if after != None:
+        params.append(after)
+
+    if limit != None:
+        params.append(limit)
+
+    return params
+
+
+def getAnyFields(values: list) -> tuple:
+    """
+    Function to Check which of the Given Values have to be Compared with ``= ANY``
+
+    :param list values: Values to be Compared
+    :return: Tuple that Specifies for each Value whether It's a List of Values or Not
+    :rtype: tuple
+    """
+
+    return tuple(isinstance(value, (list, tuple, set)) for value in values)
+
+
 class BaseTable:
     """
     Base Remote Table Class
@@ -142,6 +249,9 @@ class BaseTable:
     _tableName = None
     _tablePKName = None
 
+    # Composed Queries Cache
+    __queries = None
+
     def __init__(self, tableName: str, tablePKName: str, schemeName: str = None):
         """
         Base Remote Table Class Constructor
@@ -156,6 +266,28 @@ class BaseTable:
         self._tableName = tableName
         self._tablePKName = tablePKName
 
+        # Initialize Composed Queries Cache
+        self.__queries = {}
+
+    def __getCachedQuery(self, getQuery, *args):
+        """
+        Method to Get a Composed Query from the Cache. If it hasn't been Composed Yet, it's Composed and Stored, so the Same Query isn't Rebuilt for each Execution
+
+        :param getQuery: Method that Composes the Query
+        :param args: Arguments Passed to the Method that Composes the Query, which are also Used as the Cache Key
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        key = (getQuery.__name__, *args)
+        query = self.__queries.get(key)
+
+        # Compose the Query and Store It
+        if query is None:
+            query = self.__queries[key] = getQuery(*args)
+
+        return query
+
     def __getQuery(self, field: str, orderBy: str = None):
         """
         Method to Get the Query to Select Some Table Rows based on a Given Field-Value Pair to Compare
@@ -185,35 +317,51 @@ class BaseTable:
             orderBy=sql.Identifier(orderBy),
         )
 
-    def __getAndQuery(self, field1: str, field2: str, orderBy: str = None):
+    def __getFilterQuery(
+        self,
+        fields: tuple,
+        anyFields: tuple,
+        columns: tuple = None,
+        orderBy: str = None,
+        desc: bool = False,
+        keyset: bool = False,
+        limit: bool = False,
+    ):
         """
-        Method to Get the Query to Select Some Table Rows based on Two Given Field-Value Pair to Compare
+        Method to Get the Query to Select Some Table Rows based on N Given Field-Value Pairs to Compare
 
-        :param str field1: First Table Field Name to be Compared
-        :param str field2: Second Table Field Name to be Compared
+        :param tuple fields: Table Fields Name to be Compared
+        :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values or a Single Value
+        :param tuple columns: Table Fields Name to Select. Default is ``None``, which Selects All of Them
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
+        :param bool keyset: Specifies whether to Add a Keyset Pagination Condition over ``orderBy``. Default is ``False``
+        :param bool limit: Specifies whether to Add a LIMIT Clause. Default is ``False``
         :return: SQL Query
         :rtype: Composed
         """
-        # Check if there's Some Sorting to be Applied
-        if orderBy == None:
-            return sql.SQL(
-                "SELECT * FROM {schemeName}.{tableName} WHERE {field1} = (%s) AND {field2} = (%s)"
-            ).format(
-                schemeName=sql.Identifier(self._schemeName),
-                tableName=sql.Identifier(self._tableName),
-                field1=sql.Identifier(field1),
-                field2=sql.Identifier(field2),
-            )
 
-        return sql.SQL(
-            "SELECT * FROM {schemeName}.{tableName} WHERE {field1} = (%s) AND {field2} = (%s) ORDER BY {orderBy}"
-        ).format(
+        return sql.SQL("SELECT {columns} FROM {schemeName}.{tableName}{filter}").format(
+            columns=getColumnsQuery(columns),
             schemeName=sql.Identifier(self._schemeName),
             tableName=sql.Identifier(self._tableName),
-            field1=sql.Identifier(field1),
-            field2=sql.Identifier(field2),
-            orderBy=sql.Identifier(orderBy),
+            filter=getFilterQuery(fields, anyFields, orderBy, desc, keyset, limit),
+        )
+
+    def __existsQuery(self, fields: tuple, anyFields: tuple):
+        """
+        Method to Get the Query to Check whether there's at least One Table Row based on N Given Field-Value Pairs to Compare
+
+        :param tuple fields: Table Fields Name to be Compared
+        :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values or a Single Value
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        return sql.SQL("SELECT 1 FROM {schemeName}.{tableName}{filter} LIMIT 1").format(
+            schemeName=sql.Identifier(self._schemeName),
+            tableName=sql.Identifier(self._tableName),
+            filter=getFilterQuery(fields, anyFields),
         )
 
     def __orderByQuery(self, orderBy: str, desc: bool):
@@ -264,6 +412,24 @@ class BaseTable:
             modField=sql.Identifier(modField),
         )
 
+    def __insertQuery(self, fields: tuple):
+        """
+        Method to Get the Query to Insert a Row with the Given Fields
+
+        :param tuple fields: Table Fields Name to Insert
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        return sql.SQL(
+            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES ({values})"
+        ).format(
+            schemeName=sql.Identifier(self._schemeName),
+            tableName=sql.Identifier(self._tableName),
+            fields=sql.SQL(", ").join(sql.Identifier(field) for field in fields),
+            values=sql.SQL(", ").join(sql.Placeholder() * len(fields)),
+        )
+
     def __removeQuery(self, field: str):
         """
         Method to Get the Query to Remove a Row with a Given Value at a Given Field
@@ -297,13 +463,20 @@ class BaseTable:
         idField = self._tablePKName
 
         # Get Query to Modify the Given Row
-        query = self.__modifyQuery(idField, field)
+        query = self.__getCachedQuery(self.__modifyQuery, idField, field)
 
         # Execute the Query and Print a Success Message
-        await asyncio.gather(acursor.execute(query, [value, idValue]))
+        await acursor.execute(query, [value, idValue], prepare=PREPARE_QUERIES)
         modifiedRow(field, value, idField, idValue, self._tableName)
 
-    async def _get(self, acursor, field: str, value, orderBy: str = None) -> None:
+    async def _get(
+        self,
+        acursor,
+        field: str,
+        value,
+        orderBy: str = None,
+        columns: list[str] = None,
+    ) -> None:
         """
         Asynchronous Method to Check whether the Table Contains at least One Row with a Given Field-Value Pair
 
@@ -311,81 +484,208 @@ class BaseTable:
         :param str field: Field to be Compared
         :param value: Value to be Compared
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
         :return: Nothing
         :rtype: NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        query = self.__getQuery(field, orderBy)
+        # Select only the Given Columns
+        if columns != None:
+            return await self._getMult(acursor, [field], [value], orderBy, columns)
+
+        query = self.__getCachedQuery(self.__getQuery, field, orderBy)
 
         # Execute the Query and Fetch the Items
-        await asyncio.gather(acursor.execute(query, [value]))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, [value], prepare=PREPARE_QUERIES)
+        self._items = await acursor.fetchall()
 
     async def _getMult(
-        self, acursor, fields: list[str], values: list, orderBy: str = None
+        self,
+        acursor,
+        fields: list[str],
+        values: list,
+        orderBy: str = None,
+        columns: list[str] = None,
+        limit: int = None,
+        after=None,
+        desc: bool = False,
     ) -> None:
         """
-        Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs
+        Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs. Values Given as Lists are Compared with ``IN`` Semantics
 
         :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
         :param list fields: Fields to be Compared
         :param list values: Values to be Compared
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
+        :param after: Last ``orderBy`` Value of the Previous Page, for Keyset Pagination. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
         :return: Nothing
         :rtype: NoneType
         :raises LenError: Raised if ``fields`` and ``values`` have Different Lists Length
+        :raises ValueError: Raised if ``after`` is Given without ``orderBy``
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         # Lists MUST have the Same Length
-        length = len(fields)
-
-        if length != len(values):
+        if len(fields) != len(values):
             raise LenError()
 
-        # Check the Number of WHERE Conditions
-        if length > 2:
-            console.print("Query hasn't been Implemented", style="warning")
-            return
-
-        # Get Query for Two Conditions and Execute it
-        elif length == 2:
-            twoCondQuery = self.__getAndQuery(fields[0], fields[1], orderBy)
-            await asyncio.gather(acursor.execute(twoCondQuery, [values[0], values[1]]))
-
-        # Query for One Condition. Method Implemented
-        elif length == 1:
-            await asyncio.gather(self._get(acursor, fields[0], values[0], orderBy))
-            return
+        # Keyset Pagination MUST be Sorted
+        if after != None and orderBy == None:
+            raise ValueError("Keyset Pagination Requires a Field to Sort the Rows")
+
+        # Get Query for N Conditions
+        query = self.__getCachedQuery(
+            self.__getFilterQuery,
+            tuple(fields),
+            getAnyFields(values),
+            None if columns == None else tuple(columns),
+            orderBy,
+            desc,
+            after != None,
+            limit != None,
+        )
 
-        # Fetch the Items
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        # Execute the Query and Fetch the Items
+        await acursor.execute(
+            query, getFilterParams(values, after, limit), prepare=PREPARE_QUERIES
+        )
+        self._items = await acursor.fetchall()
 
-    async def _all(self, acursor, orderBy: str, desc: bool) -> None:
+    async def _all(
+        self, acursor, orderBy: str, desc: bool, columns: list[str] = None
+    ) -> None:
         """
         Asynchronoues Method to Print the Table Rows Sorted in Asceding/Descending Order for a Given Field
 
         :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
         :param str orderBy: Table Field to Sort
         :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
         :return: Nothing
         :rtype: NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
+        # Select only the Given Columns
+        if columns != None:
+            return await self._getMult(acursor, [], [], orderBy, columns, desc=desc)
+
         # Get Query To Sort the Table Rows
-        query = self.__orderByQuery(orderBy, desc)
+        query = self.__getCachedQuery(self.__orderByQuery, orderBy, desc)
 
         # Execute the Query and Fetch the Items
-        await asyncio.gather(acursor.execute(query))
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        await acursor.execute(query, prepare=PREPARE_QUERIES)
+        self._items = await acursor.fetchall()
+
+    async def _iterAll(
+        self,
+        aconn,
+        orderBy: str,
+        desc: bool,
+        pageSize: int = ALL_PAGE_SIZE,
+        rowFactory=None,
+    ):
+        """
+        Asynchronous Generator Method to Stream the Table Rows Sorted in Asceding/Descending Order for a Given Field, in Pages. The Rows are Fetched through a Server-side Cursor, so only One Page is Kept in Memory at a Time
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param str orderBy: Table Field to Sort
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order
+        :param int pageSize: Maximum Number of Rows per Page. Default is ``ALL_PAGE_SIZE``
+        :param rowFactory: ``psycopg`` Row Factory Used to Initialize the Fetched Rows. Default is ``None``, which Fetches Tuples
+        :return: Asynchronous Iterator of Lists of Fetched Rows
+        :rtype: AsyncIterator
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Get Query To Sort the Table Rows
+        query = self.__getCachedQuery(self.__orderByQuery, orderBy, desc)
+
+        # Open a Server-side Cursor inside the Current Transaction
+        async with aconn.cursor(
+            name=f"{self._tableName}_all", row_factory=rowFactory
+        ) as acursor:
+            acursor.itersize = pageSize
+            await acursor.execute(query)
+
+            # Fetch the Rows Page by Page
+            while True:
+                items = await acursor.fetchmany(pageSize)
+
+                if len(items) == 0:
+                    break
+
+                yield items
+
+    async def _exists(self, acursor, fields: list[str], values: list) -> bool:
+        """
+        Asynchronous Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs, without Fetching It
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Fields to be Compared
+        :param list values: Values to be Compared
+        :return: ``True`` if there's at least One Row. Otherwise, ``False``
+        :rtype: bool
+        :raises LenError: Raised if ``fields`` and ``values`` have Different Lists Length
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Lists MUST have the Same Length
+        if len(fields) != len(values):
+            raise LenError()
+
+        query = self.__getCachedQuery(
+            self.__existsQuery, tuple(fields), getAnyFields(values)
+        )
+
+        # Execute the Query and Fetch the First Row, if Any
+        await acursor.execute(query, getFilterParams(values), prepare=PREPARE_QUERIES)
+
+        return await acursor.fetchone() != None
+
+    async def _getId(self, acursor, fields: list[str], values: list) -> int | None:
+        """
+        Asynchronous Method to Get the Primary Key of the First Row with Some Given Field-Value Pairs, without Fetching the Rest of its Columns
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Fields to be Compared
+        :param list values: Values to be Compared
+        :return: Row Primary Key if Found. Otherwise, ``None``
+        :rtype: int if Found. Otherwise, NoneType
+        :raises LenError: Raised if ``fields`` and ``values`` have Different Lists Length
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        await self._getMult(
+            acursor, fields, values, columns=[self._tablePKName], limit=1
+        )
+
+        return None if len(self._items) == 0 else self._items[0][0]
+
+    async def _addMany(self, acursor, fields: list[str], rows: list) -> None:
+        """
+        Asynchronous Method to Insert Several Rows with a Single Batched Statement
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Table Fields Name to Insert
+        :param list rows: List of Tuples that Contain the Values of each Row, in the Same Order as ``fields``
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution
+        """
+
+        # Nothing to Insert
+        if len(rows) == 0:
+            return
+
+        query = self.__getCachedQuery(self.__insertQuery, tuple(fields))
+
+        # Execute the Query for All the Rows. psycopg Pipelines the Statements, so It's a Single Round Trip
+        await acursor.executemany(query, rows)
 
     async def _remove(self, acursor, idValue: int) -> None:
         """
@@ -401,10 +701,10 @@ class BaseTable:
         idField = self._tablePKName
 
         # Get Query to Remove the Given Row
-        query = self.__removeQuery(idField)
+        query = self.__getCachedQuery(self.__removeQuery, idField)
 
         # Execute the Query and Print a Success Message
-        await asyncio.gather(acursor.execute(query, [idValue]))
+        await acursor.execute(query, [idValue], prepare=PREPARE_QUERIES)
         removeRow(self._tableName, idField, idValue)
 
 
@@ -424,6 +724,9 @@ class SpecializationTable:
     _schemeName = None
     _parentSchemeName = None
 
+    # Composed Queries Cache
+    __queries = None
+
     # Constructor
     def __init__(
         self,
@@ -454,6 +757,28 @@ class SpecializationTable:
         self._schemeName = schemeName
         self._parentSchemeName = parentSchemeName
 
+        # Initialize Composed Queries Cache
+        self.__queries = {}
+
+    def __getCachedQuery(self, getQuery, *args):
+        """
+        Method to Get a Composed Query from the Cache. If it hasn't been Composed Yet, it's Composed and Stored
+
+        :param getQuery: Method that Composes the Query
+        :param args: Arguments Passed to the Method that Composes the Query, which are also Used as the Cache Key
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        key = (getQuery.__name__, *args)
+        query = self.__queries.get(key)
+
+        # Compose the Query and Store It
+        if query is None:
+            query = self.__queries[key] = getQuery(*args)
+
+        return query
+
     def __getTableQuery(self, field: str, orderBy: str = None):
         """
         Method to Get the Query to Select Some Table Rows based on a Given Field-Value Pair to Compare at the Main Table
@@ -518,74 +843,105 @@ class SpecializationTable:
             orderBy=sql.Identifier(orderBy),
         )
 
-    def __getTableAndQuery(self, field1: str, field2: str, orderBy: str = None):
+    def __getTableFilterQuery(
+        self,
+        fields: tuple,
+        anyFields: tuple,
+        columns: tuple = None,
+        orderBy: str = None,
+        desc: bool = False,
+        keyset: bool = False,
+        limit: bool = False,
+    ):
         """
-        Method to Get the Query to Select Some Table Rows based on Two Given Field-Value Pair to Compare at the Main Table
+        Method to Get the Query to Select Some Table Rows based on N Given Field-Value Pairs to Compare at the Main Table
 
-        :param str field1: First Table Field Name to be Compared
-        :param str field2: Second Table Field Name to be Compared
+        :param tuple fields: Table Fields Name to be Compared
+        :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values or a Single Value
+        :param tuple columns: Table Fields Name to Select. Default is ``None``, which Selects All of Them
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
+        :param bool keyset: Specifies whether to Add a Keyset Pagination Condition over ``orderBy``. Default is ``False``
+        :param bool limit: Specifies whether to Add a LIMIT Clause. Default is ``False``
         :return: SQL Query
         :rtype: Composed
         """
 
-        # Check if there's Some Sorting to be Applied
-        if orderBy == None:
-            return sql.SQL(
-                "SELECT * FROM {schemeName}.{tableName} AS child INNER JOIN {schemeName}.{parentTableName} AS parent ON child.{tablePKFKName} = parent.{parentTablePKName} WHERE {field1} = (%s) AND {field2} = (%s)"
-            ).format(
-                schemeName=sql.Identifier(self._schemeName),
-                tableName=sql.Identifier(self._tableName),
-                parentTableName=sql.Identifier(self._parentTableName),
-                tablePKFKName=sql.Identifier(self._tablePKFKName),
-                parentTablePKName=sql.Identifier(self._parentTablePKName),
-                field1=sql.Identifier(field1),
-                field2=sql.Identifier(field2),
-            )
-
         return sql.SQL(
-            "SELECT * FROM {schemeName}.{tableName} AS child INNER JOIN {schemeName}.{parentTableName} AS parent ON child.{tablePKFKName} = parent.{parentTablePKName} WHERE {field1} = (%s) AND {field2} = (%s) ORDER BY {orderBy}"
+            "SELECT {columns} FROM {schemeName}.{tableName} AS child INNER JOIN {schemeName}.{parentTableName} AS parent ON child.{tablePKFKName} = parent.{parentTablePKName}{filter}"
         ).format(
+            columns=getColumnsQuery(columns),
             schemeName=sql.Identifier(self._schemeName),
             tableName=sql.Identifier(self._tableName),
             parentTableName=sql.Identifier(self._parentTableName),
             tablePKFKName=sql.Identifier(self._tablePKFKName),
             parentTablePKName=sql.Identifier(self._parentTablePKName),
-            field1=sql.Identifier(field1),
-            field2=sql.Identifier(field2),
-            orderBy=sql.Identifier(orderBy),
+            filter=getFilterQuery(fields, anyFields, orderBy, desc, keyset, limit),
         )
 
-    def __getParentTableAndQuery(self, field1: str, field2: str, orderBy: str = None):
+    def __getParentTableFilterQuery(
+        self,
+        fields: tuple,
+        anyFields: tuple,
+        columns: tuple = None,
+        orderBy: str = None,
+        desc: bool = False,
+        keyset: bool = False,
+        limit: bool = False,
+    ):
         """
-        Method to Get the Query to Select Some Table Rows based on Two Given Field-Value Pair to Compare at the Parent Table
+        Method to Get the Query to Select Some Table Rows based on N Given Field-Value Pairs to Compare at the Parent Table
 
-        :param str field1: First Parent Table Field Name to be Compared
-        :param str field2: Second Parent Table Field Name to be Compared
+        :param tuple fields: Parent Table Fields Name to be Compared
+        :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values or a Single Value
+        :param tuple columns: Parent Table Fields Name to Select. Default is ``None``, which Selects All of Them
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
+        :param bool keyset: Specifies whether to Add a Keyset Pagination Condition over ``orderBy``. Default is ``False``
+        :param bool limit: Specifies whether to Add a LIMIT Clause. Default is ``False``
         :return: SQL Query
         :rtype: Composed
         """
 
-        # Check if there's Some Sorting to be Applied
-        if orderBy == None:
+        return sql.SQL(
+            "SELECT {columns} FROM {schemeName}.{parentTableName}{filter}"
+        ).format(
+            columns=getColumnsQuery(columns),
+            schemeName=sql.Identifier(self._schemeName),
+            parentTableName=sql.Identifier(self._parentTableName),
+            filter=getFilterQuery(fields, anyFields, orderBy, desc, keyset, limit),
+        )
+
+    def __existsQuery(self, parentTable: bool, fields: tuple, anyFields: tuple):
+        """
+        Method to Get the Query to Check whether there's at least One Row based on N Given Field-Value Pairs to Compare at the Main or the Parent Table
+
+        :param bool parentTable: ``False`` if the User wants to Compare the Specialization Table. Otherwise,``True``
+        :param tuple fields: Table Fields Name to be Compared
+        :param tuple anyFields: Specifies for each Field whether It's Compared against a List of Values or a Single Value
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        # Check if the User wants to Compare the Specialization's Parent Table
+        if parentTable:
             return sql.SQL(
-                "SELECT * FROM {schemeName}.{parentTableName} WHERE {field1} = (%s) AND {field2} = (%s)"
+                "SELECT 1 FROM {schemeName}.{parentTableName}{filter} LIMIT 1"
             ).format(
                 schemeName=sql.Identifier(self._schemeName),
                 parentTableName=sql.Identifier(self._parentTableName),
-                field1=sql.Identifier(field1),
-                field2=sql.Identifier(field2),
+                filter=getFilterQuery(fields, anyFields),
             )
 
         return sql.SQL(
-            "SELECT * FROM {schemeName}.{parentTableName} WHERE {field1} = (%s) AND {field2} = (%s) ORDER BY {orderBy}"
+            "SELECT 1 FROM {schemeName}.{tableName} AS child INNER JOIN {schemeName}.{parentTableName} AS parent ON child.{tablePKFKName} = parent.{parentTablePKName}{filter} LIMIT 1"
         ).format(
             schemeName=sql.Identifier(self._schemeName),
+            tableName=sql.Identifier(self._tableName),
             parentTableName=sql.Identifier(self._parentTableName),
-            field1=sql.Identifier(field1),
-            field2=sql.Identifier(field2),
-            orderBy=sql.Identifier(orderBy),
+            tablePKFKName=sql.Identifier(self._tablePKFKName),
+            parentTablePKName=sql.Identifier(self._parentTablePKName),
+            filter=getFilterQuery(fields, anyFields),
         )
 
     def __orderByQuery(self, orderBy: str, desc: bool):
@@ -643,6 +999,68 @@ class SpecializationTable:
             compareField=sql.Identifier(compareField),
         )
 
+    def __insertQuery(self, parentTable: bool, fields: tuple):
+        """
+        Method to Get the Query to Insert a Row with the Given Fields at the Main or the Parent Table. Rows Inserted at the Parent Table Return its Primary Key
+
+        :param bool parentTable: ``False`` if the Row is Inserted at the Specialization Table. Otherwise,``True``
+        :param tuple fields: Table Fields Name to Insert
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        columns = sql.SQL(", ").join(sql.Identifier(field) for field in fields)
+        values = sql.SQL(", ").join(sql.Placeholder() * len(fields))
+
+        # Check if the Row is Inserted at the Specialization's Parent Table
+        if parentTable:
+            return sql.SQL(
+                "INSERT INTO {schemeName}.{parentTableName} ({fields}) VALUES ({values}) RETURNING {parentTablePKName}"
+            ).format(
+                schemeName=sql.Identifier(self._schemeName),
+                parentTableName=sql.Identifier(self._parentTableName),
+                fields=columns,
+                values=values,
+                parentTablePKName=sql.Identifier(self._parentTablePKName),
+            )
+
+        return sql.SQL(
+            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES ({values})"
+        ).format(
+            schemeName=sql.Identifier(self._schemeName),
+            tableName=sql.Identifier(self._tableName),
+            fields=columns,
+            values=values,
+        )
+
+    def __insertWithParentQuery(self, parentFields: tuple, fields: tuple):
+        """
+        Method to Get the Query to Insert a Row at the Parent Table and its Specialization Row in a Single Statement. Nothing is Inserted if the Parent Row Violates a Unique Constraint
+
+        :param tuple parentFields: Parent Table Fields Name to Insert
+        :param tuple fields: Specialization Table Fields Name to Insert, Apart from its Primary Key
+        :return: SQL Query
+        :rtype: Composed
+        """
+
+        return sql.SQL(
+            "WITH parent AS (INSERT INTO {schemeName}.{parentTableName} ({parentFields}) VALUES ({parentValues}) ON CONFLICT DO NOTHING RETURNING {parentTablePKName}) INSERT INTO {schemeName}.{tableName} ({fields}) SELECT {parentTablePKName}{values} FROM parent RETURNING {tablePKFKName}"
+        ).format(
+            schemeName=sql.Identifier(self._schemeName),
+            parentTableName=sql.Identifier(self._parentTableName),
+            parentFields=sql.SQL(", ").join(
+                sql.Identifier(field) for field in parentFields
+            ),
+            parentValues=sql.SQL(", ").join(sql.Placeholder() * len(parentFields)),
+            parentTablePKName=sql.Identifier(self._parentTablePKName),
+            tableName=sql.Identifier(self._tableName),
+            fields=sql.SQL(", ").join(
+                sql.Identifier(field) for field in (self._tablePKFKName, *fields)
+            ),
+            values=sql.SQL("").join(sql.SQL(", ") + sql.Placeholder() for _ in fields),
+            tablePKFKName=sql.Identifier(self._tablePKFKName),
+        )
+
     def __removeQuery(self, tableName: str, field: str):
         """
         Method to Get the Query to Remove a Row with a Given Value at a Given Field and Table
@@ -655,7 +1073,11 @@ class SpecializationTable:
 
         return sql.SQL(
             "DELETE FROM {schemeName}.{tableName} WHERE {field} = (%s)"
-        ).format(tableName=tableName, field=sql.Identifier(field))
+        ).format(
+            schemeName=sql.Identifier(self._schemeName),
+            tableName=sql.Identifier(tableName),
+            field=sql.Identifier(field),
+        )
 
     async def __modify(
         self, acursor, parentTable: bool, idValue: int, field: str, value
@@ -686,10 +1108,10 @@ class SpecializationTable:
             tableName = self._tableName
 
         # Get Query to Modify the Given Row
-        query = self.__modifyQuery(tableName, idField, field)
+        query = self.__getCachedQuery(self.__modifyQuery, tableName, idField, field)
 
         # Execute the Query and Print a Success Message
-        await asyncio.gather(acursor.execute(query, [value, idValue]))
+        await acursor.execute(query, [value, idValue], prepare=PREPARE_QUERIES)
         modifiedRow(field, value, idField, idValue, tableName)
 
     async def _modifyTable(self, acursor, idValue: int, field: str, value) -> None:
@@ -705,7 +1127,7 @@ class SpecializationTable:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__modify(acursor, False, idValue, field, value))
+        await self.__modify(acursor, False, idValue, field, value)
 
     async def _modifyParentTable(
         self, acursor, idValue: int, field: str, value
@@ -722,7 +1144,7 @@ class SpecializationTable:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__modify(acursor, True, idValue, field, value))
+        await self.__modify(acursor, True, idValue, field, value)
 
     async def __get(
         self, acursor, parentTable: bool, field: str, value, orderBy: str = None
@@ -742,17 +1164,17 @@ class SpecializationTable:
 
         # Check if the User wants to Get the Row from the Parent Table and Execute the Query
         if parentTable:
-            getParentQuery = self.__getParentTableQuery(field, orderBy)
-            await asyncio.gather(acursor.execute(getParentQuery, [value]))
+            getParentQuery = self.__getCachedQuery(
+                self.__getParentTableQuery, field, orderBy
+            )
+            await acursor.execute(getParentQuery, [value], prepare=PREPARE_QUERIES)
 
         else:
-            getSpecQuery = self.__getTableQuery(field, orderBy)
-            await asyncio.gather(acursor.execute(getSpecQuery, [value]))
+            getSpecQuery = self.__getCachedQuery(self.__getTableQuery, field, orderBy)
+            await acursor.execute(getSpecQuery, [value], prepare=PREPARE_QUERIES)
 
         # Fetch the Items
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        self._items = await acursor.fetchall()
 
     async def _getTable(self, acursor, field: str, value, orderBy: str = None) -> None:
         """
@@ -767,7 +1189,7 @@ class SpecializationTable:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__get(acursor, False, field, value, orderBy))
+        await self.__get(acursor, False, field, value, orderBy)
 
     async def _getParentTable(self, acursor, field: str, value, orderBy=None) -> None:
         """
@@ -782,7 +1204,7 @@ class SpecializationTable:
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__get(True, field, value))
+        await self.__get(acursor, True, field, value, orderBy)
 
     async def __getMult(
         self,
@@ -791,74 +1213,73 @@ class SpecializationTable:
         fields: list[str],
         values: list,
         orderBy: str = None,
+        columns: list[str] = None,
+        limit: int = None,
+        after=None,
+        desc: bool = False,
     ) -> None:
         """
-        Asynchronous Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs
+        Asynchronous Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs. Values Given as Lists are Compared with ``IN`` Semantics
 
         :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
         :param bool parentTable: ``False`` if the User wants to Compare the Specialization Table. Otherwise,``True``
         :param list fields: Fields to be Compared
         :param list values: Values to be Compared
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
+        :param after: Last ``orderBy`` Value of the Previous Page, for Keyset Pagination. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
         :return: Nothing
         :rtype: NoneType
         :raises LenError: Raised if ``fields`` and ``values`` have Different Lists Length
+        :raises ValueError: Raised if ``after`` is Given without ``orderBy``
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         # Lists MUST have the Same Length
-        length = len(fields)
-
-        if length != len(values):
+        if len(fields) != len(values):
             raise LenError()
 
-        # Check the Number of WHERE Conditions
-        if length > 2:
-            console.print("Query hasn't been Implemented", style="warning")
-            return
+        # Keyset Pagination MUST be Sorted
+        if after != None and orderBy == None:
+            raise ValueError("Keyset Pagination Requires a Field to Sort the Rows")
 
         # Check if the User wants to Compare the Specialization's Parent Table
-        if parentTable:
-            # Get Query for Specialization's Parent Table with Two Conditions and Execute it
-            if length == 2:
-                twoCondQuery = self.__getParentTableAndQuery(
-                    fields[0], fields[1], orderBy
-                )
-                await asyncio.gather(
-                    acursor.execute(twoCondQuery, [values[0], values[1]])
-                )
-
-            # Query for One Condition. Method Implemented
-            elif length == 1:
-                getTask = asyncio.create_task(
-                    self._getParentTable(acursor, fields[0], values[0], orderBy)
-                )
-                await asyncio.gather(getTask)
-                return getTask.result()
+        getQuery = (
+            self.__getParentTableFilterQuery
+            if parentTable
+            else self.__getTableFilterQuery
+        )
 
-        else:
-            # Get Query for Specialization Table with Two Conditions and Execute it
-            if length == 2:
-                twoCondQuery = self.__getTableAndQuery(fields[0], fields[1], orderBy)
-                await asyncio.gather(
-                    acursor.execute(twoCondQuery, [values[0], values[1]])
-                )
-
-            # Query for One Condition. Method Implemented
-            elif length == 1:
-                getTask = asyncio.create_task(
-                    self._getTable(acursor, fields[0], values[0], orderBy)
-                )
-                await asyncio.gather(getTask)
-                return getTask.result
+        # Get Query for N Conditions
+        query = self.__getCachedQuery(
+            getQuery,
+            tuple(fields),
+            getAnyFields(values),
+            None if columns == None else tuple(columns),
+            orderBy,
+            desc,
+            after != None,
+            limit != None,
+        )
 
-        # Fetch the Items
-        fetchTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(fetchTask)
-        self._items = fetchTask.result()
+        # Execute the Query and Fetch the Items
+        await acursor.execute(
+            query, getFilterParams(values, after, limit), prepare=PREPARE_QUERIES
+        )
+        self._items = await acursor.fetchall()
 
     async def _getMultTable(
-        self, acursor, fields: list[str], values: list, orderBy: str = None
+        self,
+        acursor,
+        fields: list[str],
+        values: list,
+        orderBy: str = None,
+        columns: list[str] = None,
+        limit: int = None,
+        after=None,
+        desc: bool = False,
     ) -> None:
         """
         Asynchronous Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs at the Specialization Table
@@ -867,15 +1288,29 @@ class SpecializationTable:
         :param list fields: Fields to be Compared
         :param list values: Values to be Compared
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
+        :param after: Last ``orderBy`` Value of the Previous Page, for Keyset Pagination. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
         :return: Nothing
         :rtype: NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__getMult(acursor, False, fields, values, orderBy))
+        await self.__getMult(
+            acursor, False, fields, values, orderBy, columns, limit, after, desc
+        )
 
     async def _getMultParentTable(
-        self, acursor, fields: list[str], values: list, orderBy: str = None
+        self,
+        acursor,
+        fields: list[str],
+        values: list,
+        orderBy: str = None,
+        columns: list[str] = None,
+        limit: int = None,
+        after=None,
+        desc: bool = False,
     ) -> None:
         """
         Asynchronous Method to Check whether the Table Contains at least One Row with Some Given Field-Value Pairs at the Specialization's Parent Table
@@ -884,12 +1319,117 @@ class SpecializationTable:
         :param list fields: Fields to be Compared
         :param list values: Values to be Compared
         :param str orderBy: Table Field that will be Used to Sort it. Default is ``None``
+        :param list columns: Table Fields to Select. Default is ``None``, which Selects All of Them
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
+        :param after: Last ``orderBy`` Value of the Previous Page, for Keyset Pagination. Default is ``None``
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order. Default is ``False``
         :return: Nothing
         :rtype: NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(self.__getMult(acursor, True, fields, values, orderBy))
+        await self.__getMult(
+            acursor, True, fields, values, orderBy, columns, limit, after, desc
+        )
+
+    async def _iterAll(
+        self,
+        aconn,
+        orderBy: str,
+        desc: bool,
+        pageSize: int = ALL_PAGE_SIZE,
+        rowFactory=None,
+    ):
+        """
+        Asynchronous Generator Method to Stream the Table Rows Sorted in Asceding/Descending Order for a Given Field, in Pages. The Rows are Fetched through a Server-side Cursor, so only One Page is Kept in Memory at a Time
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param str orderBy: Table Field to Sort
+        :param bool desc: Specifies whether to Sort the Rows in Ascending or Descending Order
+        :param int pageSize: Maximum Number of Rows per Page. Default is ``ALL_PAGE_SIZE``
+        :param rowFactory: ``psycopg`` Row Factory Used to Initialize the Fetched Rows. Default is ``None``, which Fetches Tuples
+        :return: Asynchronous Iterator of Lists of Fetched Rows
+        :rtype: AsyncIterator
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Get Query To Sort the Table Rows
+        query = self.__getCachedQuery(self.__orderByQuery, orderBy, desc)
+
+        # Open a Server-side Cursor inside the Current Transaction
+        async with aconn.cursor(
+            name=f"{self._tableName}_all", row_factory=rowFactory
+        ) as acursor:
+            acursor.itersize = pageSize
+            await acursor.execute(query)
+
+            # Fetch the Rows Page by Page
+            while True:
+                items = await acursor.fetchmany(pageSize)
+
+                if len(items) == 0:
+                    break
+
+                yield items
+
+    async def __exists(
+        self, acursor, parentTable: bool, fields: list[str], values: list
+    ) -> bool:
+        """
+        Asynchronous Method to Check whether the Main or the Parent Table Contains at least One Row with Some Given Field-Value Pairs, without Fetching It
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param bool parentTable: ``False`` if the User wants to Compare the Specialization Table. Otherwise,``True``
+        :param list fields: Fields to be Compared
+        :param list values: Values to be Compared
+        :return: ``True`` if there's at least One Row. Otherwise, ``False``
+        :rtype: bool
+        :raises LenError: Raised if ``fields`` and ``values`` have Different Lists Length
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Lists MUST have the Same Length
+        if len(fields) != len(values):
+            raise LenError()
+
+        query = self.__getCachedQuery(
+            self.__existsQuery, parentTable, tuple(fields), getAnyFields(values)
+        )
+
+        # Execute the Query and Fetch the First Row, if Any
+        await acursor.execute(query, getFilterParams(values), prepare=PREPARE_QUERIES)
+
+        return await acursor.fetchone() != None
+
+    async def _existsTable(self, acursor, fields: list[str], values: list) -> bool:
+        """
+        Asynchronous Method to Check whether the Specialization Table Contains at least One Row with Some Given Field-Value Pairs
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Fields to be Compared
+        :param list values: Values to be Compared
+        :return: ``True`` if there's at least One Row. Otherwise, ``False``
+        :rtype: bool
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        return await self.__exists(acursor, False, fields, values)
+
+    async def _existsParentTable(
+        self, acursor, fields: list[str], values: list
+    ) -> bool:
+        """
+        Asynchronous Method to Check whether the Specialization's Parent Table Contains at least One Row with Some Given Field-Value Pairs
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Fields to be Compared
+        :param list values: Values to be Compared
+        :return: ``True`` if there's at least One Row. Otherwise, ``False``
+        :rtype: bool
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        return await self.__exists(acursor, True, fields, values)
 
     async def _all(self, acursor, orderBy: str, desc: bool) -> None:
         """
@@ -904,13 +1444,104 @@ class SpecializationTable:
         """
 
         # Get Query to Sort Items from the Specialization Table
-        query = self.__orderByQuery(orderBy, desc)
+        query = self.__getCachedQuery(self.__orderByQuery, orderBy, desc)
 
         # Execute the Query and Fecth Items
-        await asyncio.gather(acursor.execute(query))
-        getTask = asyncio.create_task(acursor.fetchall())
-        await asyncio.gather(getTask)
-        self._items = getTask.result()
+        await acursor.execute(query, prepare=PREPARE_QUERIES)
+        self._items = await acursor.fetchall()
+
+    async def _addManyParentTable(
+        self, acursor, fields: list[str], rows: list
+    ) -> list[int]:
+        """
+        Asynchronous Method to Insert Several Rows at the Specialization's Parent Table with a Single Batched Statement
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Parent Table Fields Name to Insert
+        :param list rows: List of Tuples that Contain the Values of each Row, in the Same Order as ``fields``
+        :return: List of the Inserted Rows Primary Key, in the Same Order as ``rows``
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Nothing to Insert
+        if len(rows) == 0:
+            return []
+
+        query = self.__getCachedQuery(self.__insertQuery, True, tuple(fields))
+
+        # Execute the Query for All the Rows, Keeping the Result of each One
+        await acursor.executemany(query, rows, returning=True)
+
+        # Fetch the Primary Key from each Result Set
+        ids = []
+
+        while True:
+            ids.append((await acursor.fetchone())[0])
+
+            if not acursor.nextset():
+                break
+
+        return ids
+
+    async def _addManyTable(self, acursor, fields: list[str], rows: list) -> None:
+        """
+        Asynchronous Method to Insert Several Rows at the Specialization Table with a Single Batched Statement
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list fields: Table Fields Name to Insert
+        :param list rows: List of Tuples that Contain the Values of each Row, in the Same Order as ``fields``
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution
+        """
+
+        # Nothing to Insert
+        if len(rows) == 0:
+            return
+
+        query = self.__getCachedQuery(self.__insertQuery, False, tuple(fields))
+
+        await acursor.executemany(query, rows)
+
+    async def _addWithParentTable(
+        self,
+        acursor,
+        parentFields: list[str],
+        parentValues: list,
+        fields: list[str] = None,
+        values: list = None,
+    ) -> int | None:
+        """
+        Asynchronous Method to Insert a Row at the Parent Table and its Specialization Row in a Single Statement, so It Costs One Round Trip and can't be Half Inserted
+
+        :param acursor: Cursor from the Asynchronous Pool Connection with the Remote Database
+        :param list parentFields: Parent Table Fields Name to Insert
+        :param list parentValues: Parent Table Values to Insert
+        :param list fields: Specialization Table Fields Name to Insert, Apart from its Primary Key. Default is ``None``
+        :param list values: Specialization Table Values to Insert. Default is ``None``
+        :return: Primary Key of the Inserted Row. ``None`` if the Parent Row Violates a Unique Constraint
+        :rtype: int if It was Inserted. Otherwise, NoneType
+        :raises LenError: Raised if the Fields and Values Lists have Different Length
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        fields = [] if fields == None else fields
+        values = [] if values == None else values
+
+        # Lists MUST have the Same Length
+        if len(parentFields) != len(parentValues) or len(fields) != len(values):
+            raise LenError()
+
+        query = self.__getCachedQuery(
+            self.__insertWithParentQuery, tuple(parentFields), tuple(fields)
+        )
+
+        # Execute the Query and Fetch the Inserted Primary Key, if Any
+        await acursor.execute(query, [*parentValues, *values], prepare=PREPARE_QUERIES)
+        item = await acursor.fetchone()
+
+        return None if item == None else item[0]
 
     async def _remove(self, acursor, idValue: int) -> None:
         """
@@ -930,15 +1561,17 @@ class SpecializationTable:
         tableName = self._tableName
 
         # Get Query to Remove Row from the Specialization Table
-        tableQuery = self.__removeQuery(self._tableName, idField)
+        tableQuery = self.__getCachedQuery(self.__removeQuery, self._tableName, idField)
 
         # Get Query to Remove Row from the Specialization's Parent Table
-        parentTableQuery = self.__removeQuery(self._parentTableName, parentIdField)
+        parentTableQuery = self.__getCachedQuery(
+            self.__removeQuery, self._parentTableName, parentIdField
+        )
 
         # Remove Row from Specialization Table
-        await asyncio.gather(acursor.execute(tableQuery, [idValue]))
+        await acursor.execute(tableQuery, [idValue], prepare=PREPARE_QUERIES)
         removeRow(tableName, idField, idValue)
 
         # Remove Row from Specialization's Parent Table
-        await asyncio.gather(acursor.execute(parentTableQuery, [idValue]))
+        await acursor.execute(parentTableQuery, [idValue], prepare=PREPARE_QUERIES)
         removeRow(parentTableName, parentIdField, idValue)
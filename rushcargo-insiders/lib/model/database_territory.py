@@ -1,8 +1,5 @@
-import asyncio
-
 from psycopg import sql
 
-from rich.prompt import IntPrompt
 
 from .classes import Country, Region, City
 from .constants import *
@@ -16,6 +13,7 @@ from .database_tables import (
 )
 
 from ..terminal.clear import clear
+from ..terminal.prompt import askIntPrompt
 
 
 class CountriesTable(BaseTable):
@@ -31,23 +29,6 @@ class CountriesTable(BaseTable):
         # Initialize Base Table Class
         super().__init__(COUNTRIES_TABLE_NAME, COUNTRIES_ID, LOCATIONS_SCHEME_NAME)
 
-    def __getFetchedObjects(self) -> list[Country]:
-        """
-        Method to Get a List of Fetched Countries Objects from ``self_items``
-
-        :return: List of Fetched Countries Objects
-        :rtype: list
-        """
-
-        countriesList = []
-
-        for item in self._items:
-            # Intialize Country from the SQL Fetched Row
-            c = Country.fromFetchedItem(item)
-            countriesList.append(c)
-
-        return countriesList
-
     def __print(self, countriesList: list[Country]) -> None:
         """
         Method that Prints the Fetched Countries from its Remote Table
@@ -76,56 +57,115 @@ class CountriesTable(BaseTable):
 
     def __insertQuery(self):
         """
-        Method that Retuns a Query to Insert a New Country to its Remote Table
+        Method that Retuns a Query to Insert a New Country to its Remote Table. The Country ID is Returned whether It's Inserted or It was Already Inserted, Together with a Flag that Tells Them Apart
 
         :return: SQL Query to Insert a New Country
         :rtype: Composed
         """
 
         return sql.SQL(
-            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s)"
+            "WITH inserted AS (INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s) ON CONFLICT ({countryName}) DO NOTHING RETURNING {countryId}) SELECT {countryId}, TRUE FROM inserted UNION ALL SELECT {countryId}, FALSE FROM {schemeName}.{tableName} WHERE {countryName} = (%s)"
         ).format(
             schemeName=sql.Identifier(self._schemeName),
             tableName=sql.Identifier(self._tableName),
             fields=sql.SQL(",").join(
                 [sql.Identifier(COUNTRIES_NAME), sql.Identifier(COUNTRIES_PHONE_PREFIX)]
             ),
+            countryName=sql.Identifier(COUNTRIES_NAME),
+            countryId=sql.Identifier(COUNTRIES_ID),
         )
 
-    async def add(self, aconn, countryName: str) -> None:
+    async def add(self, aconn, countryName: str, checkExists: bool = True) -> int:
         """
         Asynchronous Method to Insert a New Country to the Country Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str countryName: Country Name to Insert
-        :returns: None
-        :rtype: NoneType
+        :param bool checkExists: Specifies whether to Check if the Country has already been Inserted before Asking for its Fields. Default is ``True``
+        :returns: Country ID of the Inserted Country, or of the One that was Already Inserted with the Same Name
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         # Check if the Country has already been Inserted
-        getTask = asyncio.create_task(
-            self.get(aconn, COUNTRIES_NAME, countryName, False)
-        )
-        await asyncio.gather(getTask)
-        country = getTask.result()
+        if checkExists:
+            countryId = await self.findId(aconn, COUNTRIES_NAME, countryName)
 
-        if country != None:
-            uniqueInserted(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countryName)
-            return
+            if countryId != None:
+                uniqueInserted(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countryName)
+                return countryId
 
         # Ask for the Country Fields
         console.print("Adding New Country...", style="caption")
-        phonePrefix = IntPrompt.ask("Enter Phone Prefix")
+        phonePrefix = await askIntPrompt("Enter Phone Prefix")
 
         # Get Query to Insert the New Country
         insertQuery = self.__insertQuery()
 
-        # Execute the Query and Print a Success Message
-        await asyncio.gather(
-            aconn.cursor().execute(insertQuery, [countryName, phonePrefix])
+        # Insert the Country and Get its ID in a Single Round Trip
+        acursor = aconn.cursor()
+        await acursor.execute(
+            insertQuery,
+            [countryName, phonePrefix, countryName],
+            prepare=PREPARE_QUERIES,
         )
-        insertedRow(countryName, self._tableName)
+        item = await acursor.fetchone()
+
+        # The Country was Inserted by a Concurrent Transaction that wasn't Visible Yet
+        if item == None:
+            uniqueInserted(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countryName)
+            return await self.findId(aconn, COUNTRIES_NAME, countryName)
+
+        countryId, inserted = item
+
+        # Print a Success Message, or a Warning if It was Inserted in the Meantime
+        if inserted:
+            insertedRow(countryName, self._tableName)
+
+        else:
+            uniqueInserted(COUNTRIES_TABLE_NAME, COUNTRIES_NAME, countryName)
+
+        return countryId
+
+    async def addMany(self, aconn, countries: list[tuple[str, int]]) -> None:
+        """
+        Asynchronous Method to Insert Several Countries to the Country Table in a Single Batch
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list countries: List of Tuples that Contain the Country Name and its Phone Prefix
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution
+        """
+
+        await BaseTable._addMany(
+            self, aconn.cursor(), [COUNTRIES_NAME, COUNTRIES_PHONE_PREFIX], countries
+        )
+
+    async def getIdsDict(self, aconn, countryNames: list[str]) -> dict:
+        """
+        Asynchronous Method to Get the IDs of Several Countries by its Names in a Single Query
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list countryNames: Country Names to Search for
+        :return: Dictionary that Maps each Found Country Name to its ID
+        :rtype: dict
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Nothing to Search for
+        if len(countryNames) == 0:
+            return {}
+
+        await BaseTable._getMult(
+            self,
+            aconn.cursor(),
+            [COUNTRIES_NAME],
+            [countryNames],
+            columns=[COUNTRIES_NAME, COUNTRIES_ID],
+        )
+
+        return dict(self._items)
 
     async def get(
         self,
@@ -146,19 +186,21 @@ class CountriesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Countries
-        queryTask = asyncio.gather(
-            BaseTable._get(self, aconn.cursor(), field, value, COUNTRIES_NAME)
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Countries
+        await BaseTable._get(
+            self,
+            aconn.cursor(row_factory=Country.rowFactory),
+            field,
+            value,
+            COUNTRIES_NAME,
+        )
 
-        # Get the Countries Objects from the Fetched Countries
-        countriesList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Countries Objects
+        countriesList = self._items
 
         # Print Filtered Countries
         if printItems:
@@ -179,9 +221,7 @@ class CountriesTable(BaseTable):
         """
 
         # Get Country from its Remote Table
-        getTask = asyncio.create_task(self.get(aconn, field, value, False))
-        await asyncio.gather(getTask)
-        country = getTask.result()
+        country = await self.get(aconn, field, value, False)
 
         # Get Country Object from the Fetched Item
         if country == None:
@@ -189,33 +229,80 @@ class CountriesTable(BaseTable):
 
         return country[0]
 
-    async def all(self, aconn, orderBy: str, desc: bool) -> list[Country] | None:
+    async def findId(self, aconn, field: str, value) -> int | None:
+        """
+        Asynchronous Method to Find a Country ID at its Remote Table based on its Unique Fields, without Fetching the Rest of its Columns
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param str field: Country Field that will be Used to Compare in the Country Table
+        :param value: Unique Value to Compare
+        :return: Country ID if Found. Otherwise, ``None``
+        :rtype: int if Found. Otherwise, NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        return await BaseTable._getId(self, aconn.cursor(), [field], [value])
+
+    async def fetchAll(self, aconn) -> list[Country]:
+        """
+        Asynchronous Method to Fetch All the Countries Stored at its Remote Table, Sorted by its Name, without Printing Them
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :return: List of Fetched Countries Objects
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        await BaseTable._all(
+            self, aconn.cursor(row_factory=Country.rowFactory), COUNTRIES_NAME, False
+        )
+
+        return self._items
+
+    def printItems(self, countriesList: list[Country]) -> None:
+        """
+        Method that Prints the Given Countries Objects, Previously Fetched from its Remote Table
+
+        :param list countriesList: Countries Objects to Print
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        # Clear Terminal
+        clear()
+
+        self.__print(countriesList)
+
+    async def all(self, aconn, orderBy: str, desc: bool) -> int:
         """
         Asynchronous Method that Prints All the Countries Stored at its Remote Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str orderBy: Country Field that will be Used to Sort the Country Table
         :param bool desc: Specificies whether to Sort in Ascending Order (``False``) or in Descending Order (``True``)
-        :return: List of Fetched Countries Objects if the Table isn't Empty. Otherwise, ``None``
-        :rtype: list if the Table isn't Empty. Otherwise, NoneType
+        :return: Number of Printed Countries
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch All Countries
-        queryTask = asyncio.gather(BaseTable._all(self, aconn.cursor(), orderBy, desc))
-
         # Clear Terminal
         clear()
 
-        await queryTask
+        nRows = 0
 
-        # Get the Countries Objects from the Fetched Countries
-        countriesList = self.__getFetchedObjects()
+        # Fetch and Print All Countries, Page by Page
+        async for countriesList in BaseTable._iterAll(
+            self, aconn, orderBy, desc, rowFactory=Country.rowFactory
+        ):
+            # Print the Current Page
+            self.__print(countriesList)
+            nRows += len(countriesList)
 
-        # Print All Countries
-        self.__print(countriesList)
+        # Print Empty Table
+        if nRows == 0:
+            self.__print([])
 
-        return None if len(countriesList) == 0 else countriesList
+        return nRows
 
     async def modify(self, aconn, countryId: int, field: str, value) -> None:
         """
@@ -230,9 +317,7 @@ class CountriesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(
-            BaseTable._modify(self, aconn.cursor(), countryId, field, value)
-        )
+        await BaseTable._modify(self, aconn.cursor(), countryId, field, value)
 
     async def remove(self, aconn, countryId: int) -> None:
         """
@@ -245,7 +330,7 @@ class CountriesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(BaseTable._remove(self, aconn.cursor(), countryId))
+        await BaseTable._remove(self, aconn.cursor(), countryId)
 
 
 class RegionsTable(BaseTable):
@@ -261,23 +346,6 @@ class RegionsTable(BaseTable):
         # Initialize Base Table Class
         super().__init__(REGIONS_TABLE_NAME, REGIONS_ID, LOCATIONS_SCHEME_NAME)
 
-    def __getFetchedObjects(self) -> list[Region]:
-        """
-        Method to Get a List of Fetched Regions Objects from ``self_items``
-
-        :return: List of Fetched Regions Objects
-        :rtype: list
-        """
-
-        regionsList = []
-
-        for item in self._items:
-            # Intialize Region from the SQL Fetched Row
-            r = Region.fromFetchedItem(item)
-            regionsList.append(r)
-
-        return regionsList
-
     def __print(self, regionsList: list[Region]) -> None:
         """
         Method that Prints the Fetched Regions from its Remote Table
@@ -318,57 +386,112 @@ class RegionsTable(BaseTable):
 
     def __insertQuery(self):
         """
-        Method that Retuns a Query to Insert a New Region to its Remote Table
+        Method that Retuns a Query to Insert a New Region to its Remote Table. The Region ID is Returned whether It's Inserted or It was Already Inserted, Together with a Flag that Tells Them Apart
 
         :return: SQL Query to Insert a New Region
         :rtype: Composed
         """
 
         return sql.SQL(
-            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s)"
+            "WITH inserted AS (INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s) ON CONFLICT ({parentId}, {regionName}) DO NOTHING RETURNING {regionId}) SELECT {regionId}, TRUE FROM inserted UNION ALL SELECT {regionId}, FALSE FROM {schemeName}.{tableName} WHERE {parentId} = (%s) AND {regionName} = (%s)"
         ).format(
             schemeName=sql.Identifier(self._schemeName),
             tableName=sql.Identifier(self._tableName),
             fields=sql.SQL(",").join(
                 [sql.Identifier(REGIONS_FK_COUNTRY), sql.Identifier(REGIONS_NAME)]
             ),
+            parentId=sql.Identifier(REGIONS_FK_COUNTRY),
+            regionName=sql.Identifier(REGIONS_NAME),
+            regionId=sql.Identifier(REGIONS_ID),
         )
 
-    async def add(self, aconn, countryId: int, regionName: str) -> None:
+    async def add(self, aconn, countryId: int, regionName: str) -> int:
         """
         Asynchronous Method to Insert a New Region to the Region Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param int countryId: Country ID at its Remote Table where the Region is Located
         :param str regionName: Region Name to Insert
-        :returns: None
-        :rtype: NoneType
+        :returns: Region ID of the Inserted Region, or of the One that was Already Inserted with the Same Name at the Given Country
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         regionFields = [REGIONS_FK_COUNTRY, REGIONS_NAME]
         regionValues = [countryId, regionName]
 
-        # Check if the Region Name has already been Inserted for the Given Country
-        getMultTask = asyncio.create_task(
-            self.getMult(aconn, regionFields, regionValues, False)
+        # Get Query to Insert the New Region
+        insertQuery = self.__insertQuery()
+
+        # Insert the Region and Get its ID in a Single Round Trip
+        acursor = aconn.cursor()
+        await acursor.execute(
+            insertQuery,
+            [countryId, regionName, countryId, regionName],
+            prepare=PREPARE_QUERIES,
         )
-        await asyncio.gather(getMultTask)
-        region = getMultTask.result()
+        item = await acursor.fetchone()
 
-        if region != None:
+        # The Region was Inserted by a Concurrent Transaction that wasn't Visible Yet
+        if item == None:
             uniqueInsertedMult(REGIONS_TABLE_NAME, regionFields, regionValues)
-            return
+            return await self.findMultId(aconn, countryId, regionName)
 
-        # Ask for the Region Fields
-        console.print("Adding New Region...", style="caption")
+        regionId, inserted = item
 
-        # Get Query to Insert the New Region
-        query = self.__insertQuery()
+        # Print a Success Message, or a Warning if It was Already Inserted
+        if inserted:
+            insertedRow(regionName, self._tableName)
+
+        else:
+            uniqueInsertedMult(REGIONS_TABLE_NAME, regionFields, regionValues)
 
-        # Execute the Query and Print a Success Message
-        await asyncio.gather(aconn.cursor().execute(query, [countryId, regionName]))
-        insertedRow(regionName, self._tableName)
+        return regionId
+
+    async def addMany(self, aconn, regions: list[tuple[int, str]]) -> None:
+        """
+        Asynchronous Method to Insert Several Regions to the Region Table in a Single Batch
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list regions: List of Tuples that Contain the Country ID where the Region is Located and the Region Name
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution
+        """
+
+        await BaseTable._addMany(
+            self, aconn.cursor(), [REGIONS_FK_COUNTRY, REGIONS_NAME], regions
+        )
+
+    async def getIdsDict(self, aconn, regions: list[tuple[int, str]]) -> dict:
+        """
+        Asynchronous Method to Get the IDs of Several Regions by its Country ID and Name in a Single Query
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list regions: List of Tuples that Contain the Country ID where the Region is Located and the Region Name
+        :return: Dictionary that Maps each Found (Country ID, Region Name) Tuple to its Region ID
+        :rtype: dict
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Nothing to Search for
+        if len(regions) == 0:
+            return {}
+
+        countryIds = list({countryId for countryId, _ in regions})
+        names = list({name for _, name in regions})
+
+        await BaseTable._getMult(
+            self,
+            aconn.cursor(),
+            [REGIONS_FK_COUNTRY, REGIONS_NAME],
+            [countryIds, names],
+            columns=[REGIONS_FK_COUNTRY, REGIONS_NAME, REGIONS_ID],
+        )
+
+        return {
+            (countryId, name): regionId for countryId, name, regionId in self._items
+        }
 
     async def get(
         self, aconn, field: str, value, printItems: bool = True
@@ -385,19 +508,21 @@ class RegionsTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Regions
-        queryTask = asyncio.gather(
-            BaseTable._get(self, aconn.cursor(), field, value, REGIONS_NAME)
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Regions
+        await BaseTable._get(
+            self,
+            aconn.cursor(row_factory=Region.rowFactory),
+            field,
+            value,
+            REGIONS_NAME,
+        )
 
-        # Get the Regions Objects from the Fetched Regions
-        regionsList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Regions Objects
+        regionsList = self._items
 
         # Print Filtered Regions
         if printItems:
@@ -406,7 +531,12 @@ class RegionsTable(BaseTable):
         return None if len(regionsList) == 0 else regionsList
 
     async def getMult(
-        self, aconn, fields: list[str], values: list, printItems: bool = True
+        self,
+        aconn,
+        fields: list[str],
+        values: list,
+        printItems: bool = True,
+        limit: int = None,
     ) -> list[Region] | None:
         """
         Asynchronous Method to Filter Regions from its Remote Table based on Some Given Field-Value Pair
@@ -415,24 +545,28 @@ class RegionsTable(BaseTable):
         :param list fields: Region Fields that will be Used to Compare in the Region Table
         :param list values: Values to Compare
         :param bool printItems: Specifies whether to Print or not the Fetched Items. Default is ``True``
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
         :return: List of Fetched Regions Objects if there's at Least One Coincidence. Otherwise, ``None``
         :rtype: list if there's at Least One Coincidence. Otherwise, NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Regions
-        queryTask = asyncio.gather(
-            BaseTable._getMult(self, aconn.cursor(), fields, values, REGIONS_NAME)
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Regions
+        await BaseTable._getMult(
+            self,
+            aconn.cursor(row_factory=Region.rowFactory),
+            fields,
+            values,
+            REGIONS_NAME,
+            limit=limit,
+        )
 
-        # Get the Regions Objects from the Fetched Regions
-        regionsList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Regions Objects
+        regionsList = self._items
 
         # Print Filtered Regions
         if printItems:
@@ -453,16 +587,13 @@ class RegionsTable(BaseTable):
         """
 
         # Get Region from its Remote Table
-        getMultTask = asyncio.create_task(
-            self.getMult(
-                aconn,
-                [REGIONS_FK_COUNTRY, REGIONS_NAME],
-                [countryId, regionName],
-                False,
-            )
+        region = await self.getMult(
+            aconn,
+            [REGIONS_FK_COUNTRY, REGIONS_NAME],
+            [countryId, regionName],
+            False,
+            1,
         )
-        await asyncio.gather(getMultTask)
-        region = getMultTask.result()
 
         # Get Region Object from the Fetched Item
         if region == None:
@@ -470,6 +601,25 @@ class RegionsTable(BaseTable):
 
         return region[0]
 
+    async def findMultId(self, aconn, countryId: int, regionName: str) -> int | None:
+        """
+        Asynchronous Method to Find a Region ID at its Remote Table based on its Name and the Country ID where it's Located, without Fetching the Rest of its Columns
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param int countryId: Country ID where the Region is Located
+        :param str regionName: Region Name to Search for
+        :return: Region ID if Found. Otherwise, ``None``
+        :rtype: int if Found. Otherwise, NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        return await BaseTable._getId(
+            self,
+            aconn.cursor(),
+            [REGIONS_FK_COUNTRY, REGIONS_NAME],
+            [countryId, regionName],
+        )
+
     async def find(self, aconn, regionId: int) -> Region | None:
         """
         Asynchronous Method to Find a Region at its Remote Table based on its ID
@@ -482,11 +632,7 @@ class RegionsTable(BaseTable):
         """
 
         # Get Region from its Remote Table
-        getTask = asyncio.create_task(
-            self.get(aconn, self._tablePKName, regionId, False)
-        )
-        await asyncio.gather(getTask)
-        region = getTask.result()
+        region = await self.get(aconn, self._tablePKName, regionId, False)
 
         # Get Region Object from the Fetched Item
         if region == None:
@@ -494,33 +640,66 @@ class RegionsTable(BaseTable):
 
         return region[0]
 
-    async def all(self, aconn, orderBy: str, desc: bool) -> list[Region] | None:
+    async def fetchAll(self, aconn) -> list[Region]:
+        """
+        Asynchronous Method to Fetch All the Regions Stored at its Remote Table, Sorted by its Name, without Printing Them
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :return: List of Fetched Regions Objects
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        await BaseTable._all(
+            self, aconn.cursor(row_factory=Region.rowFactory), REGIONS_NAME, False
+        )
+
+        return self._items
+
+    def printItems(self, regionsList: list[Region]) -> None:
+        """
+        Method that Prints the Given Regions Objects, Previously Fetched from its Remote Table
+
+        :param list regionsList: Regions Objects to Print
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        # Clear Terminal
+        clear()
+
+        self.__print(regionsList)
+
+    async def all(self, aconn, orderBy: str, desc: bool) -> int:
         """
         Method that Prints All the Regions Stored at its Remote Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str orderBy: Region Field that will be Used to Sort the Region Table
         :param bool desc: Specifies whether to Sort in Ascending Order (``False``) or in Descending Order (``True``)
-        :return: List of Fetched Regions Objects if the Table isn't Empty. Otherwise, ``None``
-        :rtype: list if the Table isn't Empty. Otherwise, NoneType
+        :return: Number of Printed Regions
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch All Regions
-        queryTask = asyncio.gather(BaseTable._all(self, aconn.cursor(), orderBy, desc))
-
         # Clear Terminal
         clear()
 
-        await queryTask
+        nRows = 0
 
-        # Get the Regions Objects from the Fetched Regions
-        regionsList = self.__getFetchedObjects()
+        # Fetch and Print All Regions, Page by Page
+        async for regionsList in BaseTable._iterAll(
+            self, aconn, orderBy, desc, rowFactory=Region.rowFactory
+        ):
+            # Print the Current Page
+            self.__print(regionsList)
+            nRows += len(regionsList)
 
-        # Print All Regions
-        self.__print(regionsList)
+        # Print Empty Table
+        if nRows == 0:
+            self.__print([])
 
-        return None if len(regionsList) == 0 else regionsList
+        return nRows
 
     async def modify(self, aconn, regionId: int, field: str, value) -> None:
         """
@@ -535,9 +714,7 @@ class RegionsTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(
-            BaseTable._modify(self, aconn.cursor(), regionId, field, value)
-        )
+        await BaseTable._modify(self, aconn.cursor(), regionId, field, value)
 
     async def remove(self, aconn, regionId: int) -> None:
         """
@@ -550,7 +727,7 @@ class RegionsTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(BaseTable._remove(self, aconn.cursor(), regionId))
+        await BaseTable._remove(self, aconn.cursor(), regionId)
 
 
 class CitiesTable(BaseTable):
@@ -566,23 +743,6 @@ class CitiesTable(BaseTable):
         # Initialize Base Table Class
         super().__init__(CITIES_TABLE_NAME, CITIES_ID, LOCATIONS_SCHEME_NAME)
 
-    def __getFetchedObjects(self) -> list[City]:
-        """
-        Method to Get a List of Fetched Cities Objects from ``self_items``
-
-        :return: List of Fetched Cities Objects
-        :rtype: list
-        """
-
-        citiesList = []
-
-        for item in self._items:
-            # Intialize City from the SQL Fetched Row
-            c = City.fromFetchedItem(item)
-            citiesList.append(c)
-
-        return citiesList
-
     def __print(self, citiesList: list[City]) -> None:
         """
         Method that Prints the Fetched Cities from its Remote Table
@@ -612,57 +772,110 @@ class CitiesTable(BaseTable):
 
     def __insertQuery(self):
         """
-        Method that Retuns a Query to Insert a New City to its Remote Table
+        Method that Retuns a Query to Insert a New City to its Remote Table. The City ID is Returned whether It's Inserted or It was Already Inserted, Together with a Flag that Tells Them Apart
 
         :return: SQL Query to Insert a New City
         :rtype: Composed
         """
 
         return sql.SQL(
-            "INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s)"
+            "WITH inserted AS (INSERT INTO {schemeName}.{tableName} ({fields}) VALUES (%s, %s) ON CONFLICT ({parentId}, {cityName}) DO NOTHING RETURNING {cityId}) SELECT {cityId}, TRUE FROM inserted UNION ALL SELECT {cityId}, FALSE FROM {schemeName}.{tableName} WHERE {parentId} = (%s) AND {cityName} = (%s)"
         ).format(
             schemeName=sql.Identifier(self._schemeName),
             tableName=sql.Identifier(self._tableName),
             fields=sql.SQL(",").join(
                 [sql.Identifier(CITIES_FK_REGION), sql.Identifier(CITIES_NAME)]
             ),
+            parentId=sql.Identifier(CITIES_FK_REGION),
+            cityName=sql.Identifier(CITIES_NAME),
+            cityId=sql.Identifier(CITIES_ID),
         )
 
-    async def add(self, aconn, regionId: int, cityName: str) -> None:
+    async def add(self, aconn, regionId: int, cityName: str) -> int:
         """
         Asynchronous Method to Insert a New City to the City Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param int regionId: Region ID at its Remote Table where the City is Located
         :param str cityName: City Name to Insert
-        :returns: None
-        :rtype: NoneType
+        :returns: City ID of the Inserted City, or of the One that was Already Inserted with the Same Name at the Given Region
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
         cityFields = [CITIES_FK_REGION, CITIES_NAME]
         cityValues = [regionId, cityName]
 
-        # Check if the City Name has already been Inserted for the Given Region
-        getMultTask = asyncio.create_task(
-            self.getMult(aconn, cityFields, cityValues, False)
+        # Get Query to Insert the New City
+        insertQuery = self.__insertQuery()
+
+        # Insert the City and Get its ID in a Single Round Trip
+        acursor = aconn.cursor()
+        await acursor.execute(
+            insertQuery,
+            [regionId, cityName, regionId, cityName],
+            prepare=PREPARE_QUERIES,
         )
-        await asyncio.gather(getMultTask)
-        city = getMultTask.result()
+        item = await acursor.fetchone()
 
-        if city != None:
+        # The City was Inserted by a Concurrent Transaction that wasn't Visible Yet
+        if item == None:
             uniqueInsertedMult(CITIES_TABLE_NAME, cityFields, cityValues)
-            return
+            return await self.findMultId(aconn, regionId, cityName)
 
-        # Ask for the City Fields
-        console.print("Adding New City...", style="caption")
+        cityId, inserted = item
 
-        # Get Query to Insert the New City
-        query = self.__insertQuery()
+        # Print a Success Message, or a Warning if It was Already Inserted
+        if inserted:
+            insertedRow(cityName, self._tableName)
+
+        else:
+            uniqueInsertedMult(CITIES_TABLE_NAME, cityFields, cityValues)
 
-        # Execute the Query and Print a Success Message
-        await asyncio.gather(aconn.cursor().execute(query, [regionId, cityName]))
-        insertedRow(cityName, self._tableName)
+        return cityId
+
+    async def addMany(self, aconn, cities: list[tuple[int, str]]) -> None:
+        """
+        Asynchronous Method to Insert Several Cities to the City Table in a Single Batch
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list cities: List of Tuples that Contain the Region ID where the City is Located and the City Name
+        :return: Nothing
+        :rtype: NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution
+        """
+
+        await BaseTable._addMany(
+            self, aconn.cursor(), [CITIES_FK_REGION, CITIES_NAME], cities
+        )
+
+    async def getIdsDict(self, aconn, cities: list[tuple[int, str]]) -> dict:
+        """
+        Asynchronous Method to Get the IDs of Several Cities by its Region ID and Name in a Single Query
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param list cities: List of Tuples that Contain the Region ID where the City is Located and the City Name
+        :return: Dictionary that Maps each Found (Region ID, City Name) Tuple to its City ID
+        :rtype: dict
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        # Nothing to Search for
+        if len(cities) == 0:
+            return {}
+
+        regionIds = list({regionId for regionId, _ in cities})
+        names = list({name for _, name in cities})
+
+        await BaseTable._getMult(
+            self,
+            aconn.cursor(),
+            [CITIES_FK_REGION, CITIES_NAME],
+            [regionIds, names],
+            columns=[CITIES_FK_REGION, CITIES_NAME, CITIES_ID],
+        )
+
+        return {(regionId, name): cityId for regionId, name, cityId in self._items}
 
     async def get(
         self, aconn, field: str, value, printItems: bool = True
@@ -674,24 +887,23 @@ class CitiesTable(BaseTable):
         :param str field: City Field that will be Used to Compare in the City Table
         :param value: Value to Compare
         :param bool printItems: Specifies whether to Print or not the Fetched Items. Default is ``True``
+        :param int limit: Maximum Number of Rows to Fetch. Default is ``None``
         :return: List of Fetched Cities Objects if there's at Least One Coincidence, ``None``
         :rtype: list if there's at Least One Coincidence. Otherwise, NoneType
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Cities
-        queryTask = asyncio.gather(
-            BaseTable._get(self, aconn.cursor(), field, value, CITIES_NAME)
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Cities
+        await BaseTable._get(
+            self, aconn.cursor(row_factory=City.rowFactory), field, value, CITIES_NAME
+        )
 
-        # Get the Cities Objects from the Fetched Cities
-        citiesList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Cities Objects
+        citiesList = self._items
 
         # Print Filtered Cities
         if printItems:
@@ -700,7 +912,12 @@ class CitiesTable(BaseTable):
         return None if len(citiesList) == 0 else citiesList
 
     async def getMult(
-        self, aconn, fields: list[str], values: list, printItems: bool = True
+        self,
+        aconn,
+        fields: list[str],
+        values: list,
+        printItems: bool = True,
+        limit: int = None,
     ) -> list[City] | None:
         """
         Asynchronous Method to Filter Cities from its Remote Table based on Some Given Field-Value Pair
@@ -714,19 +931,22 @@ class CitiesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch Filtered Cities
-        queryTask = asyncio.gather(
-            BaseTable._getMult(self, aconn.cursor(), fields, values, CITIES_NAME)
-        )
-
         # Clear Terminal
         if printItems:
             clear()
 
-        await queryTask
+        # Fetch Filtered Cities
+        await BaseTable._getMult(
+            self,
+            aconn.cursor(row_factory=City.rowFactory),
+            fields,
+            values,
+            CITIES_NAME,
+            limit=limit,
+        )
 
-        # Get the Cities Objects from the Fetched Cities
-        citiesList = self.__getFetchedObjects()
+        # The Cursor Row Factory Already Initialized the Cities Objects
+        citiesList = self._items
 
         # Print Filtered Cities
         if printItems:
@@ -746,13 +966,9 @@ class CitiesTable(BaseTable):
         """
 
         # Get City from its Remote Table
-        getTask = asyncio.create_task(
-            self.getMult(
-                aconn, [CITIES_FK_REGION, CITIES_NAME], [regionId, cityName], False
-            )
+        city = await self.getMult(
+            aconn, [CITIES_FK_REGION, CITIES_NAME], [regionId, cityName], False, 1
         )
-        await asyncio.gather(getTask)
-        city = getTask.result()
 
         # Get City Object from the Fetched Item
         if city == None:
@@ -760,6 +976,22 @@ class CitiesTable(BaseTable):
 
         return city[0]
 
+    async def findMultId(self, aconn, regionId: int, cityName: str) -> int | None:
+        """
+        Asynchronous Method to Find a City ID at its Remote Table based on its Name and the Region ID where it's Located, without Fetching the Rest of its Columns
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :param int regionId: Region ID where the City is Located
+        :param str cityName: City Name to Search for
+        :return: City ID if Found. Otherwise, ``None``
+        :rtype: int if Found. Otherwise, NoneType
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        return await BaseTable._getId(
+            self, aconn.cursor(), [CITIES_FK_REGION, CITIES_NAME], [regionId, cityName]
+        )
+
     async def find(self, aconn, cityId: int) -> City | None:
         """
         Asynchronous Method to Find a City at its Remote Table based on its ID
@@ -771,9 +1003,7 @@ class CitiesTable(BaseTable):
         """
 
         # Get City from its Remote Table
-        getTask = asyncio.create_task(self.get(aconn, self._tablePKName, cityId, False))
-        await asyncio.gather(getTask)
-        city = getTask.result()
+        city = await self.get(aconn, self._tablePKName, cityId, False)
 
         # Get City Object from the Fetched Item
         if city == None:
@@ -781,33 +1011,66 @@ class CitiesTable(BaseTable):
 
         return city[0]
 
-    async def all(self, aconn, orderBy: str, desc: bool) -> list[City] | None:
+    async def fetchAll(self, aconn) -> list[City]:
+        """
+        Asynchronous Method to Fetch All the Cities Stored at its Remote Table, Sorted by its Name, without Printing Them
+
+        :param aconn: Asynchronous Pool Connection with the Remote Database
+        :return: List of Fetched Cities Objects
+        :rtype: list
+        :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
+        """
+
+        await BaseTable._all(
+            self, aconn.cursor(row_factory=City.rowFactory), CITIES_NAME, False
+        )
+
+        return self._items
+
+    def printItems(self, citiesList: list[City]) -> None:
+        """
+        Method that Prints the Given Cities Objects, Previously Fetched from its Remote Table
+
+        :param list citiesList: Cities Objects to Print
+        :return: Nothing
+        :rtype: NoneType
+        """
+
+        # Clear Terminal
+        clear()
+
+        self.__print(citiesList)
+
+    async def all(self, aconn, orderBy: str, desc: bool) -> int:
         """
         Method that Prints All the Cities Stored at its Remote Table
 
         :param aconn: Asynchronous Pool Connection with the Remote Database
         :param str orderBy: City Field that will be Used to Sort the City Table
         :param bool desc: Specificies whether to Sort in Ascending Order (``False``) or in Descending Order (``True``)
-        :return: List of Fetched Cities Objects if the Table isn't Empty. Otherwise, ``None``
-        :rtype: list if the Table isn't Empty. Otherwise, NoneType
+        :return: Number of Printed Cities
+        :rtype: int
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        # Fetch All Cities
-        queryTask = asyncio.gather(BaseTable._all(self, aconn.cursor(), orderBy, desc))
-
         # Clear Terminal
         clear()
 
-        await queryTask
+        nRows = 0
 
-        # Get the Cities Objects from the Fetched Cities
-        citiesList = self.__getFetchedObjects()
+        # Fetch and Print All Cities, Page by Page
+        async for citiesList in BaseTable._iterAll(
+            self, aconn, orderBy, desc, rowFactory=City.rowFactory
+        ):
+            # Print the Current Page
+            self.__print(citiesList)
+            nRows += len(citiesList)
 
-        # Print All Cities
-        self.__print(citiesList)
+        # Print Empty Table
+        if nRows == 0:
+            self.__print([])
 
-        return None if len(citiesList) == 0 else citiesList
+        return nRows
 
     async def modify(self, aconn, cityId: int, field: str, value) -> None:
         """
@@ -822,9 +1085,7 @@ class CitiesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(
-            BaseTable._modify(self, aconn.cursor(), cityId, field, value)
-        )
+        await BaseTable._modify(self, aconn.cursor(), cityId, field, value)
 
     async def remove(self, aconn, cityId: int) -> None:
         """
@@ -837,4 +1098,4 @@ class CitiesTable(BaseTable):
         :raises Exception: Raised when Something Occurs at Query Execution or Items Fetching
         """
 
-        await asyncio.gather(BaseTable._remove(self, aconn.cursor(), cityId))
+        await BaseTable._remove(self, aconn.cursor(), cityId)
@@ -26,3 +26,18 @@ class BuildingNameAssigned(Exception):
         super().__init__(
             f"There's Already a Building Named as '{buildingName}' at City of ID '{cityId}'\n"
         )
+
+
+class PoolLoopError(Exception):
+    """
+    Exception Raised when the Connection Pool is Used from a Different Event Loop than the One where It was Opened
+    """
+
+    def __init__(self):
+        """
+        PoolLoopError Exception Constructor
+        """
+
+        super().__init__(
+            f"The Connection Pool was Opened at Another Event Loop. Close It there with closePool() before Using It from a New One\n"
+        )
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+from rich.prompt import Confirm, IntPrompt, Prompt
+
+
+async def offloadPrompt(func, *args, **kwargs):
+    """
+    Asynchronous Function to Run a Blocking Prompt Function in a Daemon Thread, so the Event Loop keeps Running while the User is Typing
+
+    A Daemon Thread is Used instead of the Default Executor, so a Prompt that's still Waiting for Input doesn't Keep the Program Alive when It Ends
+
+    :param func: Blocking Function that Reads from the Terminal
+    :param args: Positional Arguments Passed to ``func``
+    :param kwargs: Keyword Arguments Passed to ``func``
+    :return: Value Returned by ``func``
+    :raises Exception: Raised when ``func`` Raises an Exception
+    """
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def setResult(result) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    def setException(err: BaseException) -> None:
+        if not future.done():
+            future.set_exception(err)
+
+    def target() -> None:
+        try:
+            result = func(*args, **kwargs)
+
+        except BaseException as err:
+            loop.call_soon_threadsafe(setException, err)
+
+        else:
+            loop.call_soon_threadsafe(setResult, result)
+
+    threading.Thread(target=target, daemon=True, name="prompt").start()
+
+    return await future
+
+
+async def askPrompt(*args, **kwargs) -> str:
+    """
+    Asynchronous Function to Ask for a String without Blocking the Event Loop
+
+    :param args: Positional Arguments Passed to ``Prompt.ask``
+    :param kwargs: Keyword Arguments Passed to ``Prompt.ask``
+    :return: String Typed by the User
+    :rtype: str
+    """
+
+    return await offloadPrompt(Prompt.ask, *args, **kwargs)
+
+
+async def askIntPrompt(*args, **kwargs) -> int:
+    """
+    Asynchronous Function to Ask for an Integer without Blocking the Event Loop
+
+    :param args: Positional Arguments Passed to ``IntPrompt.ask``
+    :param kwargs: Keyword Arguments Passed to ``IntPrompt.ask``
+    :return: Integer Typed by the User
+    :rtype: int
+    """
+
+    return await offloadPrompt(IntPrompt.ask, *args, **kwargs)
+
+
+async def askConfirm(*args, **kwargs) -> bool:
+    """
+    Asynchronous Function to Ask for a Confirmation without Blocking the Event Loop
+
+    :param args: Positional Arguments Passed to ``Confirm.ask``
+    :param kwargs: Keyword Arguments Passed to ``Confirm.ask``
+    :return: ``True`` if the User Confirmed. Otherwise, ``False``
+    :rtype: bool
+    """
+
+    return await offloadPrompt(Confirm.ask, *args, **kwargs)
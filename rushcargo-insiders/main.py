@@ -1,5 +1,4 @@
 import argparse
-import asyncio
 import os
 import sys
 import textwrap
@@ -20,10 +19,11 @@ from lib.terminal.clear import clear
 
 
 # Initialize argParse Parser and Get Parser Arguments
-def getParserArguments() -> dict:
+def getParserArguments(cwd: str) -> dict:
     """
     Function to Initialize Argument Parser from ``argparse`` Standard Library and Get the User Commands
 
+    :param str cwd: Directory where the Program was Called from, to Resolve Relative File Paths
     :return: Dictionary that Contains All the Commands and its Arguments
     :rtype: dict
     """
@@ -45,6 +45,11 @@ def getParserArguments() -> dict:
     # Graph-related Actions Commands Parser
     graphParser = subparsers.add_parser(GRAPH, help="Graph-related Commands")
 
+    # Import-related Commands Parser
+    importParser = subparsers.add_parser(
+        IMPORT, help="Bulk Import from CSV or JSONL Files"
+    )
+
     # Database Action Argument
     dbParser.add_argument(
         DB_ACTION,
@@ -68,6 +73,14 @@ def getParserArguments() -> dict:
         GRAPH_LEVEL, help="Graph Level", choices=GRAPH_LEVEL_CMDS, type=str
     )
 
+    # Import Table Argument
+    importParser.add_argument(
+        IMPORT_TABLE, help="Import to Table", choices=IMPORT_TABLE_CMDS, type=str
+    )
+
+    # Import File Argument
+    importParser.add_argument(IMPORT_FILE, help="CSV or JSONL File Path", type=str)
+
     # Get Arguments
     args = parser.parse_args()
 
@@ -92,17 +105,25 @@ def getParserArguments() -> dict:
         argsDict[GRAPH_TYPE] = args.type
         argsDict[GRAPH_LEVEL] = args.level
 
+    # Get the Import-related Commands
+    elif argsDict[CMD_TYPE] == IMPORT:
+        # Get the Table and File Commands
+        argsDict[IMPORT_TABLE] = args.table
+        argsDict[IMPORT_FILE] = os.path.join(cwd, args.file)
+
     return argsDict
 
 
 if __name__ == "__main__":
+    # Directory where the Program was Called from
+    cwd = os.getcwd()
+
     # Change Directory to 'rushcargo-insiders/data'
     try:
         os.chdir(DATA_DIR)
 
     except FileNotFoundError:
         # Create 'rushcargo-insiders/data' Directory
-        cwd = os.getcwd()
         path = os.path.join(cwd, DATA_DIR)
         os.mkdir(path)
 
@@ -119,7 +140,7 @@ if __name__ == "__main__":
 
         # Get Arguments
         if len(sys.argv) > 1:
-            argsDict = getParserArguments()
+            argsDict = getParserArguments(cwd)
 
         else:
             # Clear Terminal
@@ -131,23 +152,25 @@ if __name__ == "__main__":
             if argsDict == None:
                 os._exit(0)
 
-        # Initialize Remote Database Asynchronous Connection Pool
+        # Initialize Remote Database Asynchronous Connection Pool. It's Opened Lazily, when the First Connection is Requested
         apool, user, _,ORSApiKey = initAsyncPool()
 
-        # Open Remote Database Connection Pool
-        asyncio.run(apool.openPool())
-
         # Initialize Event Handler
         e = EventHandler(apool, user, ORSApiKey)
 
         # Disable Loggers (there's a Logger inside the 'putconn' Method from the AsyncConnectionPool Class)
         logging.disable(logging.CRITICAL)
 
+        # Call Import Event Handler
+        if argsDict[CMD_TYPE] == IMPORT:
+            e.importHandler(argsDict)
+
         # Call Main Event Handler
-        e.handler(argsDict)
+        else:
+            e.handler(argsDict)
 
-        # Close Remote Database Asynchronous Connection Pool
-        # asyncio.run(apool.closePool())
+        # Close Remote Database Asynchronous Connection Pool and the Session Event Loop
+        e.close()
 
     # End Program
     except KeyboardInterrupt: